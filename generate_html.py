@@ -20,8 +20,8 @@ DEFAULT_SLIDES_TOML = Path("slides.toml")
 DEFAULT_SLIDES_FOLDER = Path("slides")
 
 
-def load_scene_order(slides_toml: Path = DEFAULT_SLIDES_TOML) -> list[str]:
-    """Return the ordered scene class names from ``slides.toml``."""
+def load_scene_entries(slides_toml: Path = DEFAULT_SLIDES_TOML) -> list[str]:
+    """Return the ordered ``slides.<module>.<Scene>`` entries from ``slides.toml``."""
     if not slides_toml.exists():
         raise FileNotFoundError(f"Missing slides configuration: {slides_toml}")
 
@@ -29,19 +29,19 @@ def load_scene_order(slides_toml: Path = DEFAULT_SLIDES_TOML) -> list[str]:
         with slides_toml.open("rb") as file:
             data = tomllib.load(file)
         slide_entries = data.get("slides", {}).get("slides", [])
-        return [
-            entry.rsplit(".", 1)[-1]
-            for entry in slide_entries
-            if isinstance(entry, str)
-        ]
+        return [entry for entry in slide_entries if isinstance(entry, str)]
 
     text = slides_toml.read_text(encoding="utf-8")
     match = re.search(r"(?s)\[slides\].*?slides\s*=\s*\[(.*?)\]", text)
     if not match:
         raise ValueError(f"Could not parse ordered slides from {slides_toml}")
 
-    entries = re.findall(r"\"([^\"]+)\"", match.group(1))
-    return [entry.rsplit(".", 1)[-1] for entry in entries]
+    return re.findall(r"\"([^\"]+)\"", match.group(1))
+
+
+def load_scene_order(slides_toml: Path = DEFAULT_SLIDES_TOML) -> list[str]:
+    """Return the ordered scene class names from ``slides.toml``."""
+    return [entry.rsplit(".", 1)[-1] for entry in load_scene_entries(slides_toml)]
 
 
 def get_missing_scene_exports(
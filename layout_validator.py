@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Validate slide layouts from mobject bounding boxes, without a browser.
+
+Each scene runs with animations skipped (see ``snapshot.run_slides``). At
+every ``next_slide()`` boundary the bounding boxes of the visible
+``Text``/``MarkupText``, ``Tex``/``MathTex`` and ``ImageMobject`` instances
+on screen are collected; a labelled element is never descended into, so
+the glyphs of one equation are not compared with each other. Overlaps are
+found with a sweep line over x (boxes sorted by their left edge, an active
+set ordered by right edge), so only boxes whose x extents intersect are
+compared, and boxes that leave the camera frame are flagged too.
+
+The report has the JSON structure documented for the
+``slide-layout-validator`` agent, one entry per slide:
+
+    {"slides": [{"slide_file": "15_gps.py", "scene": "GPSSlide", "slide": 3,
+                 "issues": [{"type": "overlap", "elements": [...], "severity": "high"}]}]}
+
+Example:
+    uv run python main.py layout --scene GPSSlide --output layout.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from snapshot import DEFAULT_RESOLUTION, deck_targets, load_scene_class, run_slides
+
+
+# Overlap (in both directions) and clipping below this many pixels of the
+# 1080p frame are ignored, as in the browser-based workflow.
+TOLERANCE_PX = 5.0
+REFERENCE_PIXEL_WIDTH = 1920
+# Overlap severity by intersection area over the smaller box.
+HIGH_OVERLAP = 0.5
+MEDIUM_OVERLAP = 0.1
+# Fraction of a box outside the frame above which clipping is "medium".
+MEDIUM_CLIPPING = 0.2
+LABEL_LENGTH = 50
+
+
+@dataclass(frozen=True)
+class Box:
+    """Axis-aligned bounding box of one labelled element, in scene units."""
+
+    label: str
+    left: float
+    bottom: float
+    right: float
+    top: float
+
+    @property
+    def area(self) -> float:
+        return (self.right - self.left) * (self.top - self.bottom)
+
+
+def overlapping_pairs(boxes: list[Box], tolerance: float = 0.0) -> list[tuple[Box, Box]]:
+    """Return the pairs whose intersection exceeds ``tolerance`` in both x and y (sweep line)."""
+    pairs = []
+    active: list[tuple[float, int, Box]] = []
+    for index, box in enumerate(sorted(boxes, key=lambda box: box.left)):
+        while active and active[0][0] <= box.left + tolerance:
+            heapq.heappop(active)
+        for _, _, other in active:
+            x_overlap = min(box.right, other.right) - box.left
+            y_overlap = min(box.top, other.top) - max(box.bottom, other.bottom)
+            if x_overlap > tolerance and y_overlap > tolerance:
+                pairs.append((other, box))
+        heapq.heappush(active, (box.right, index, box))
+    return pairs
+
+
+def intersection_area(a: Box, b: Box) -> float:
+    width = min(a.right, b.right) - max(a.left, b.left)
+    height = min(a.top, b.top) - max(a.bottom, b.bottom)
+    return max(width, 0.0) * max(height, 0.0)
+
+
+def outside_fraction(box: Box, half_width: float, half_height: float) -> float:
+    """Return the fraction of ``box`` outside the frame ``[-w/2, w/2] × [-h/2, h/2]``."""
+    inside = Box("frame", -half_width, -half_height, half_width, half_height)
+    return 1.0 - intersection_area(box, inside) / box.area
+
+
+def slide_issues(
+    boxes: list[Box],
+    frame_width: float,
+    frame_height: float,
+    tolerance: float = 0.0,
+) -> list[dict]:
+    """Return the overlap and out-of-viewport issues of one slide."""
+    issues = []
+    for a, b in overlapping_pairs(boxes, tolerance):
+        ratio = intersection_area(a, b) / max(min(a.area, b.area), 1e-12)
+        severity = "high" if ratio > HIGH_OVERLAP else "medium" if ratio > MEDIUM_OVERLAP else "low"
+        issues.append({"type": "overlap", "elements": [a.label, b.label], "severity": severity})
+
+    half_width, half_height = frame_width / 2 + tolerance, frame_height / 2 + tolerance
+    for box in boxes:
+        fraction = outside_fraction(box, half_width, half_height)
+        if fraction <= 1e-9:
+            continue
+        severity = "high" if fraction >= 1.0 - 1e-9 else "medium" if fraction > MEDIUM_CLIPPING else "low"
+        issues.append({"type": "out-of-viewport", "elements": [box.label], "severity": severity})
+    return issues
+
+
+def _label(mobject) -> str:
+    text = getattr(mobject, "text", None) or getattr(mobject, "tex_string", None) or type(mobject).__name__
+    text = " ".join(str(text).split())
+    return text if len(text) <= LABEL_LENGTH else text[: LABEL_LENGTH - 1] + "…"
+
+
+def _visible(mobject) -> bool:
+    from manim import ImageMobject
+
+    if isinstance(mobject, ImageMobject):
+        return True
+    return any(
+        part.get_fill_opacity() > 0 or part.get_stroke_opacity() > 0
+        for part in mobject.family_members_with_points()
+    )
+
+
+def collect_boxes(scene) -> list[Box]:
+    """Return the boxes of the visible labelled elements currently in ``scene``."""
+    from manim import ImageMobject, MarkupText, SingleStringMathTex, Text
+
+    labelled = (Text, MarkupText, SingleStringMathTex, ImageMobject)
+    boxes = []
+    stack = list(reversed(scene.mobjects))
+    while stack:
+        mobject = stack.pop()
+        if not isinstance(mobject, labelled):
+            stack.extend(reversed(mobject.submobjects))
+            continue
+        if not _visible(mobject):
+            continue
+        box = Box(
+            _label(mobject),
+            float(mobject.get_left()[0]),
+            float(mobject.get_bottom()[1]),
+            float(mobject.get_right()[0]),
+            float(mobject.get_top()[1]),
+        )
+        if box.area > 0:
+            boxes.append(box)
+    return boxes
+
+
+def validate_scene(scene_class: type, slide_file: str) -> list[dict]:
+    """Run ``scene_class`` and return one report entry per slide."""
+    from manim import config
+
+    entries = []
+
+    def check(scene) -> None:
+        tolerance = TOLERANCE_PX * config.frame_width / REFERENCE_PIXEL_WIDTH
+        entries.append(
+            {
+                "slide_file": slide_file,
+                "scene": scene_class.__name__,
+                "slide": len(entries),
+                "issues": slide_issues(collect_boxes(scene), config.frame_width, config.frame_height, tolerance),
+            }
+        )
+
+    run_slides(scene_class, check, DEFAULT_RESOLUTION, rasterize=False)
+    return entries
+
+
+def validate_deck(output: Path | None = None, scenes: list[str] | None = None) -> int:
+    """Validate the deck (or only ``scenes``) and write the JSON report to ``output`` or stdout."""
+    try:
+        targets = deck_targets(scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    report, failed = {"slides": []}, []
+    for module_path, class_name in targets:
+        try:
+            report["slides"].extend(validate_scene(load_scene_class(module_path, class_name), module_path.name))
+        except Exception as error:  # keep going so one broken scene does not hide the rest
+            print(f"{class_name}: failed ({type(error).__name__}: {error})", file=sys.stderr)
+            failed.append(class_name)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if output is None:
+        print(text)
+    else:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text + "\n", encoding="utf-8")
+        n_issues = sum(len(slide["issues"]) for slide in report["slides"])
+        print(f"{len(report['slides'])} slides, {n_issues} issues -> {output}")
+    return 1 if failed else 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for layout validation."""
+    parser = argparse.ArgumentParser(description="Check slide layouts from mobject bounding boxes.")
+    parser.add_argument("--output", "-o", help="Destination JSON file. Defaults to stdout.")
+    parser.add_argument("--scene", "-s", action="append", help="Scene class to validate (repeatable).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = parse_args()
+    return validate_deck(Path(args.output) if args.output else None, args.scene)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,12 +7,27 @@ import sys
 from pathlib import Path
 
 
-def render_slides(specific_slide: str = None):
+def render_slides(
+    specific_slide: str = None,
+    profile: bool = False,
+    workers: int = None,
+    memory_budget: str = None,
+    restart: bool = False,
+    pipeline: int = None,
+):
     """Render slides using manim-slides."""
     if specific_slide:
         cmd = ["manim-slides", "render", f"slides/{specific_slide}"]
     else:
-        cmd = ["manim-slides", "render", "slides.toml"]
+        from render_scheduler import parse_memory, render_deck
+        from timeline import profiled_render
+
+        return (profiled_render if profile else render_deck)(
+            workers=workers or 1,
+            memory_budget=parse_memory(memory_budget) if memory_budget else None,
+            resume=not restart,
+            pipeline=pipeline,
+        )
     return subprocess.run(cmd).returncode
 
 
@@ -35,6 +50,48 @@ def generate_html(output: str = None, render_first: bool = False):
     )
 
 
+def snapshot_slides(output: str = None, resolution: str = None, scenes: list = None):
+    """Rasterize the last frame of every slide with animations skipped."""
+    from snapshot import (
+        DEFAULT_RESOLUTION,
+        DEFAULT_SNAPSHOT_DIR,
+        parse_resolution,
+        snapshot_deck,
+    )
+
+    return snapshot_deck(
+        output_dir=Path(output) if output else DEFAULT_SNAPSHOT_DIR,
+        resolution=parse_resolution(resolution) if resolution else DEFAULT_RESOLUTION,
+        scenes=scenes,
+    )
+
+
+def validate_layout(output: str = None, scenes: list = None):
+    """Check every slide for overlapping or out-of-frame elements."""
+    from layout_validator import validate_deck
+
+    return validate_deck(Path(output) if output else None, scenes)
+
+
+def smoke_scenes(
+    scenes: list = None,
+    workers: int = None,
+    counts: bool = False,
+    retire: bool = False,
+):
+    """Run every scene's construct() without rendering to catch crashes."""
+    from scene_smoke import run
+
+    return run(scenes, workers, counts, retire)
+
+
+def estimate_timeline(output: str = None, scenes: list = None):
+    """Estimate talk duration per slide and render time without rendering."""
+    from timeline import DEFAULT_TIMELINE, run
+
+    return run(Path(output) if output else DEFAULT_TIMELINE, scenes)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Quadcopter Deep RL Presentation"
@@ -44,6 +101,33 @@ def main():
     # Render command
     render_parser = subparsers.add_parser("render", help="Render slides")
     render_parser.add_argument("--slide", "-s", help="Render specific slide file")
+    render_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record the render time of every scene to calibrate `timeline`",
+    )
+    render_parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        help="Render the deck scenes in parallel, longest first, on this many processes",
+    )
+    render_parser.add_argument(
+        "--memory-budget",
+        "-m",
+        help="Total RSS allowed for parallel renders, e.g. 6G (defaults to 80%% of RAM)",
+    )
+    render_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the render journal and render every scene again",
+    )
+    render_parser.add_argument(
+        "--pipeline",
+        type=int,
+        metavar="BUFFERS",
+        help="Queue frames for encoding through this many preallocated buffers (0: Manim baseline)",
+    )
 
     # Present command
     subparsers.add_parser("present", help="Launch interactive presentation")
@@ -64,14 +148,113 @@ def main():
         help="Render slides.toml before converting to HTML",
     )
 
+    # Snapshot command
+    snapshot_parser = subparsers.add_parser(
+        "snapshot",
+        help="Save the final frame of every slide as PNG, skipping animations",
+    )
+    snapshot_parser.add_argument(
+        "--output",
+        "-o",
+        help="Destination folder (defaults to snapshots/)",
+    )
+    snapshot_parser.add_argument(
+        "--resolution",
+        "-r",
+        help="Frame size as <width>x<height> (defaults to 960x540)",
+    )
+    snapshot_parser.add_argument(
+        "--scene",
+        "-s",
+        action="append",
+        help="Scene class to snapshot; repeat for several (defaults to the whole deck)",
+    )
+
+    # Layout command
+    layout_parser = subparsers.add_parser(
+        "layout",
+        help="Report overlapping or out-of-frame elements of every slide as JSON",
+    )
+    layout_parser.add_argument(
+        "--output",
+        "-o",
+        help="Destination JSON file (defaults to stdout)",
+    )
+    layout_parser.add_argument(
+        "--scene",
+        "-s",
+        action="append",
+        help="Scene class to validate; repeat for several (defaults to the whole deck)",
+    )
+
+    # Smoke command
+    smoke_parser = subparsers.add_parser(
+        "smoke",
+        help="Run every scene's construct() without rendering",
+    )
+    smoke_parser.add_argument(
+        "--scene",
+        "-s",
+        action="append",
+        help="Scene class to run; repeat for several (defaults to the whole deck)",
+    )
+    smoke_parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        help="Worker processes (defaults to the CPU count)",
+    )
+    smoke_parser.add_argument(
+        "--counts",
+        action="store_true",
+        help="List the live and hidden mobject counts at every slide",
+    )
+    smoke_parser.add_argument(
+        "--retire",
+        action="store_true",
+        help="Remove hidden (transparent or off-frame) mobjects at every slide",
+    )
+
+    # Timeline command
+    timeline_parser = subparsers.add_parser(
+        "timeline",
+        help="Estimate talk duration per slide and render time without rendering",
+    )
+    timeline_parser.add_argument(
+        "--output",
+        "-o",
+        help="Destination JSON timeline (defaults to presentation/timeline.json)",
+    )
+    timeline_parser.add_argument(
+        "--scene",
+        "-s",
+        action="append",
+        help="Scene class to time; repeat for several (defaults to the whole deck)",
+    )
+
     args = parser.parse_args()
 
     if args.command == "render":
-        return render_slides(args.slide)
+        return render_slides(
+            args.slide,
+            args.profile,
+            args.workers,
+            args.memory_budget,
+            args.restart,
+            args.pipeline,
+        )
     elif args.command == "present":
         return present_slides()
     elif args.command == "html":
         return generate_html(args.output, args.render_first)
+    elif args.command == "snapshot":
+        return snapshot_slides(args.output, args.resolution, args.scene)
+    elif args.command == "layout":
+        return validate_layout(args.output, args.scene)
+    elif args.command == "smoke":
+        return smoke_scenes(args.scene, args.workers, args.counts, args.retire)
+    elif args.command == "timeline":
+        return estimate_timeline(args.output, args.scene)
     else:
         parser.print_help()
         return 0
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Render scenes with a bounded pool of preallocated frame buffers.
+
+Manim 0.19's ``SceneFileWriter`` already encodes on its own thread: every
+partial movie file opens a ``writer_thread`` that takes ``(num_frames,
+frame)`` from an unbounded ``queue`` and encodes it with PyAV
+(``listen_and_write``). The Cairo renderer, meanwhile, copies every
+rasterized frame into a freshly allocated array (``get_frame``), so when
+encoding falls behind, the queue and the memory it holds grow without
+bound (8 MB per 1080p frame), and every frame pays for a new allocation.
+
+This entry point runs ``manim render`` with that same writer thread, but
+frames are copied into one of ``--buffers`` preallocated buffers that the
+writer thread hands back once encoded. The rasterizer waits when all of
+them are in flight, which bounds the queue, and no frame is allocated after
+the first ``--buffers``. Files, frame order and the encoder are unchanged.
+
+Each scene reports its frames/s, the share of the time spent encoding, and
+how long the rasterizer waited for a free buffer, on stderr and (with
+``--stats``) as JSON. ``--buffers 0`` renders exactly as Manim does (fresh
+arrays, unbounded queue), with the same report, as the baseline.
+
+It takes the arguments of ``manim-slides render`` (a Slide scene writes
+its slide config from within the Manim process, so the result is the same);
+``main.py render --pipeline`` uses it for every scene of the deck.
+
+Example:
+    uv run python pipelined_render.py --buffers 4 slides/13_ilqr.py ILQRSlide -r 1920,1080 --frame_rate 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import queue
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+DEFAULT_BUFFERS = 4
+# Poll interval while waiting for a buffer, so a writer-thread failure is noticed.
+POLL_SECONDS = 0.1
+
+
+class FramePool:
+    """Preallocated frame buffers recycled by the encoding thread, with timing stats.
+
+    ``acquire`` copies a frame into a free buffer (waiting for one when all
+    ``buffers`` are in flight) and ``release`` hands a buffer back once it is
+    encoded. ``encoded`` runs ``encode(frame, num_frames)``, times it and
+    releases the frame. With ``buffers == 0`` every frame is a fresh copy, as
+    in Manim.
+    """
+
+    def __init__(self, buffers: int):
+        self.buffers = buffers
+        self.frames = 0
+        self.encode_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.started: float | None = None
+        self.error: BaseException | None = None
+        self._pool: list[np.ndarray] = []
+        self._free: queue.Queue[np.ndarray] = queue.Queue()
+
+    def acquire(self, source: np.ndarray) -> np.ndarray:
+        """Return a copy of ``source`` in a pool buffer."""
+        if self.started is None:
+            self.started = time.perf_counter()
+        if self.error is not None:
+            raise RuntimeError("Frame encoding failed") from self.error
+        if self.buffers == 0:
+            return np.array(source)
+        try:
+            buffer = self._free.get_nowait()
+        except queue.Empty:
+            if len(self._pool) < self.buffers:
+                buffer = np.empty_like(source)
+                self._pool.append(buffer)
+            else:
+                start = time.perf_counter()
+                while True:
+                    try:
+                        buffer = self._free.get(timeout=POLL_SECONDS)
+                        break
+                    except queue.Empty:
+                        if self.error is not None:
+                            raise RuntimeError("Frame encoding failed") from self.error
+                self.wait_seconds += time.perf_counter() - start
+        np.copyto(buffer, source)
+        return buffer
+
+    def release(self, frame: np.ndarray) -> None:
+        """Return ``frame`` to the pool if it is one of its buffers."""
+        if any(frame is buffer for buffer in self._pool):
+            self._free.put(frame)
+
+    def encoded(self, encode, frame: np.ndarray, num_frames: int) -> None:
+        """Encode ``frame`` with ``encode``; record failures so ``acquire`` stops waiting."""
+        start = time.perf_counter()
+        try:
+            encode(frame, num_frames)
+        except BaseException as error:  # re-raised in the rendering thread
+            self.error = error
+            raise
+        finally:
+            self.release(frame)
+        self.encode_seconds += time.perf_counter() - start
+        self.frames += num_frames
+
+    def stats(self, scene: str) -> dict:
+        elapsed = time.perf_counter() - self.started if self.started is not None else 0.0
+        return {
+            "scene": scene,
+            "buffers": self.buffers,
+            "frames": self.frames,
+            "seconds": elapsed,
+            "fps": self.frames / elapsed if elapsed > 0 else 0.0,
+            "encode_share": self.encode_seconds / elapsed if elapsed > 0 else 0.0,
+            "wait_seconds": self.wait_seconds,
+        }
+
+
+def install(buffers: int = DEFAULT_BUFFERS, stats_path: Path | None = None) -> None:
+    """Make every scene created from now on render through a ``FramePool``."""
+    import manim.scene.scene
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+    from manim.utils.file_ops import write_to_movie
+
+    class PooledFileWriter(SceneFileWriter):
+        def __init__(self, renderer, scene_name, **kwargs):
+            self.pool = FramePool(buffers)
+            self.scene_name = scene_name
+            super().__init__(renderer, scene_name, **kwargs)
+
+        def listen_and_write(self):
+            # Manim's writer thread, timing each frame and recycling its buffer.
+            while True:
+                num_frames, frame_data = self.queue.get()
+                if frame_data is None:
+                    break
+                self.pool.encoded(self.encode_and_write_frame, frame_data, num_frames)
+
+        def finish(self):
+            super().finish()
+            report(self.pool.stats(self.scene_name), stats_path)
+
+    class PooledRenderer(CairoRenderer):
+        def __init__(self, *args, **kwargs):
+            kwargs.setdefault("file_writer_class", PooledFileWriter)
+            super().__init__(*args, **kwargs)
+
+        def render(self, scene, time, moving_mobjects=None):
+            if self.skip_animations or not write_to_movie():
+                # Nothing reaches the writer thread, so no buffer would come back.
+                return super().render(scene, time, moving_mobjects)
+            self.update_frame(scene, moving_mobjects)
+            # A pool buffer instead of the fresh copy ``get_frame`` allocates; ``get_frame``
+            # itself still copies, since the static image and frozen frames are kept.
+            self.add_frame(self.file_writer.pool.acquire(self.camera.pixel_array))
+
+    manim.scene.scene.CairoRenderer = PooledRenderer
+
+
+def report(stats: dict, path: Path | None = None) -> None:
+    """Print a scene's frame stats to stderr and write them to ``path`` as JSON."""
+    print(
+        f"{stats['scene']}: {stats['frames']} frames in {stats['seconds']:.1f} s "
+        f"({stats['fps']:.1f} frames/s, encoding {stats['encode_share']:.0%}, "
+        f"waited {stats['wait_seconds']:.1f} s for buffers)",
+        file=sys.stderr,
+    )
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(stats, indent=2) + "\n", encoding="utf-8")
+
+
+def parse_args() -> tuple[argparse.Namespace, list[str]]:
+    """Parse the pool options; the remaining arguments go to ``manim render``."""
+    parser = argparse.ArgumentParser(description="Render scenes with preallocated frame buffers.")
+    parser.add_argument("--buffers", type=int, default=DEFAULT_BUFFERS, help="Frame buffers; 0 renders as Manim does.")
+    parser.add_argument("--stats", help="Write the frames/s report of the scene to this JSON file.")
+    return parser.parse_known_args()
+
+
+def main() -> int:
+    """CLI entry point."""
+    args, manim_args = parse_args()
+    install(args.buffers, Path(args.stats) if args.stats else None)
+
+    from manim.__main__ import main as manim_main
+
+    return manim_main(["render", *manim_args], prog_name="manim", standalone_mode=False) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Journal of completed scene renders, so an interrupted deck render resumes.
+
+After a scene renders, its manim-slides config (``slides/<Scene>.json``) and
+every ``next_slide()`` segment file it lists are recorded with their SHA-256
+in ``.cache/render_journal.json``, together with a digest of the sources the
+scene is built from. A later render skips a scene only if the sources are
+unchanged and every recorded file still exists with the same checksum and
+is a structurally complete MP4.
+
+Before a scene that was not completed is rendered again, Manim's partial
+movie files (the per-animation cache that lets a re-run skip finished
+animations) are checked the same way and truncated ones are deleted, so a
+file half-written when the process died is re-rendered instead of trusted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+
+from generate_html import DEFAULT_SLIDES_FOLDER
+
+
+ROOT = Path(__file__).resolve().parent
+RENDER_JOURNAL = ROOT / ".cache" / "render_journal.json"
+MEDIA_DIR = ROOT / "media"
+# Scene sources besides the scene file itself.
+SHARED_SOURCES = ("slides/components", "slides/engines")
+CHUNK_SIZE = 1 << 20
+MOVIE_SUFFIXES = (".mp4", ".mov")
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    sha = hashlib.sha256()
+    with Path(path).open("rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def source_digest(module_path: Path, quality: str, root: Path = ROOT) -> str:
+    """Return a digest of the scene file, the shared slide packages and the render quality."""
+    sha = hashlib.sha256(quality.encode())
+    paths = [root / module_path]
+    for package in SHARED_SOURCES:
+        paths.extend(sorted((root / package).rglob("*.py")))
+    for path in paths:
+        sha.update(str(path.relative_to(root)).encode())
+        sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def mp4_complete(path: Path) -> bool:
+    """Return whether the top-level MP4 boxes of ``path`` tile the file exactly and include ``moov``.
+
+    A render that dies mid-write leaves a truncated ``mdat`` or no ``moov``
+    (which the muxer writes last).
+    """
+    size = Path(path).stat().st_size
+    offset, boxes = 0, set()
+    with Path(path).open("rb") as file:
+        while offset < size:
+            file.seek(offset)
+            header = file.read(8)
+            if len(header) < 8:
+                return False
+            box_size, box_type = struct.unpack(">I4s", header)
+            if box_size == 1:
+                large = file.read(8)
+                if len(large) < 8:
+                    return False
+                box_size = struct.unpack(">Q", large)[0]
+            elif box_size == 0:
+                box_size = size - offset
+            if box_size < 8 or offset + box_size > size:
+                return False
+            boxes.add(box_type)
+            offset += box_size
+    return b"moov" in boxes
+
+
+def _movie_ok(path: Path) -> bool:
+    return path.suffix.lower() not in MOVIE_SUFFIXES or mp4_complete(path)
+
+
+def scene_files(scene: str, slides_folder: Path = DEFAULT_SLIDES_FOLDER, root: Path = ROOT) -> list[Path]:
+    """Return the config of a rendered scene followed by the segment files it lists."""
+    config = root / slides_folder / f"{scene}.json"
+    data = json.loads(config.read_text(encoding="utf-8"))
+    files = [config]
+    for slide in data.get("slides", []):
+        for key in ("file", "rev_file"):
+            if slide.get(key):
+                path = Path(slide[key])
+                files.append(path if path.is_absolute() else root / path)
+    return list(dict.fromkeys(files))
+
+
+def read_journal(path: Path = RENDER_JOURNAL) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_journal(journal: dict[str, dict], path: Path = RENDER_JOURNAL) -> None:
+    """Write the journal atomically, so a crash never leaves it half-written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".tmp")
+    partial.write_text(json.dumps(journal, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(partial, path)
+
+
+def record_scene(
+    journal: dict[str, dict],
+    scene: str,
+    sources: str,
+    slides_folder: Path = DEFAULT_SLIDES_FOLDER,
+    root: Path = ROOT,
+) -> None:
+    """Record the checksums of a freshly rendered scene in ``journal``."""
+    journal[scene] = {
+        "sources": sources,
+        "files": {str(path.relative_to(root)): file_digest(path) for path in scene_files(scene, slides_folder, root)},
+    }
+
+
+def scene_completed(
+    journal: dict[str, dict],
+    scene: str,
+    sources: str,
+    slides_folder: Path = DEFAULT_SLIDES_FOLDER,
+    root: Path = ROOT,
+) -> bool:
+    """Return whether ``scene`` is journaled for ``sources`` and its files are intact."""
+    entry = journal.get(scene)
+    if not entry or entry["sources"] != sources:
+        return False
+    try:
+        listed = {str(path.relative_to(root)) for path in scene_files(scene, slides_folder, root)}
+    except (OSError, ValueError):
+        return False
+    if listed != set(entry["files"]):
+        return False
+    for name, digest in entry["files"].items():
+        path = root / name
+        if not path.exists() or not _movie_ok(path) or file_digest(path) != digest:
+            return False
+    return True
+
+
+def discard_partial_movies(scene: str, media_dir: Path = MEDIA_DIR) -> list[Path]:
+    """Delete truncated partial movie files of ``scene`` from Manim's cache; return them."""
+    removed = []
+    for path in media_dir.glob(f"videos/*/*/partial_movie_files/{scene}/*"):
+        if path.suffix.lower() in MOVIE_SUFFIXES and not mp4_complete(path):
+            path.unlink()
+            removed.append(path)
+    return removed
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Render the deck in parallel, longest scene first (LPT scheduling).
+
+Every scene of ``slides.toml`` is rendered by its own
+``manim-slides render <file> <Scene>`` process, at most ``workers`` at a
+time. The queue is ordered by the render durations stored from previous
+runs in ``.cache/render_stats.json``, longest first, so heavy scenes such
+as ``ILQRSlide`` never start last and leave the other workers idle.
+Before starting, the predicted makespan (the list schedule simulated on
+``workers`` machines) is printed; each scene reports as it finishes.
+
+Cairo frames and video encoding take a lot of memory per process, so the
+peak RSS of every scene is stored next to its duration (from ``wait4``).
+A job is admitted only while the predicted RSS of the running scenes plus
+its own fits in the memory budget (default: 80% of physical memory); the
+longest job that fits goes first, and a job is always admitted when
+nothing else runs. A scene killed by ``SIGKILL`` (the OOM killer) is
+queued again with a raised RSS estimate and the concurrency is halved.
+
+Scenes without stored stats are assumed to take the mean of the known ones.
+
+Completed scenes are journaled with checksums (see ``render_journal.py``):
+after a crash, a LaTeX error or Ctrl-C, the next run skips every scene
+whose sources and rendered files are unchanged and resumes with the rest.
+
+With ``pipeline`` set, scenes run through ``pipelined_render.py`` (frames
+queued to Manim's writer thread through ``pipeline`` preallocated buffers)
+and each finished scene reports its frames/s.
+
+Example:
+    uv run python main.py render --workers 4 --memory-budget 6G
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from render_journal import (
+    RENDER_JOURNAL,
+    discard_partial_movies,
+    read_journal,
+    record_scene,
+    scene_completed,
+    source_digest,
+    write_journal,
+)
+from snapshot import deck_targets
+from timeline import format_seconds, load_quality, parse_quality
+
+
+ROOT = Path(__file__).resolve().parent
+RENDER_STATS = ROOT / ".cache" / "render_stats.json"
+PIPELINE_STATS_DIR = ROOT / ".cache" / "pipeline"
+# Assumed cost when no scene has been measured yet; the order is then the deck order.
+DEFAULT_DURATION = 60.0
+DEFAULT_PEAK_RSS = 2 * 1024**3
+# Default budget as a share of physical memory, leaving room for the OS.
+MEMORY_FRACTION = 0.8
+# An OOM-killed scene is retried with its RSS estimate scaled by this factor.
+OOM_GROWTH = 1.5
+MAX_OOM_RETRIES = 3
+# ``ru_maxrss`` is in bytes on macOS and in KiB on Linux.
+RU_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+MEMORY_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def read_stats(path: Path = RENDER_STATS) -> dict[str, dict[str, float]]:
+    """Return the stored ``{"seconds", "peak_rss"}`` of every rendered scene."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_stats(stats: dict[str, dict[str, float]], path: Path = RENDER_STATS) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(dict(sorted(stats.items())), indent=2) + "\n", encoding="utf-8")
+
+
+def expected_values(
+    scenes: list[str],
+    stats: dict[str, dict[str, float]],
+    key: str,
+    default: float,
+) -> dict[str, float]:
+    """Return the stored ``key`` of ``scenes``; unknown ones get the mean of the known ones."""
+    known = [stats[name][key] for name in scenes if key in stats.get(name, {})]
+    fallback = sum(known) / len(known) if known else default
+    return {name: stats.get(name, {}).get(key, fallback) for name in scenes}
+
+
+def parse_memory(text: str) -> int:
+    """Parse a size such as ``"6G"``, ``"512M"`` or a byte count."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([KMG]?)I?B?", text.strip().upper())
+    if not match:
+        raise ValueError(f"Memory must look like 6G or 512M, got {text!r}")
+    return int(float(match.group(1)) * MEMORY_UNITS[match.group(2)])
+
+
+def default_memory_budget() -> int | None:
+    """Return ``MEMORY_FRACTION`` of the physical memory, or ``None`` if it is unknown."""
+    try:
+        return int(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") * MEMORY_FRACTION)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def lpt_order(durations: dict[str, float]) -> list[str]:
+    """Return the scenes longest first (ties keep their given order)."""
+    return sorted(durations, key=lambda name: -durations[name])
+
+
+def makespan(order: list[str], durations: dict[str, float], workers: int) -> float:
+    """Return the finish time of list-scheduling ``order`` onto ``workers`` identical workers."""
+    loads = [0.0] * max(1, workers)
+    for name in order:
+        heapq.heappush(loads, heapq.heappop(loads) + durations[name])
+    return max(loads)
+
+
+def next_admissible(
+    pending: list[str],
+    memory: dict[str, float],
+    in_use: float,
+    budget: float | None,
+) -> str | None:
+    """Return the first of ``pending`` whose predicted RSS fits next to ``in_use``.
+
+    With nothing running (``in_use == 0``) the first job is always admitted,
+    so a scene larger than the whole budget still renders, alone.
+    """
+    for name in pending:
+        if budget is None or in_use == 0 or in_use + memory[name] <= budget:
+            return name
+    return None
+
+
+def render_command(module_path: Path, class_name: str, quality: str, pipeline: int | None = None) -> list[str]:
+    """Return the render command of one scene at the deck quality.
+
+    ``manim-slides render``, or ``pipelined_render.py`` with ``pipeline`` frame buffers.
+    """
+    width, height, fps = parse_quality(quality)
+    if pipeline is None:
+        launcher = ["manim-slides", "render"]
+    else:
+        stats = PIPELINE_STATS_DIR / f"{class_name}.json"
+        launcher = [sys.executable, str(ROOT / "pipelined_render.py"), "--buffers", str(pipeline), "--stats", str(stats)]
+    return [
+        *launcher, str(module_path), class_name,
+        "--resolution", f"{width},{height}", "--frame_rate", str(fps),
+    ]  # fmt: skip
+
+
+def pipeline_fps(class_name: str) -> float | None:
+    """Return the frames/s that the last pipelined render of a scene reported."""
+    path = PIPELINE_STATS_DIR / f"{class_name}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))["fps"]
+
+
+def _wait_any(running: dict[int, subprocess.Popen]) -> tuple[int, int, int]:
+    """Reap one finished render; return its pid, exit code and peak RSS in bytes."""
+    while True:
+        pid, status, usage = os.wait4(-1, 0)
+        if pid in running:
+            return_code = os.waitstatus_to_exitcode(status)
+            running[pid].returncode = return_code
+            return pid, return_code, usage.ru_maxrss * RU_MAXRSS_UNIT
+
+
+def render_deck(
+    scenes: list[str] | None = None,
+    workers: int | None = None,
+    memory_budget: int | None = None,
+    resume: bool = True,
+    pipeline: int | None = None,
+    slides_toml: Path = ROOT / "slides.toml",
+    stats_path: Path = RENDER_STATS,
+    journal_path: Path = RENDER_JOURNAL,
+    on_rendered: Callable[[str, float], None] | None = None,
+) -> int:
+    """Render the deck scenes (or only ``scenes``) longest first, within ``memory_budget`` bytes.
+
+    With ``resume``, scenes the journal shows as completed and intact are skipped.
+    ``pipeline`` renders through ``pipelined_render.py`` with that many frame buffers.
+    ``on_rendered(scene, seconds)`` is called after every scene that rendered successfully.
+    """
+    try:
+        targets = {name: path for path, name in deck_targets(scenes, slides_toml)}
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    quality = load_quality(slides_toml)
+    sources = {name: source_digest(path, quality) for name, path in targets.items()}
+    journal = read_journal(journal_path)
+    completed = [name for name in targets if resume and scene_completed(journal, name, sources[name])]
+    if completed:
+        print(f"Resuming: {len(completed)} of {len(targets)} scenes already rendered and verified")
+    remaining = [name for name in targets if name not in completed]
+    if not remaining:
+        return 0
+
+    limit = max(1, min(len(remaining), workers or os.cpu_count() or 1))
+    budget = memory_budget or default_memory_budget()
+    stats = read_stats(stats_path)
+    durations = expected_values(remaining, stats, "seconds", DEFAULT_DURATION)
+    memory = expected_values(remaining, stats, "peak_rss", DEFAULT_PEAK_RSS)
+    pending = lpt_order(durations)
+    budget_text = f"{budget / 1024**3:.1f} GiB" if budget else "no memory budget"
+    print(
+        f"Rendering {len(pending)} scenes at {quality} on {limit} workers, {budget_text}; "
+        f"predicted makespan {format_seconds(makespan(pending, durations, limit))} "
+        f"(longest scene {format_seconds(durations[pending[0]])})"
+    )
+
+    start, done, failed = time.perf_counter(), len(completed), []
+    kills = dict.fromkeys(remaining, 0)
+    running: dict[int, subprocess.Popen] = {}
+    jobs: dict[int, tuple[str, float]] = {}
+    while pending or running:
+        in_use = sum(memory[name] for name, _ in jobs.values())
+        name = next_admissible(pending, memory, in_use, budget) if len(running) < limit else None
+        if name is not None:
+            pending.remove(name)
+            if journal.pop(name, None) is not None:
+                write_journal(journal, journal_path)
+            for path in discard_partial_movies(name):
+                print(f"{name}: discarded truncated {path.name}", flush=True)
+            (PIPELINE_STATS_DIR / f"{name}.json").unlink(missing_ok=True)
+            process = subprocess.Popen(
+                render_command(targets[name], name, quality, pipeline), cwd=ROOT, stdout=subprocess.DEVNULL
+            )
+            running[process.pid] = process
+            jobs[process.pid] = (name, time.perf_counter())
+            continue
+
+        pid, return_code, peak_rss = _wait_any(running)
+        del running[pid]
+        name, started = jobs.pop(pid)
+        seconds = time.perf_counter() - started
+        if return_code == -signal.SIGKILL and kills[name] < MAX_OOM_RETRIES:
+            kills[name] += 1
+            memory[name] = max(memory[name], peak_rss) * OOM_GROWTH
+            limit = max(1, (len(running) + 1) // 2)
+            pending.insert(0, name)
+            print(f"{name} was killed (out of memory?); retrying with at most {limit} workers", flush=True)
+            continue
+
+        done += 1
+        error = f"FAILED with exit code {return_code}" if return_code else ""
+        if not error:
+            try:
+                record_scene(journal, name, sources[name])
+            except (OSError, ValueError) as exception:
+                error = f"FAILED: rendered output unreadable ({exception})"
+        if error:
+            failed.append(name)
+            status = error
+        else:
+            write_journal(journal, journal_path)
+            stats[name] = {"seconds": seconds, "peak_rss": peak_rss}
+            write_stats(stats, stats_path)
+            if on_rendered is not None:
+                on_rendered(name, seconds)
+            status = (
+                f"{format_seconds(seconds)} (expected {format_seconds(durations[name])}), "
+                f"peak {peak_rss / 1024**2:.0f} MiB"
+            )
+            fps = pipeline_fps(name) if pipeline is not None else None
+            if fps is not None:
+                status += f", {fps:.1f} frames/s"
+        elapsed = format_seconds(time.perf_counter() - start)
+        print(f"[{done}/{len(targets)} {elapsed}] {name:<32} {status}", flush=True)
+    print(f"Deck rendered in {format_seconds(time.perf_counter() - start)}")
+    return 1 if failed else 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the parallel render."""
+    parser = argparse.ArgumentParser(description="Render the deck in parallel, longest scene first.")
+    parser.add_argument("--scene", "-s", action="append", help="Scene class to render (repeatable).")
+    parser.add_argument("--workers", "-j", type=int, help="Parallel renders (defaults to the CPU count).")
+    parser.add_argument(
+        "--memory-budget", "-m", type=parse_memory, help="Total RSS of parallel renders, e.g. 6G (default 80%% of RAM)."
+    )
+    parser.add_argument("--restart", action="store_true", help="Ignore the render journal and render every scene.")
+    parser.add_argument(
+        "--pipeline", type=int, metavar="BUFFERS", help="Queue frames for encoding through this many preallocated buffers."
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = parse_args()
+    return render_deck(args.scene, args.workers, args.memory_budget, resume=not args.restart, pipeline=args.pipeline)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
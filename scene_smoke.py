@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Construct-only smoke run of every scene in ``slides.toml``.
+
+Each scene is imported from its file (digit-prefixed modules such as
+``slides/13_ilqr.py`` included) and its ``construct()`` is executed with
+animations skipped, frame updates of the renderer replaced by no-ops and a
+tiny camera, so nothing is rasterized or encoded. Tex and Text come from the
+persistent media cache (``snapshot.TEX_DIR``). Scenes are spread over a
+process pool; each reports how many ``next_slide()`` boundaries it reached
+and its peak mobject count (all family members on screen at a boundary).
+
+With ``--counts`` the live mobject count at every boundary is listed too,
+with how many of those are hidden (transparent or off-frame, see
+``slides.components.retire``): a count that keeps growing over the slides
+points to mobjects that should have been removed. ``--retire`` removes the
+hidden ones at each boundary, as the ``RetireHidden`` mixin does, to show
+the count the scene would keep with it.
+
+Example:
+    uv run python main.py smoke --scene GPSSlide --counts
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from snapshot import deck_targets, load_scene_class, run_slides
+
+
+ROOT = Path(__file__).resolve().parent
+# The camera still allocates a pixel array; keep it negligible.
+SMOKE_RESOLUTION = (16, 9)
+
+
+@dataclass(frozen=True)
+class SmokeReport:
+    """Outcome of one construct-only run; ``error`` is empty on success.
+
+    ``counts`` and ``hidden`` hold the live and hidden mobject counts at each boundary.
+    """
+
+    scene: str
+    slides: int = 0
+    mobjects: int = 0
+    seconds: float = 0.0
+    error: str = ""
+    counts: tuple[int, ...] = ()
+    hidden: tuple[int, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+def smoke_scene(module_path: str | Path, class_name: str, retire: bool = False) -> SmokeReport:
+    """Run ``construct()`` of one scene without rendering and report what it built.
+
+    With ``retire``, hidden mobjects are removed at every boundary after being counted.
+    """
+    from slides.components.retire import family_size, hidden_mobjects
+
+    start = time.perf_counter()
+    counts: list[int] = []
+    hidden_counts: list[int] = []
+
+    def count(scene) -> None:
+        hidden = hidden_mobjects(scene)
+        counts.append(family_size(scene.mobjects))
+        hidden_counts.append(family_size(hidden))
+        if retire and hidden:
+            scene.remove(*hidden)
+
+    error = ""
+    try:
+        run_slides(load_scene_class(Path(module_path), class_name), count, SMOKE_RESOLUTION, rasterize=False)
+    except Exception as exception:  # reported, so one broken scene does not hide the rest
+        error = f"{type(exception).__name__}: {exception}"
+    return SmokeReport(
+        class_name,
+        slides=len(counts),
+        mobjects=max(counts, default=0),
+        seconds=time.perf_counter() - start,
+        error=error,
+        counts=tuple(counts),
+        hidden=tuple(hidden_counts),
+    )
+
+
+def smoke_deck(
+    scenes: list[str] | None = None,
+    workers: int | None = None,
+    retire: bool = False,
+) -> list[SmokeReport]:
+    """Smoke-run the deck scenes (or only ``scenes``) over a process pool, in deck order."""
+    targets = [(str(ROOT / path), name) for path, name in deck_targets(scenes, ROOT / "slides.toml")]
+    n_workers = max(1, min(len(targets), workers or os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        return list(pool.map(smoke_scene, *zip(*targets), [retire] * len(targets)))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the smoke run."""
+    parser = argparse.ArgumentParser(description="Run every scene's construct() without rendering.")
+    parser.add_argument("--scene", "-s", action="append", help="Scene class to run (repeatable).")
+    parser.add_argument("--workers", "-j", type=int, help="Worker processes (defaults to the CPU count).")
+    parser.add_argument("--counts", action="store_true", help="List the mobject count at every slide.")
+    parser.add_argument("--retire", action="store_true", help="Remove hidden mobjects at every slide.")
+    return parser.parse_args()
+
+
+def run(
+    scenes: list[str] | None = None,
+    workers: int | None = None,
+    counts: bool = False,
+    retire: bool = False,
+) -> int:
+    """Print one line per scene (and per slide with ``counts``); return 1 if any scene crashed."""
+    try:
+        reports = smoke_deck(scenes, workers, retire)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    for report in reports:
+        status = "ok" if report.ok else f"FAILED {report.error}"
+        print(f"{report.scene:<32} {report.slides:>3} slides {report.mobjects:>6} mobjects {report.seconds:6.2f} s  {status}")
+        if counts:
+            for index, (live, hidden) in enumerate(zip(report.counts, report.hidden)):
+                print(f"    slide {index:>3}: {live:>6} mobjects, {hidden:>6} hidden")
+    return 0 if all(report.ok for report in reports) else 1
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = parse_args()
+    return run(args.scene, args.workers, args.counts, args.retire)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
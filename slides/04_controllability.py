@@ -11,9 +11,13 @@ Author: Sergio Fernández
 Date: 2025-01-30
 """
 
+import numpy as np
 from manim import *
 from manim_slides import Slide
 
+from engines.control import controllability
+from engines.quadcopter import subsystem
+
 
 class ControllabilitySlide(Slide):
     def construct(self):
@@ -157,3 +161,73 @@ class ControllabilitySlide(Slide):
         self.play(FadeIn(kalman_label), FadeIn(kalman_box), FadeIn(kalman_content))
         self.wait(0.5)
         self.next_slide()
+
+        self.play(
+            FadeOut(matrix_label), FadeOut(matrix_box), FadeOut(matrix_group),
+            FadeOut(kalman_label), FadeOut(kalman_box), FadeOut(kalman_content),
+        )
+        self.wait(0.3)
+
+        # ── FRAME 3 — Ejemplo numérico: subsistema del cuadricóptero ─────────
+        A_sub, B_sub = subsystem()
+        report = controllability(A_sub, B_sub)
+        n_y = report.n_states
+
+        example_label = Text(
+            "Ejemplo: subsistema del cuadricóptero", font_size=30, color=BLUE
+        )
+        example_label.to_edge(LEFT, buff=0.8)
+        example_label.shift(UP * 2.0)
+
+        rank_result = MathTex(
+            r"\operatorname{rango}\!\left(R(\tilde{\mathbf{A}}, \tilde{\mathbf{B}})\right)"
+            rf" = {report.rank} = n_y",
+            font_size=30,
+        )
+        rank_result.next_to(example_label, DOWN, buff=0.35, aligned_edge=LEFT)
+
+        sv_axes = Axes(
+            x_range=[0, n_y + 1, 1],
+            y_range=[-3, 1, 1],
+            x_length=7.0,
+            y_length=3.0,
+            axis_config={"include_tip": False, "font_size": 20},
+            x_axis_config={"numbers_to_include": list(range(1, n_y + 1))},
+            y_axis_config={"numbers_to_include": [-3, -2, -1, 0, 1]},
+        )
+        sv_axes.next_to(rank_result, DOWN, buff=0.5, aligned_edge=LEFT)
+        sv_y_label = MathTex(r"\log_{10}\sigma_i", font_size=24, color=GRAY_A)
+        sv_y_label.next_to(sv_axes.y_axis, UP, buff=0.15)
+        sv_x_label = MathTex("i", font_size=24, color=GRAY_A)
+        sv_x_label.next_to(sv_axes.x_axis, RIGHT, buff=0.15)
+
+        log_sv = np.log10(report.singular_values)
+        sv_stems = VGroup(
+            *[
+                Line(
+                    sv_axes.c2p(i + 1, -3),
+                    sv_axes.c2p(i + 1, value),
+                    color=YELLOW,
+                    stroke_width=4,
+                )
+                for i, value in enumerate(log_sv)
+            ]
+        )
+        sv_dots = VGroup(
+            *[
+                Dot(sv_axes.c2p(i + 1, value), radius=0.06, color=YELLOW)
+                for i, value in enumerate(log_sv)
+            ]
+        )
+        sv_note = Text(
+            "Valores singulares de R: todos positivos, el par es controlable.",
+            font_size=20,
+            color=GRAY_A,
+        )
+        sv_note.next_to(sv_axes, DOWN, buff=0.35, aligned_edge=LEFT)
+
+        self.play(FadeIn(example_label), FadeIn(rank_result))
+        self.play(Create(sv_axes), FadeIn(sv_y_label), FadeIn(sv_x_label))
+        self.play(Create(sv_stems), FadeIn(sv_dots), FadeIn(sv_note))
+        self.wait(0.5)
+        self.next_slide()
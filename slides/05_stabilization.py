@@ -2,15 +2,28 @@
 Stability concepts and feedback stabilization for linear control systems.
 
 Covers intuitive and formal notions of stability (Lyapunov, asymptotic,
-exponential), the feedback stabilization problem, and the pole assignment theorem.
+exponential), the feedback stabilization problem, the pole assignment theorem,
+and phase portraits of the open- and closed-loop (z, w) and (φ, p) planes.
 
 Example:
     manim -pql slides/05_stabilization.py StabilizationSlide
 """
 
+import numpy as np
 from manim import *
 from manim_slides import Slide
 
+from components.phase import PhasePlot
+from engines.control import lqr_design
+from engines.phase import PHASE_PLANES, phase_portrait
+from engines.quadcopter import SUBSYSTEM_LABELS, subsystem
+
+# LQR weights for the controllable subsystem y = (φ, θ, ψ, z, p, q, r, w).
+LQR_Q = np.eye(len(SUBSYSTEM_LABELS))
+LQR_R = 1e-4 * np.eye(4)
+N_INITIAL_CONDITIONS = 24
+PHASE_TEX = {"z": "z", "w": "w", "varphi": r"\varphi", "p": "p"}
+
 
 class StabilizationSlide(Slide):
     """Stability and feedback stabilization for linear control systems."""
@@ -214,3 +227,145 @@ class StabilizationSlide(Slide):
         self.play(FadeIn(theorem_eq))
         self.wait(0.5)
         self.next_slide()
+
+        self.play(
+            FadeOut(poles_label), FadeOut(poles_box),
+            FadeOut(poles_lines), FadeOut(theorem_eq),
+        )
+        self.wait(0.3)
+
+        # ── Block 5: Ejemplo LQR sobre el subsistema del cuadricóptero ───────
+        lqr_label = Text("Ejemplo: LQR en el cuadricóptero", font_size=28, color=BLUE)
+        lqr_label.next_to(title, DOWN, buff=0.4)
+
+        riccati_eq = MathTex(
+            r"\tilde{\mathbf{A}}^{\top}\mathbf{X}+\mathbf{X}\tilde{\mathbf{A}}"
+            r"-\mathbf{X}\tilde{\mathbf{B}}\mathbf{R}^{-1}\tilde{\mathbf{B}}^{\top}\mathbf{X}"
+            r"+\mathbf{Q}=\mathbf{0},\qquad"
+            r"\mathbf{u}=-\mathbf{R}^{-1}\tilde{\mathbf{B}}^{\top}\mathbf{X}\,\mathbf{y}",
+            font_size=26,
+        )
+        if riccati_eq.width > config.frame_width - 1.6:
+            riccati_eq.scale_to_fit_width(config.frame_width - 1.6)
+        riccati_eq.next_to(lqr_label, DOWN, buff=0.3)
+
+        A_sub, B_sub = subsystem()
+        rng = np.random.default_rng(0)
+        x0s = np.zeros((N_INITIAL_CONDITIONS, len(SUBSYSTEM_LABELS)))
+        x0s[:, :3] = rng.uniform(-np.pi / 8, np.pi / 8, size=(N_INITIAL_CONDITIONS, 3))
+        x0s[:, 3] = rng.uniform(-2.0, 2.0, size=N_INITIAL_CONDITIONS)
+        design = lqr_design(A_sub, B_sub, LQR_Q, LQR_R, x0s, dt=0.04, steps=375)
+
+        def trajectory_axes(y_range, tex_label):
+            axes = Axes(
+                x_range=[0, design.times[-1], 5],
+                y_range=y_range,
+                x_length=5.2,
+                y_length=2.8,
+                axis_config={"include_tip": False, "font_size": 18},
+                x_axis_config={"numbers_to_include": [0, 5, 10, 15]},
+            )
+            y_label = MathTex(tex_label, font_size=24, color=GRAY_A)
+            y_label.next_to(axes.y_axis, UP, buff=0.1)
+            t_label = MathTex("t", font_size=24, color=GRAY_A)
+            t_label.next_to(axes.x_axis, RIGHT, buff=0.1)
+            return VGroup(axes, y_label, t_label)
+
+        def trajectory_curves(axes, state_label):
+            column = SUBSYSTEM_LABELS.index(state_label)
+            curves = VGroup(
+                *[
+                    VMobject(stroke_width=1.5, stroke_opacity=0.8).set_points_as_corners(
+                        axes.c2p(design.times, trajectory[:, column])
+                    )
+                    for trajectory in design.states
+                ]
+            )
+            curves.set_color_by_gradient(BLUE_B, YELLOW)
+            return curves
+
+        z_plot = trajectory_axes([-2, 2, 1], "z(t)")
+        phi_plot = trajectory_axes([-0.4, 0.4, 0.2], r"\varphi(t)")
+        plots = VGroup(z_plot, phi_plot).arrange(RIGHT, buff=1.0)
+        plots.next_to(riccati_eq, DOWN, buff=0.45)
+        z_curves = trajectory_curves(z_plot[0], "z")
+        phi_curves = trajectory_curves(phi_plot[0], "varphi")
+
+        poles_note = MathTex(
+            r"\max_i \mathrm{Re}(\lambda_i)"
+            rf" = {design.poles.real.max():.2f} < 0",
+            font_size=24,
+            color=YELLOW,
+        )
+        poles_note.next_to(plots, DOWN, buff=0.3)
+
+        self.play(FadeIn(lqr_label), FadeIn(riccati_eq))
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(Create(z_plot), Create(phi_plot))
+        self.play(Create(z_curves), Create(phi_curves), run_time=2)
+        self.play(FadeIn(poles_note))
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(
+            FadeOut(lqr_label), FadeOut(riccati_eq),
+            FadeOut(z_plot), FadeOut(phi_plot),
+            FadeOut(z_curves), FadeOut(phi_curves), FadeOut(poles_note),
+        )
+        self.wait(0.3)
+
+        # ── Block 6: Retratos de fase ────────────────────────────────────────
+        phase_label = Text("Retratos de fase: lazo abierto y cerrado", font_size=28, color=BLUE)
+        phase_label.next_to(title, DOWN, buff=0.4)
+
+        plots, open_fields, closed_fields, streams, poles_tex = VGroup(), VGroup(), VGroup(), VGroup(), VGroup()
+        axis_labels = VGroup()
+        for plane, ((a_label, _), (b_label, _)) in PHASE_PLANES.items():
+            open_loop = phase_portrait(plane)
+            closed_loop = phase_portrait(plane, design.K)
+            plot = PhasePlot(*closed_loop.ranges, x_length=4.6, y_length=3.2)
+            open_fields.add(plot.add_field(open_loop.x_values, open_loop.y_values, open_loop.vectors))
+            closed_fields.add(plot.add_field(closed_loop.x_values, closed_loop.y_values, closed_loop.vectors))
+            streams.add(plot.add_streamlines(closed_loop.lines))
+            labels = VGroup(
+                MathTex(PHASE_TEX[a_label], font_size=24, color=GRAY_A).next_to(plot.axes.x_axis, RIGHT, buff=0.1),
+                MathTex(PHASE_TEX[b_label], font_size=24, color=GRAY_A).next_to(plot.axes.y_axis, UP, buff=0.1),
+            )
+            poles = MathTex(
+                r"\lambda = " + r",\ ".join(f"{value.real:.2f}{value.imag:+.2f}i" for value in closed_loop.eigenvalues),
+                font_size=20,
+                color=YELLOW,
+            ).next_to(plot, DOWN, buff=0.25)
+            plot.add(labels, poles)
+            axis_labels.add(labels)
+            poles_tex.add(poles)
+            plots.add(plot)
+
+        plots.arrange(RIGHT, buff=1.0).next_to(phase_label, DOWN, buff=0.5)
+        open_note = MathTex(r"\mathbf{K}=\mathbf{0}:\ \dot{\mathbf{y}}=\tilde{\mathbf{A}}\mathbf{y}", font_size=24)
+        open_note.move_to(poles_tex)
+
+        self.play(
+            FadeIn(phase_label),
+            *[FadeIn(plot.axes) for plot in plots],
+            FadeIn(axis_labels),
+            FadeIn(open_fields),
+            FadeIn(open_note),
+        )
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(
+            ReplacementTransform(open_fields, closed_fields),
+            FadeOut(open_note),
+            FadeIn(poles_tex),
+        )
+        self.play(Create(streams, lag_ratio=0), run_time=2.5)
+        self.play(
+            *[ShowPassingFlash(line.copy().set_color(WHITE), time_width=0.3) for stream in streams for line in stream],
+            run_time=2,
+        )
+        self.wait(0.5)
+        self.next_slide()
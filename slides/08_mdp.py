@@ -7,6 +7,7 @@ Narrative flow:
     2. MDP derivation: full history → Markov property (centered) →
        compact notation → trajectory.
     3. Robot de reciclaje: problem setup → graph built in layers → traversals.
+    4. Iteración de valor: state nodes colored by V_k, greedy actions marked.
 
 Example
 -------
@@ -19,6 +20,17 @@ from pathlib import Path
 from manim import *
 from manim_slides import Slide
 
+from components.numeric_cell import NumericCell
+from engines.mdp import (
+    ROBOT_ALPHA,
+    ROBOT_BETA,
+    ROBOT_GAMMA,
+    ROBOT_R_SEARCH,
+    ROBOT_R_WAIT,
+    recycling_robot,
+    recycling_robot_solution,
+)
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
@@ -34,6 +46,11 @@ PROB_COLOR = LIGHT_GREY
 REWARD_POS_COLOR = GREEN
 REWARD_NEG_COLOR = RED
 SUBDUED_OPACITY = 0.2
+VALUE_LOW_COLOR = BLUE_E
+VALUE_HIGH_COLOR = GREEN_C
+
+# Value-iteration sweeps shown on the graph (the last one is the fixed point)
+SHOWN_ITERATIONS = (1, 2, 3, 5, 10, 25)
 
 
 def _invert_image(path: Path) -> ImageMobject:
@@ -67,6 +84,7 @@ class MdpSlide(Slide):
     - Aprendizaje por Refuerzo (RL): brief intro with inverted framework-RL.jpeg.
     - Proceso de Decisión de Márkov (MDP): sequential derivation of dynamics.
     - Robot de reciclaje: concrete example with animated graph traversals.
+    - Iteración de valor: V_k and the greedy policy animated on the graph.
 
     Example
     -------
@@ -588,6 +606,91 @@ class MdpSlide(Slide):
         self.wait(0.5)
         self.next_slide()
 
-        # End: restore and hold
         self.play(*_restore(), FadeOut(dot), run_time=0.4)
+        self.wait(0.3)
+
+        # ===================================================================
+        # VALUE ITERATION — nodes colored by V_k, greedy actions marked
+        # ===================================================================
+        robot = recycling_robot()
+        solution = recycling_robot_solution()
+        v_max = solution.V.max()
+
+        # (state, action) -> action node, following recycling_robot() indices
+        action_node = {
+            (0, 0): search_bottom_group, (0, 1): wait_top_group,
+            (1, 0): search_top_group, (1, 1): wait_bottom_group,
+            (1, 2): recharge_group,
+        }
+
+        vi_label = Text("Iteración de valor", font_size=24, color=BLUE)
+        vi_params = MathTex(
+            rf"\alpha={ROBOT_ALPHA},\ \beta={ROBOT_BETA},\ "
+            rf"r_{{\text{{search}}}}={ROBOT_R_SEARCH:g},\ r_{{\text{{wait}}}}={ROBOT_R_WAIT:g},\ "
+            rf"\gamma={ROBOT_GAMMA}",
+            font_size=22,
+            color=GRAY_B,
+        )
+        vi_update = MathTex(
+            r"V_{k+1}(x)=\max_{u}\Big[r(x,u)+\gamma\sum_{x'}p(x'|x,u)V_k(x')\Big]",
+            font_size=22,
+        )
+
+        iter_cell = NumericCell(0, fmt="{:.0f}", slots=3, font_size=22, color=YELLOW)
+        value_cells = [NumericCell(0.0, fmt="{:.2f}", slots=5, font_size=22) for _ in robot.states]
+        vi_rows = VGroup(
+            VGroup(MathTex("k =", font_size=24), iter_cell).arrange(RIGHT, buff=0.15),
+            *[
+                VGroup(MathTex(rf"V_k(\text{{{name}}}) =", font_size=24), cell).arrange(RIGHT, buff=0.15)
+                for name, cell in zip(robot.states, value_cells)
+            ],
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+        vi_panel = VGroup(vi_label, vi_params, vi_update, vi_rows).arrange(
+            DOWN, aligned_edge=LEFT, buff=0.25
+        )
+        vi_panel.scale_to_fit_width(min(vi_panel.width, 4.6))
+        vi_panel.move_to(LEFT * 4.6 + DOWN * 0.2)
+
+        legend = VGroup(estados_label, acciones_label, prob_legend, rewards_legend)
+        self.play(FadeOut(legend), FadeIn(vi_panel))
+        self.wait(0.5)
+        self.next_slide()
+
+        def value_color(value):
+            return interpolate_color(VALUE_LOW_COLOR, VALUE_HIGH_COLOR, float(value / v_max))
+
+        policy_marks = VGroup()
+        shown = [k for k in SHOWN_ITERATIONS if k < solution.iterations] + [solution.iterations]
+        for k in shown:
+            values = solution.V_history[k]
+            policy = solution.policy_history[k - 1]
+            new_marks = VGroup(
+                *[
+                    SurroundingRectangle(action_node[(x, int(u))][0], buff=0.08, color=YELLOW)
+                    for x, u in enumerate(policy)
+                ]
+            )
+            self.play(
+                high.animate.set_fill(value_color(values[0]), opacity=0.6),
+                low.animate.set_fill(value_color(values[1]), opacity=0.6),
+                iter_cell.transform_to(k),
+                *[cell.transform_to(v) for cell, v in zip(value_cells, values)],
+                Transform(policy_marks, new_marks),
+                run_time=0.6,
+            )
+            self.wait(0.3)
+        self.next_slide()
+
+        greedy_note = MathTex(
+            r"\mu_*(\text{high})=\text{" + robot.actions[solution.policy[0]] + r"},\quad "
+            r"\mu_*(\text{low})=\text{" + robot.actions[solution.policy[1]] + "}",
+            font_size=24,
+            color=YELLOW,
+        )
+        greedy_note.next_to(vi_panel, DOWN, buff=0.35, aligned_edge=LEFT)
+        self.play(FadeIn(greedy_note))
+        self.wait(0.5)
+        self.next_slide()
+
+        # End: hold
         self.wait(1)
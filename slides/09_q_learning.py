@@ -6,9 +6,19 @@ Example:
     uv run manim-slides render slides/09_q_learning.py QLearningSlide
 """
 
+import numpy as np
 from manim import *
 from manim_slides import Slide
 
+from components.numeric_cell import NumericCell
+from engines.tictactoe import LINES, evaluate, find_episode, train
+from engines.tictactoe import q_values as q_values_for
+
+ALPHA = 0.3
+GAMMA = 0.9
+EARLY_EPISODES = 300
+TRAINED_EPISODES = 100_000
+
 
 class QLearningSlide(Slide):
     def construct(self):
@@ -552,7 +562,7 @@ class QLearningSlide(Slide):
                      (2, 0), (2, 1), (2, 2)]
         for pos in positions:
             lbl = Text(f"({pos[0]},{pos[1]})", font_size=16, color=WHITE)
-            val = Text("0.00", font_size=16, color=WHITE)
+            val = NumericCell(0.0, font_size=16, color=WHITE)
             row_g = VGroup(lbl, val).arrange(RIGHT, buff=1.0)
             q_rows.add(row_g)
             q_labels.append(lbl)
@@ -583,163 +593,141 @@ class QLearningSlide(Slide):
         self.wait(0.5)
         self.next_slide()
 
-        # --- Simulate a game with Q-table updates ---
-        # Move sequence: X plays, O plays, X plays, X wins
-        marks = []
-        alpha = 0.3
-        gamma_val = 0.9
-
-        # Helper to update a Q-value text
-        def make_new_val(idx, new_val_num, color=WHITE):
-            new_t = Text(f"{new_val_num:.2f}", font_size=16, color=color)
-            new_t.move_to(q_values[idx])
-            return new_t
-
-        # --- Move 1: X plays (1,1) center ---
-        move1_label = Text("Turno 1: X juega (1,1)", font_size=20, color=GREEN)
-        move1_label.next_to(board_cells, UP, buff=0.4)
-
-        x_mark_1 = Text("X", font_size=28, color=GREEN, weight=BOLD)
-        x_mark_1.move_to(cell_map[(1, 1)])
-        marks.append(x_mark_1)
-
-        highlight_1 = SurroundingRectangle(cell_map[(1, 1)], buff=0.05, color=YELLOW)
-
-        self.play(FadeIn(move1_label), Create(highlight_1))
-        self.play(FadeIn(x_mark_1))
-
-        # Update Q(x, (1,1)) = 0 + alpha*(0 + gamma*0 - 0) = 0 -> small positive for illustration
-        # We show a non-trivial update for pedagogic purposes
-        new_val_4 = make_new_val(4, 0.10, GREEN)
-        self.play(Transform(q_values[4], new_val_4))
-
-        # Highlight Q-table row
-        q_highlight_1 = SurroundingRectangle(q_rows[4], buff=0.05, color=YELLOW)
-        self.play(Create(q_highlight_1))
-        self.wait(0.5)
-        self.next_slide()
-
-        self.play(FadeOut(highlight_1), FadeOut(q_highlight_1), FadeOut(move1_label))
-        self.wait(0.2)
-
-        # --- Move 2: O plays (0,0) ---
-        move2_label = Text("Turno 2: O juega (0,0)", font_size=20, color=RED)
-        move2_label.next_to(board_cells, UP, buff=0.4)
-
-        o_mark_1 = Text("O", font_size=28, color=RED, weight=BOLD)
-        o_mark_1.move_to(cell_map[(0, 0)])
-        marks.append(o_mark_1)
-
-        self.play(FadeIn(move2_label), FadeIn(o_mark_1))
-
-        # Mark (0,0) as unavailable in Q-table
-        new_val_0 = Text("---", font_size=16, color=GRAY)
-        new_val_0.move_to(q_values[0])
-        self.play(Transform(q_values[0], new_val_0))
-        self.wait(0.5)
-        self.next_slide()
-
-        self.play(FadeOut(move2_label))
-        self.wait(0.2)
-
-        # --- Move 3: X plays (0,2) ---
-        move3_label = Text("Turno 3: X juega (0,2)", font_size=20, color=GREEN)
-        move3_label.next_to(board_cells, UP, buff=0.4)
-
-        x_mark_2 = Text("X", font_size=28, color=GREEN, weight=BOLD)
-        x_mark_2.move_to(cell_map[(0, 2)])
-        marks.append(x_mark_2)
-
-        highlight_3 = SurroundingRectangle(cell_map[(0, 2)], buff=0.05, color=YELLOW)
-
-        self.play(FadeIn(move3_label), Create(highlight_3))
-        self.play(FadeIn(x_mark_2))
-
-        # Update Q(x, (0,2))
-        new_val_2 = make_new_val(2, 0.15, GREEN)
-        self.play(Transform(q_values[2], new_val_2))
-
-        q_highlight_3 = SurroundingRectangle(q_rows[2], buff=0.05, color=YELLOW)
-        self.play(Create(q_highlight_3))
-        self.wait(0.5)
-        self.next_slide()
-
-        self.play(FadeOut(highlight_3), FadeOut(q_highlight_3), FadeOut(move3_label))
-        self.wait(0.2)
-
-        # --- Move 4: O plays (2,0) ---
-        move4_label = Text("Turno 4: O juega (2,0)", font_size=20, color=RED)
-        move4_label.next_to(board_cells, UP, buff=0.4)
-
-        o_mark_2 = Text("O", font_size=28, color=RED, weight=BOLD)
-        o_mark_2.move_to(cell_map[(2, 0)])
-        marks.append(o_mark_2)
+        # --- Replay a real episode from the Q-learning engine ---
+        early = train(episodes=EARLY_EPISODES, alpha=ALPHA, gamma=GAMMA)
+        _, _, episode_log = find_episode(
+            early.Q, "win", max_moves=4, epsilon=0.3, alpha=ALPHA, gamma=GAMMA
+        )
 
-        self.play(FadeIn(move4_label), FadeIn(o_mark_2))
+        episode_label = Text(
+            f"Episodio {EARLY_EPISODES + 1} (alpha = {ALPHA}, gamma = {GAMMA})",
+            font_size=18,
+            color=GRAY_B,
+        )
+        episode_label.next_to(board_label, DOWN, buff=0.2)
+        self.play(FadeIn(episode_label))
+
+        marks = VGroup()
+
+        # Q-table cells reuse pre-laid-out digit glyphs, so updates never call Pango
+        def update_q(idx, value, color=WHITE):
+            if np.isnan(value):
+                color = GRAY
+            return q_values[idx].transform_to(value, color)
+
+        def show_state_values(values):
+            """Refresh the Q-table to Q(x_t, ·) of the current board."""
+            anims = [
+                update_q(idx, value)
+                for idx, value in enumerate(values)
+                if q_values[idx].text_for(q_values[idx].value) != q_values[idx].text_for(value)
+            ]
+            if anims:
+                self.play(*anims, run_time=0.6)
+
+        def place_mark(cell_idx, symbol, color):
+            mark = Text(symbol, font_size=28, color=color, weight=BOLD)
+            mark.move_to(board_cells[cell_idx])
+            marks.add(mark)
+            return mark
+
+        turn = 0
+        for update in episode_log:
+            turn += 1
+            row, col = divmod(update.action, 3)
+            move_label = Text(f"Turno {turn}: X juega ({row},{col})", font_size=20, color=GREEN)
+            move_label.next_to(board_cells, UP, buff=0.4)
+            highlight = SurroundingRectangle(board_cells[update.action], buff=0.05, color=YELLOW)
+
+            self.play(FadeIn(move_label), Create(highlight))
+            show_state_values(update.q_before)
+            self.play(FadeIn(place_mark(update.action, "X", GREEN)))
+
+            q_old = update.q_before[update.action]
+            delta_color = GREEN if update.q_after >= q_old else RED
+            td_text = MathTex(
+                rf"\delta_t = {update.td_error:+.2f},\quad r_{{t+1}} = {update.reward:+.0f}",
+                font_size=22,
+                color=delta_color,
+            )
+            td_text.next_to(q_table_box, DOWN, buff=0.25)
+            q_highlight = SurroundingRectangle(q_rows[update.action], buff=0.05, color=YELLOW)
+            self.play(
+                update_q(update.action, update.q_after, delta_color),
+                Create(q_highlight),
+                FadeIn(td_text),
+            )
+            self.wait(0.5)
+            self.next_slide()
+
+            self.play(
+                FadeOut(highlight), FadeOut(q_highlight),
+                FadeOut(move_label), FadeOut(td_text),
+            )
+            self.wait(0.2)
+
+            if update.opponent_action is not None:
+                turn += 1
+                row, col = divmod(update.opponent_action, 3)
+                move_label = Text(f"Turno {turn}: O juega ({row},{col})", font_size=20, color=RED)
+                move_label.next_to(board_cells, UP, buff=0.4)
+                self.play(FadeIn(move_label), FadeIn(place_mark(update.opponent_action, "O", RED)))
+                self.wait(0.5)
+                self.next_slide()
+                self.play(FadeOut(move_label))
+                self.wait(0.2)
+
+        # Highlight the winning line of the replayed episode
+        final_board = np.array(episode_log[-1].board)
+        final_board[episode_log[-1].action] = 1
+        win_line = next(line for line in LINES if (final_board[line] == 1).all())
+        win_label = Text("Victoria de X: r = +1", font_size=20, color=GREEN)
+        win_label.next_to(board_cells, UP, buff=0.4)
+        win_highlights = VGroup(
+            *[
+                SurroundingRectangle(board_cells[idx], buff=0.05, color=GREEN, stroke_width=3)
+                for idx in win_line
+            ]
+        )
 
-        new_val_6 = Text("---", font_size=16, color=GRAY)
-        new_val_6.move_to(q_values[6])
-        self.play(Transform(q_values[6], new_val_6))
+        self.play(FadeIn(win_label), Create(win_highlights))
         self.wait(0.5)
         self.next_slide()
 
-        self.play(FadeOut(move4_label))
-        self.wait(0.2)
-
-        # --- Move 5: X plays (2,2) -> X wins diagonal ---
-        move5_label = Text("Turno 5: X juega (2,2) -> Victoria!", font_size=20, color=GREEN)
-        move5_label.next_to(board_cells, UP, buff=0.4)
-
-        x_mark_3 = Text("X", font_size=28, color=GREEN, weight=BOLD)
-        x_mark_3.move_to(cell_map[(2, 2)])
-        marks.append(x_mark_3)
-
-        highlight_5 = SurroundingRectangle(cell_map[(2, 2)], buff=0.05, color=YELLOW)
-
-        self.play(FadeIn(move5_label), Create(highlight_5))
-        self.play(FadeIn(x_mark_3))
+        # --- After bulk training ---
+        trained = train(episodes=TRAINED_EPISODES, alpha=ALPHA, gamma=GAMMA)
+        rates = evaluate(trained.Q)
+        empty_values = q_values_for(trained.Q, np.zeros(9, dtype=int))[0]
+        best_cell = int(np.nanargmax(empty_values))
 
-        # Win: r = +1, update Q-values for winning move
-        new_val_8 = make_new_val(8, 0.30, GREEN)
-        self.play(Transform(q_values[8], new_val_8))
-
-        # Also update previous moves via propagation
-        new_val_2_up = make_new_val(2, 0.24, GREEN)
-        new_val_4_up = make_new_val(4, 0.22, GREEN)
-        self.play(
-            Transform(q_values[2], new_val_2_up),
-            Transform(q_values[4], new_val_4_up),
-        )
-
-        # Highlight winning diagonal
-        diag_line = Line(
-            cell_map[(0, 2)].get_center() + UL * 0.2,
-            cell_map[(2, 0)].get_center() + DR * 0.2,
-            color=GREEN,
-            stroke_width=4,
+        episodes_str = f"{TRAINED_EPISODES:,}".replace(",", " ")
+        trained_label = Text(
+            f"Tras {episodes_str} episodios: Q(x_0, u) del tablero vacio",
+            font_size=20,
+            color=YELLOW,
         )
-        # Correct diagonal: (0,0) to (2,2) but X is at (1,1), (0,2), (2,2) — that's anti-diagonal
-        # Actually X is at (1,1), (0,2), (2,2) which is not a line. Let me fix:
-        # (0,2), (1,1), (2,0) is anti-diagonal but (2,0) is O. X has (1,1),(0,2),(2,2).
-        # Let's just highlight the winning cells
-        win_highlights = VGroup(
-            SurroundingRectangle(cell_map[(0, 2)], buff=0.05, color=GREEN, stroke_width=3),
-            SurroundingRectangle(cell_map[(1, 1)], buff=0.05, color=GREEN, stroke_width=3),
-            SurroundingRectangle(cell_map[(2, 2)], buff=0.05, color=GREEN, stroke_width=3),
+        trained_label.next_to(board_cells, UP, buff=0.4)
+        self.play(
+            FadeOut(win_label), FadeOut(win_highlights), FadeOut(marks),
+            FadeOut(episode_label), FadeIn(trained_label),
         )
+        show_state_values(empty_values)
+        best_highlight = SurroundingRectangle(q_rows[best_cell], buff=0.05, color=GREEN)
+        self.play(Create(best_highlight))
 
-        # Draw the diagonal line from (0,2) through (1,1) to (2,2)
-        diag_line = Line(
-            cell_map[(0, 2)].get_center(),
-            cell_map[(2, 2)].get_center(),
-            color=GREEN,
-            stroke_width=4,
+        rates_text = Text(
+            f"Politica greedy vs. oponente aleatorio: gana {rates['win']:.0%}, "
+            f"empata {rates['draw']:.0%}, pierde {rates['loss']:.0%}",
+            font_size=18,
+            color=GRAY_B,
         )
-
-        self.play(Create(win_highlights), FadeOut(highlight_5))
+        rates_text.next_to(VGroup(board_label, q_table_box), DOWN, buff=0.3)
+        self.play(FadeIn(rates_text))
         self.wait(0.5)
         self.next_slide()
 
+        self.play(FadeOut(rates_text), FadeOut(best_highlight))
+
         # Reward summary
         reward_text = VGroup(
             Text("r = +1 (ganar), r = -1 (perder), r = 0 (continuar)", font_size=18, color=GRAY_B),
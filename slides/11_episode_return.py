@@ -4,12 +4,23 @@ Episode, Return, Policy, and Value Functions slides.
 Scene: EpisodeReturnSlide - Trajectory, episode, episodic vs continuous, return
 
 Example:
-    uv run manim-slides render slides/11_policy_value.py EpisodeReturnSlide
+    uv run manim-slides render slides/11_episode_return.py EpisodeReturnSlide
 """
 
+import numpy as np
 from manim import *
 from manim_slides import Slide
 
+from engines.mdp import policy_evaluation, recycling_robot, sample_episodes
+from engines.returns import discounted_returns
+
+N_EPISODES = 400
+EPISODE_STEPS = 200
+GAMMAS = np.linspace(0.0, 0.95, 40)
+TRUNCATED_HORIZON = 10
+N_EPISODE_CURVES = 120
+
+
 class EpisodeReturnSlide(Slide):
     """Covers trajectory, episode, episodic vs continuous tasks, and return."""
 
@@ -369,6 +380,110 @@ class EpisodeReturnSlide(Slide):
         self.wait(0.5)
         self.next_slide()
 
+        self.play(
+            FadeOut(recursive_box),
+            FadeOut(recursive_group),
+            FadeOut(balance_text),
+        )
+        self.wait(0.3)
+
+        # === SENSIBILIDAD A GAMMA (episodios del robot de reciclaje) ===
+        robot = recycling_robot()
+        uniform = robot.available / robot.available.sum(axis=1, keepdims=True)
+        states, _, rewards = sample_episodes(
+            robot, uniform, robot.states.index("high"), N_EPISODES, EPISODE_STEPS
+        )
+        # V_π per γ closes the truncated episodes (infinite horizon) and is the reference
+        v_pi = np.array([policy_evaluation(robot, uniform, gamma) for gamma in GAMMAS])
+        returns_inf = discounted_returns(rewards, GAMMAS, bootstrap=v_pi[:, states[:, -1]])[..., 0]
+        returns_trunc = discounted_returns(rewards, GAMMAS, horizon=TRUNCATED_HORIZON)[..., 0]
+
+        gamma_label = Text("Sensibilidad del retorno a γ", font_size=30, color=BLUE)
+        gamma_label.to_edge(UP, buff=1.3)
+        gamma_desc = Text(
+            f"Robot de reciclaje, política uniforme, {N_EPISODES} episodios desde x_0 = high",
+            font_size=20,
+            color=GRAY_B,
+        )
+        gamma_desc.next_to(gamma_label, DOWN, buff=0.2)
+
+        y_max = float(np.ceil(returns_inf.max() / 10.0) * 10.0)
+        axes = Axes(
+            x_range=[0, 1, 0.25],
+            y_range=[0, y_max, y_max / 4],
+            x_length=7.0,
+            y_length=3.8,
+            axis_config={"include_numbers": True, "font_size": 18, "color": GRAY_B},
+            tips=False,
+        )
+        axes_labels = axes.get_axis_labels(
+            MathTex(r"\gamma", font_size=26), MathTex(r"G_0", font_size=26)
+        )
+        plot = VGroup(axes, axes_labels)
+        plot.next_to(gamma_desc, DOWN, buff=0.3).shift(LEFT * 1.8)
+
+        def curve(values, color, stroke_width=3, opacity=1.0):
+            line = VMobject(stroke_color=color, stroke_width=stroke_width, stroke_opacity=opacity)
+            line.set_points_as_corners(axes.c2p(GAMMAS, values))
+            return line
+
+        episode_curves = VGroup(
+            *[
+                curve(returns_inf[:, i], BLUE_B, stroke_width=1, opacity=0.15)
+                for i in range(N_EPISODE_CURVES)
+            ]
+        )
+        mean_inf = returns_inf.mean(axis=1)
+        std_inf = returns_inf.std(axis=1)
+        band = Polygon(
+            *axes.c2p(GAMMAS, mean_inf + std_inf),
+            *axes.c2p(GAMMAS[::-1], (mean_inf - std_inf)[::-1]),
+            stroke_width=0,
+            fill_color=BLUE,
+            fill_opacity=0.25,
+        )
+        mean_curve = curve(mean_inf, BLUE)
+        trunc_curve = curve(returns_trunc.mean(axis=1), ORANGE)
+        reference_dots = VGroup(
+            *[
+                Dot(axes.c2p(gamma, value), radius=0.04, color=GREEN)
+                for gamma, value in zip(GAMMAS[::4], v_pi[::4, 0])
+            ]
+        )
+
+        legend = VGroup(
+            VGroup(Line(ORIGIN, RIGHT * 0.4, color=BLUE), MathTex(r"\bar G_0,\ T\to\infty", font_size=22)),
+            VGroup(
+                Line(ORIGIN, RIGHT * 0.4, color=ORANGE),
+                MathTex(rf"\bar G_0^{{({TRUNCATED_HORIZON})}}\ \text{{(truncado)}}", font_size=22),
+            ),
+            VGroup(Dot(radius=0.06, color=GREEN), MathTex(r"V_\pi(\text{high})", font_size=22)),
+        )
+        for entry in legend:
+            entry.arrange(RIGHT, buff=0.2)
+        legend.arrange(DOWN, aligned_edge=LEFT, buff=0.25)
+        legend_box = RoundedRectangle(
+            corner_radius=0.2,
+            width=legend.width + 0.6,
+            height=legend.height + 0.5,
+            color=GRAY,
+            fill_opacity=0.15,
+            stroke_width=1,
+        )
+        legend_box.move_to(legend)
+        legend_group = VGroup(legend_box, legend).next_to(plot, RIGHT, buff=0.5)
+
+        self.play(FadeIn(gamma_label), FadeIn(gamma_desc), Create(axes), FadeIn(axes_labels))
+        self.play(FadeIn(episode_curves), FadeIn(band))
+        self.play(Create(mean_curve), FadeIn(legend_group[0]), FadeIn(legend[0]))
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(Create(trunc_curve), FadeIn(legend[1]))
+        self.play(FadeIn(reference_dots), FadeIn(legend[2]))
+        self.wait(0.5)
+        self.next_slide()
+
         # Final wait
         self.wait(1)
 
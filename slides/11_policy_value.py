@@ -1,15 +1,18 @@
 """
 Episode, Return, Policy, and Value Functions slides.
 
-Scene: EpisodeReturnSlide - Trajectory, episode, episodic vs continuous, return
+Scene: PolicyValueSlide - Policy, value functions, optimal policy, Q*, greedy policy
 
 Example:
-    uv run manim-slides render slides/11_policy_value.py EpisodeReturnSlide
+    uv run manim-slides render slides/11_policy_value.py PolicyValueSlide
 """
 
 from manim import *
 from manim_slides import Slide
 
+from components.numeric_cell import NumericCell
+from engines.mdp import ROBOT_GAMMA, policy_evaluation, recycling_robot, recycling_robot_solution
+
 
 class PolicyValueSlide(Slide):
     """Covers policy, value functions, optimal policy, Q*, and greedy policy."""
@@ -450,5 +453,85 @@ class PolicyValueSlide(Slide):
         self.wait(0.5)
         self.next_slide()
 
+        # === EXAMPLE: RECYCLING ROBOT (shared value-iteration solution) ===
+        self.play(
+            FadeOut(qstar_box),
+            FadeOut(qstar_group),
+            FadeOut(greedy_box),
+            FadeOut(greedy_group),
+        )
+        self.wait(0.3)
+
+        robot = recycling_robot()
+        solution = recycling_robot_solution()
+        uniform = robot.available / robot.available.sum(axis=1, keepdims=True)
+        v_uniform = policy_evaluation(robot, uniform, ROBOT_GAMMA)
+
+        example_label = Text("Ejemplo: robot de reciclaje", font_size=30, color=BLUE)
+        example_label.to_edge(UP, buff=1.4)
+
+        # Q*(x, u) table: one row per state, one column per action, plus V*
+        header = VGroup(
+            MathTex(r"x", font_size=26, color=GRAY_B),
+            *[MathTex(rf"\text{{{a}}}", font_size=26, color=GRAY_B) for a in robot.actions],
+            MathTex(r"V_*(x)", font_size=26, color=GREEN),
+            MathTex(r"V_{\text{unif}}(x)", font_size=26, color=GRAY_B),
+        )
+        rows = [header]
+        q_cells = []
+        for x, name in enumerate(robot.states):
+            cells = [NumericCell(q, slots=6, font_size=22) for q in solution.Q[x]]
+            q_cells.append(cells)
+            rows.append(
+                VGroup(
+                    MathTex(rf"\text{{{name}}}", font_size=26, color=YELLOW),
+                    *cells,
+                    NumericCell(solution.V[x], slots=6, font_size=22, color=GREEN),
+                    NumericCell(v_uniform[x], slots=6, font_size=22, color=GRAY_B),
+                )
+            )
+        table = VGroup(*[mob for row in rows for mob in row]).arrange_in_grid(
+            rows=len(rows), cols=len(header), buff=(0.55, 0.3)
+        )
+        table_box = RoundedRectangle(
+            corner_radius=0.2,
+            width=table.width + 0.8,
+            height=table.height + 0.5,
+            color=GRAY,
+            fill_opacity=0.15,
+            stroke_width=1,
+        )
+        table_box.move_to(table)
+        table_group = VGroup(table_box, table).next_to(example_label, DOWN, buff=0.4)
+
+        caption = MathTex(
+            rf"\gamma = {ROBOT_GAMMA},\quad \text{{iteración de valor: }} {solution.iterations} \text{{ barridos}}",
+            font_size=24,
+            color=GRAY_B,
+        )
+        caption.next_to(table_group, DOWN, buff=0.3)
+
+        self.play(FadeIn(example_label), FadeIn(table_group), FadeIn(caption))
+        self.wait(0.5)
+        self.next_slide()
+
+        # Greedy action per state: μ*(x) = argmax_u Q*(x, u)
+        greedy_marks = VGroup(
+            *[
+                SurroundingRectangle(q_cells[x][int(u)], buff=0.08, color=GREEN)
+                for x, u in enumerate(solution.policy)
+            ]
+        )
+        ordering_note = MathTex(
+            r"V_*(x) \geq V_{\text{unif}}(x)\ \ \forall x",
+            font_size=28,
+            color=GREEN,
+        )
+        ordering_note.next_to(caption, DOWN, buff=0.3)
+
+        self.play(Create(greedy_marks), FadeIn(ordering_note))
+        self.wait(0.5)
+        self.next_slide()
+
         # Final wait
         self.wait(1)
@@ -1,16 +1,30 @@
 """
 Continuous Policy slide - From discrete MDP to continuous control.
 
-Introduces the stochastic policy as a multivariate normal distribution
-and shows the neural network architecture for the mean function.
+Introduces the stochastic policy as a multivariate normal distribution,
+shows the neural network architecture for the mean function and flies a
+fan of trajectories sampled from π_θ with the batched ``engines.policy``
+backend.
 
 Example:
     uv run manim-slides render slides/12_continuous_policy.py ContinuousPolicySlide
 """
 
+import numpy as np
 from manim import *
 from manim_slides import Slide
 
+from components.plots import SeriesPlot
+from engines.policy import load_policy, rollout_fan
+from engines.quadcopter import STATE_LABELS
+
+FAN_INITIAL_STATE = {"varphi": 0.5, "theta": -0.3, "z": 1.0}
+FAN_ROLLOUTS = 500
+FAN_T_FINAL = 10.0
+# Time samples kept per sampled trajectory.
+FAN_POINTS = 100
+FAN_PANELS = (("varphi", r"\varphi"), ("theta", r"\theta"))
+
 
 class ContinuousPolicySlide(Slide):
     """Transition from discrete to continuous policy with neural network diagram."""
@@ -318,5 +332,63 @@ class ContinuousPolicySlide(Slide):
         self.wait(0.5)
         self.next_slide()
 
+        self.play(
+            FadeOut(nn_label),
+            FadeOut(mu_eq),
+            FadeOut(network_diagram),
+            FadeOut(input_label),
+            FadeOut(output_label),
+            FadeOut(hidden_label),
+            FadeOut(theta_left),
+            FadeOut(equations_right),
+        )
+        self.wait(0.3)
+
+        # === SAMPLED TRAJECTORIES ===
+        fan_label = Text("Trayectorias muestreadas de la política", font_size=28, color=BLUE)
+        fan_label.to_edge(UP, buff=0.6)
+        fan_eq = MathTex(
+            r"\mathbf{u}_t \sim \mathcal{N}\left(\boldsymbol{\mu}(\mathbf{x}_t; \boldsymbol{\theta}),"
+            r" \boldsymbol{\Sigma}\right),\quad \mathbf{x}_{t+1} = f(\mathbf{x}_t, \mathbf{u}_t)",
+            font_size=26,
+        )
+        fan_eq.next_to(fan_label, DOWN, buff=0.3)
+
+        fan = rollout_fan(load_policy(), FAN_INITIAL_STATE, n_rollouts=FAN_ROLLOUTS, t_final=FAN_T_FINAL)
+        kept = np.linspace(0, len(fan["t"]) - 1, FAN_POINTS).round().astype(int)
+        times = fan["t"][kept]
+
+        fan_plots = VGroup()
+        sample_fans = VGroup()
+        mean_curves = VGroup()
+        for label, tex in FAN_PANELS:
+            index = STATE_LABELS.index(label)
+            plot = SeriesPlot(x_range=(0, FAN_T_FINAL), y_range=(-1.2, 1.2), x_length=5.2, y_length=3.0)
+            sample_fans.add(
+                plot.add_fan(times, fan["samples"][kept, :, index].T, color=BLUE, stroke_width=0.6, stroke_opacity=0.15)
+            )
+            mean_curves.add(plot.add_series(times, fan["mean"][kept, index], color=YELLOW, stroke_width=3))
+            plot.add(MathTex(tex, font_size=26).next_to(plot.axes, UP, buff=0.1))
+            fan_plots.add(plot)
+        fan_plots.arrange(RIGHT, buff=0.8)
+        fan_plots.next_to(fan_eq, DOWN, buff=0.4)
+
+        fan_note = Text(
+            f"{FAN_ROLLOUTS} trayectorias muestreadas (azul) y la de la media (amarillo)",
+            font_size=18,
+            color=GRAY_B,
+        )
+        fan_note.next_to(fan_plots, DOWN, buff=0.3)
+
+        self.play(FadeIn(fan_label), FadeIn(fan_eq))
+        self.play(*[FadeIn(plot.axes) for plot in fan_plots], *[FadeIn(plot[-1]) for plot in fan_plots])
+        self.play(*[Create(curve) for curve in mean_curves], run_time=1.5)
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(*[Create(curves) for curves in sample_fans], FadeIn(fan_note), run_time=2.5)
+        self.wait(0.5)
+        self.next_slide()
+
         # Final wait
         self.wait(1)
@@ -4,6 +4,9 @@ iLQR: Iterative Linear Quadratic Regulator slide.
 Covers the iLQR algorithm for trajectory optimization in non-linear systems,
 including Taylor approximations, backward/forward passes, line search, and regularization.
 
+Each section is a method, so ``SLIDES_CHECKPOINTS=1`` can resume a render
+from the first edited section (see ``components.checkpoint``).
+
 Example:
     uv run manim-slides render slides/13_ilqr.py ILQRSlide
 """
@@ -11,11 +14,30 @@ Example:
 from manim import *
 from manim_slides import Slide
 
+from components.checkpoint import SectionCheckpoints
+
 
-class ILQRSlide(Slide):
+class ILQRSlide(SectionCheckpoints, Slide):
     """iLQR algorithm explanation with trajectory visualization and backward/forward pass."""
 
-    def construct(self):
+    sections = (
+        "_title",
+        "_optimal_control",
+        "_value_function",
+        "_value_iteration",
+        "_motivation",
+        "_hypotheses",
+        "_nominal_trajectory",
+        "_taylor_dynamics",
+        "_quadratic_cost",
+        "_backward_pass",
+        "_forward_pass",
+        "_line_search",
+        "_regularization",
+        "_algorithm",
+    )
+
+    def _title(self):
         # === TITLE ===
         title = Text("iLQR: Regulador Cuadrático Lineal Iterativo", font_size=38, color=YELLOW)
         title.to_edge(UP, buff=0.5)
@@ -23,6 +45,7 @@ class ILQRSlide(Slide):
         self.wait(0.5)
         self.next_slide()
 
+    def _optimal_control(self):
         # ============================================================
         # SECTION A: Control Óptimo
         # ============================================================
@@ -71,6 +94,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _value_function(self):
         # ============================================================
         # SECTION B: Función de valor V
         # ============================================================
@@ -139,6 +163,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _value_iteration(self):
         # ============================================================
         # SECTION C: Iteración de Valores
         # ============================================================
@@ -196,6 +221,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _motivation(self):
         # ============================================================
         # SECTION 1: Introduction and Motivation
         # ============================================================
@@ -247,6 +273,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _hypotheses(self):
         # ============================================================
         # SECTION 2: Hypotheses
         # ============================================================
@@ -291,6 +318,7 @@ class ILQRSlide(Slide):
         self.play(FadeOut(hyp_box), FadeOut(hyp_group))
         self.wait(0.3)
 
+    def _nominal_trajectory(self):
         # ============================================================
         # SECTION 3: Nominal Trajectory
         # ============================================================
@@ -348,6 +376,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _taylor_dynamics(self):
         # ============================================================
         # SECTION 4: Taylor Linearization of Dynamics
         # ============================================================
@@ -406,6 +435,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _quadratic_cost(self):
         # ============================================================
         # SECTION 5: Quadratic Cost Approximation
         # ============================================================
@@ -457,6 +487,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _backward_pass(self):
         # ============================================================
         # SECTION 6: Backward Pass
         # ============================================================
@@ -570,6 +601,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _forward_pass(self):
         # ============================================================
         # SECTION 7: Forward Pass
         # ============================================================
@@ -634,6 +666,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _line_search(self):
         # ============================================================
         # SECTION 8: Line Search
         # ============================================================
@@ -708,6 +741,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _regularization(self):
         # ============================================================
         # SECTION 9: Regularization
         # ============================================================
@@ -782,6 +816,7 @@ class ILQRSlide(Slide):
         )
         self.wait(0.3)
 
+    def _algorithm(self):
         # ============================================================
         # SECTION 10: iLQR Algorithm
         # ============================================================
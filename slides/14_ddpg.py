@@ -1,6 +1,7 @@
 """
 DDPG slide: actor-critic overview, main equations, stabilization mechanisms,
-and the training algorithm for continuous control.
+the training algorithm for continuous control, and the return curves and
+critic surfaces of a cached NumPy DDPG run (``engines.ddpg``).
 
 Example:
     uv run manim-slides render slides/14_ddpg.py DDPGSlide
@@ -8,15 +9,30 @@ Example:
 
 from pathlib import Path
 
+import numpy as np
 from manim import *
 from manim_slides import Slide
 
+from components.heatmap import Heatmap
+from components.numeric_cell import NumericCell
+from components.plots import VERTEX_BUDGET, SeriesPlot
+from engines.ddpg import SURFACE_AXES, DDPGConfig, train_ddpg
+from engines.logstore import open_log
+from engines.series import lttb_indices
+
 
 DDPG_SCHEMA = (
     Path(__file__).resolve().parent.parent
     / "LaTex/figures/06_aplicacion_y_evaluacion_de_metodos_rl/ddpg_algorithm.png"
 )
 
+# Training log (results/ddpg_returns.csv or .npz): ``episode`` and ``seed``
+# columns plus the return series; seeds are drawn as mean ± std bands over a
+# shared episode grid. Without a log, the cached NumPy DDPG run is plotted.
+RETURN_SERIES = (("train_return", BLUE, "Entrenamiento"), ("validation_return", RED, "Validación"))
+DDPG_SEED = 0
+SURFACE_TEX = {"varphi": r"\varphi", "p": "p"}
+
 
 class DDPGSlide(Slide):
     """DDPG overview grounded in the dissertation chapter on TD learning."""
@@ -452,4 +468,109 @@ class DDPGSlide(Slide):
         self.wait(0.5)
         self.next_slide()
 
+        # === EVOLUCION DEL RETORNO ===
+        run = train_ddpg(DDPGConfig(seed=DDPG_SEED))
+        returns_log = open_log("ddpg_returns", x="episode")
+        if returns_log is not None:
+            bands = {
+                name: returns_log.band(name) for name, _, _ in RETURN_SERIES if name in returns_log.columns
+            }
+            band_note = f"media ± desviación estándar, {len(returns_log.seeds)} semillas"
+        else:
+            bands = {
+                "train_return": (run.epochs, run.train_return_mean, run.train_return_std),
+                "validation_return": (run.epochs, run.validation_return_mean, run.validation_return_std),
+            }
+            band_note = "media ± desviación estándar de los episodios de cada época"
+        series = [(name, color, label) for name, color, label in RETURN_SERIES if name in bands]
+        x_values = bands[series[0][0]][0]
+        lower = min(np.nanmin(mean - std) for _, mean, std in bands.values())
+        upper = max(np.nanmax(mean + std) for _, mean, std in bands.values())
+
+        returns_label = Text("Evolución del retorno", font_size=30, color=BLUE)
+        returns_label.move_to(UP * 2.5)
+        returns_plot = SeriesPlot(
+            x_range=(x_values[0], x_values[-1]),
+            y_range=(lower, upper),
+            x_length=9.0,
+            y_length=3.8,
+        )
+        return_bands = VGroup()
+        return_curves = VGroup()
+        for name, color, _ in series:
+            x, mean, std = bands[name]
+            kept = lttb_indices(x, mean, VERTEX_BUDGET)
+            return_bands.add(
+                returns_plot.add_band(x[kept], mean[kept] - std[kept], mean[kept] + std[kept], color=color)
+            )
+            return_curves.add(returns_plot.add_series(x[kept], mean[kept], color=color))
+        returns_plot.next_to(returns_label, DOWN, buff=0.4)
+        returns_legend = VGroup(
+            *[Text(label, font_size=18, color=color) for _, color, label in series],
+            Text(band_note, font_size=18, color=GRAY_B),
+        ).arrange(RIGHT, buff=0.6)
+        returns_legend.next_to(returns_plot, DOWN, buff=0.3)
+
+        self.play(FadeOut(alg_label), FadeOut(closing_box), FadeOut(closing_group))
+        self.wait(0.2)
+        self.play(FadeIn(returns_label), FadeIn(returns_plot.axes), FadeIn(returns_legend))
+        self.play(*[Create(curve) for curve in return_curves], run_time=3)
+        self.play(*[FadeIn(band) for band in return_bands])
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(FadeOut(returns_label), FadeOut(returns_plot), FadeOut(returns_legend))
+        self.wait(0.3)
+
+        # === SUPERFICIE DEL CRITICO ===
+        critic_label = Text("Superficie del crítico por época", font_size=30, color=BLUE)
+        critic_label.move_to(UP * 2.5)
+        critic_eq = MathTex(
+            r"Q\left(\mathbf{x}, \mu(\mathbf{x};\boldsymbol{\theta}_{\mu});\boldsymbol{\theta}_{Q}\right)",
+            font_size=26,
+        )
+        critic_eq.next_to(critic_label, DOWN, buff=0.25)
+
+        (a_label, _), (b_label, _) = SURFACE_AXES
+        surfaces = run.critic_surfaces
+        critic_maps = [
+            Heatmap(
+                surface,
+                x_range=(run.surface_x[0], run.surface_x[-1]),
+                y_range=(run.surface_y[0], run.surface_y[-1]),
+                x_length=4.2,
+                y_length=3.6,
+                vmin=surfaces.min(),
+                vmax=surfaces.max(),
+            ).next_to(critic_eq, DOWN, buff=0.4)
+            for surface in surfaces
+        ]
+        surface_labels = VGroup(
+            MathTex(SURFACE_TEX.get(a_label, a_label), font_size=24).next_to(critic_maps[0].axes, DOWN, buff=0.15),
+            MathTex(SURFACE_TEX.get(b_label, b_label), font_size=24).next_to(critic_maps[0].axes, LEFT, buff=0.15),
+        )
+        epoch_text = Text("Época", font_size=22, color=YELLOW)
+        epoch_cell = NumericCell(1, fmt="{:.0f}", slots=2, font_size=22, color=YELLOW)
+        epoch_counter = VGroup(epoch_text, epoch_cell).arrange(RIGHT, buff=0.2)
+        epoch_counter.next_to(critic_maps[0], RIGHT, buff=0.5)
+
+        self.play(FadeIn(critic_label), FadeIn(critic_eq))
+        self.play(FadeIn(critic_maps[0]), FadeIn(surface_labels), FadeIn(epoch_counter))
+        self.wait(0.5)
+        self.next_slide()
+
+        for epoch, (previous, current) in enumerate(zip(critic_maps, critic_maps[1:]), start=2):
+            self.play(FadeOut(previous), FadeIn(current), epoch_cell.transform_to(epoch), run_time=0.6)
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(
+            FadeOut(critic_label),
+            FadeOut(critic_eq),
+            FadeOut(critic_maps[-1]),
+            FadeOut(surface_labels),
+            FadeOut(epoch_counter),
+        )
+        self.wait(0.3)
+
         self.wait(1)
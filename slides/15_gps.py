@@ -11,9 +11,20 @@ Example:
 
 from pathlib import Path
 
+import numpy as np
 from manim import *
 from manim_slides import Slide
 
+from components.heatmap import Heatmap
+from components.numeric_cell import NumericCell
+from components.plots import VERTEX_BUDGET, SeriesPlot
+from engines.density import log_density
+from engines.gps import GPS_CONDITIONS, GPSConfig, run_gps
+from engines.logstore import open_log
+from engines.quadcopter import STATE_LABELS
+from engines.series import downsample, lttb_indices, rollout_log
+from engines.stability import linear_feedback
+
 
 GPS_SCHEMA = (
     Path(__file__).resolve().parent.parent
@@ -21,6 +32,34 @@ GPS_SCHEMA = (
 )
 
 
+# Closed-loop flight shown in the results section; a GPS rollout log with the
+# same columns (results/gps_states.csv or .npz) is overlaid when present.
+RESULT_INITIAL_STATE = {"varphi": 0.5, "theta": -0.4, "psi": 0.3, "z": 2.0}
+RESULT_T_FINAL = 20.0
+RESULT_PANELS = (
+    (("varphi", "theta", "psi"), (-0.6, 0.6), (BLUE, GREEN, ORANGE)),
+    (("z", "w"), (-3.5, 3.5), (TEAL, PINK)),
+)
+# Multi-seed training log (results/gps_returns.csv or .npz) with ``iteration``,
+# ``seed`` and ``return`` columns; drawn as mean ± std when present.
+RETURN_COLUMN = "return"
+# Final states x_T of the test episodes (results/<method>_final_states) shown
+# as smoothed 2D densities with contour lines at fractions of the peak.
+DENSITY_LOGS = (("ddpg_final_states", "DDPG"), ("gps_final_states", "GPS"))
+DENSITY_PAIR = ("z", "psi")
+DENSITY_RANGES = ((-20.0, 20.0), (-np.pi, np.pi))
+DENSITY_BINS = 160
+DENSITY_SIGMA = 1.5
+DENSITY_LEVELS = (0.1, 0.5)
+RESULT_TEX = {"varphi": r"\varphi", "theta": r"\theta", "psi": r"\psi"}
+# BADMM run of engines.gps animated in the convergence section: one state
+# coordinate of the local (p_i) and global (π_θ) trajectories per iteration,
+# the mean action gap and the task costs of both, summed over conditions.
+GPS_ITERATIONS = 24
+CONVERGENCE_STATE = "varphi"
+CONVERGENCE_RANGE = (-0.5, 0.5)
+
+
 def _invert_image(path) -> ImageMobject:
     from PIL import Image, ImageOps
     img = Image.open(str(path)).convert("RGBA")
@@ -391,6 +430,276 @@ class GPSSlide(Slide):
         self.play(FadeOut(config_box), FadeOut(config_group), FadeOut(closing))
         self.wait(0.3)
 
+        # ================================================================== #
+        # === SECTION: CONVERGENCIA BADMM ===
+        # ================================================================== #
+        convergence_label = Text("Convergencia local → global", font_size=30, color=BLUE)
+        convergence_label.move_to(UP * 2.5)
+
+        gps_config = GPSConfig()
+        history = run_gps(gps_config, iterations=GPS_ITERATIONS)
+        state_index = STATE_LABELS.index(CONVERGENCE_STATE)
+        times = gps_config.dt * history.times
+
+        def trajectory_plot(k: int) -> SeriesPlot:
+            plot = SeriesPlot(x_range=(0, times[-1]), y_range=CONVERGENCE_RANGE, x_length=5.2, y_length=3.0)
+            for local, global_ in zip(history.local_states[k], history.global_states[k]):
+                plot.add_series(*downsample(times, local[:, state_index], VERTEX_BUDGET), color=ORANGE)
+                plot.add_series(
+                    *downsample(times, global_[:, state_index], VERTEX_BUDGET),
+                    color=GREEN,
+                    stroke_width=4,
+                    stroke_opacity=0.6,
+                )
+            return plot
+
+        trajectory_plots = [trajectory_plot(k) for k in range(GPS_ITERATIONS)]
+        gap = history.gap.mean(axis=1)
+        gap_plot = SeriesPlot(
+            x_range=(1, GPS_ITERATIONS), y_range=(0, 1.1 * gap.max()), x_length=4.0, y_length=1.2
+        )
+        gap_curve = gap_plot.add_series(history.iterations, gap, color=YELLOW)
+        # Early global policies diverge, so the costs span orders of magnitude.
+        local_cost = np.log10(history.local_cost.sum(axis=1))
+        global_cost = np.log10(history.global_cost.sum(axis=1))
+        cost_plot = SeriesPlot(
+            x_range=(1, GPS_ITERATIONS),
+            y_range=(np.floor(local_cost.min()), np.ceil(global_cost.max())),
+            x_length=4.0,
+            y_length=1.2,
+        )
+        cost_curves = VGroup(
+            cost_plot.add_series(history.iterations, local_cost, color=ORANGE),
+            cost_plot.add_series(history.iterations, global_cost, color=GREEN),
+        )
+        cost_plot.next_to(gap_plot, DOWN, buff=0.8)
+        VGroup(trajectory_plots[0], VGroup(gap_plot, cost_plot)).arrange(RIGHT, buff=0.8).next_to(
+            convergence_label, DOWN, buff=0.6
+        )
+        for plot in trajectory_plots[1:]:
+            plot.move_to(trajectory_plots[0])
+
+        trajectory_legend = VGroup(
+            MathTex(r"p_i", font_size=24, color=ORANGE),
+            MathTex(r"\pi_{\boldsymbol{\theta}}", font_size=24, color=GREEN),
+            MathTex(RESULT_TEX.get(CONVERGENCE_STATE, CONVERGENCE_STATE), font_size=24),
+        ).arrange(RIGHT, buff=0.3)
+        trajectory_legend.next_to(trajectory_plots[0].axes, UP, buff=0.1)
+        gap_legend = MathTex(
+            r"\lVert \mathbb{E}_{\pi}[\mathbf{u}_t] - \mathbb{E}_{p}[\mathbf{u}_t] \rVert",
+            font_size=24,
+            color=YELLOW,
+        )
+        gap_legend.next_to(gap_plot.axes, UP, buff=0.1)
+        cost_legend = VGroup(
+            MathTex(r"\log_{10} \textstyle\sum_i J", font_size=24),
+            MathTex(r"p_i", font_size=24, color=ORANGE),
+            MathTex(r"\pi_{\boldsymbol{\theta}}", font_size=24, color=GREEN),
+        ).arrange(RIGHT, buff=0.3)
+        cost_legend.next_to(cost_plot.axes, UP, buff=0.1)
+
+        iteration_text = Text("Iteración", font_size=22, color=YELLOW)
+        iteration_cell = NumericCell(1, fmt="{:.0f}", slots=2, font_size=22, color=YELLOW)
+        iteration_counter = VGroup(iteration_text, iteration_cell).arrange(RIGHT, buff=0.2)
+        iteration_counter.next_to(VGroup(trajectory_plots[0], cost_plot), DOWN, buff=0.4)
+        convergence_note = Text(
+            f"{len(GPS_CONDITIONS)} condiciones iniciales, iLQR sobre el modelo no lineal",
+            font_size=18,
+            color=GRAY_B,
+        )
+        convergence_note.next_to(iteration_counter, DOWN, buff=0.2)
+
+        self.play(
+            FadeIn(convergence_label),
+            FadeIn(trajectory_plots[0]),
+            FadeIn(trajectory_legend),
+            FadeIn(gap_plot.axes),
+            FadeIn(gap_legend),
+            FadeIn(cost_plot.axes),
+            FadeIn(cost_legend),
+            FadeIn(iteration_counter),
+            FadeIn(convergence_note),
+        )
+        self.wait(0.5)
+        self.next_slide()
+
+        for k, (previous, current) in enumerate(zip(trajectory_plots, trajectory_plots[1:]), start=2):
+            self.play(ReplacementTransform(previous, current), iteration_cell.transform_to(k), run_time=0.4)
+        self.play(Create(gap_curve), Create(cost_curves), run_time=2.0)
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(
+            FadeOut(convergence_label),
+            FadeOut(trajectory_plots[-1]),
+            FadeOut(trajectory_legend),
+            FadeOut(gap_plot),
+            FadeOut(gap_legend),
+            FadeOut(cost_plot),
+            FadeOut(cost_legend),
+            FadeOut(iteration_counter),
+            FadeOut(convergence_note),
+        )
+        self.wait(0.3)
+
+        # ================================================================== #
+        # === SECTION: RESULTADOS ===
+        # ================================================================== #
+        results_label = Text("Trayectorias en lazo cerrado", font_size=30, color=BLUE)
+        results_label.move_to(UP * 2.5)
+
+        reference = rollout_log(linear_feedback(), RESULT_INITIAL_STATE, t_final=RESULT_T_FINAL)
+        gps_log = open_log("gps_states")
+
+        result_plots = VGroup()
+        reference_curves = VGroup()
+        gps_curves = VGroup()
+        result_labels = VGroup()
+        for labels, y_range, colors in RESULT_PANELS:
+            plot = SeriesPlot(x_range=(0, RESULT_T_FINAL), y_range=y_range, x_length=5.2, y_length=2.4)
+            for label, color in zip(labels, colors):
+                reference_curves.add(
+                    plot.add_series(*downsample(reference["t"], reference[label], VERTEX_BUDGET), color=color)
+                )
+                if gps_log is not None:
+                    gps_curves.add(
+                        plot.add_series(
+                            *downsample(gps_log.column("t"), gps_log.column(label), VERTEX_BUDGET),
+                            color=color,
+                            stroke_width=5,
+                            stroke_opacity=0.5,
+                        )
+                    )
+            legend = VGroup(
+                *[
+                    MathTex(RESULT_TEX.get(label, label), font_size=24, color=color)
+                    for label, color in zip(labels, colors)
+                ]
+            ).arrange(RIGHT, buff=0.3)
+            legend.next_to(plot.axes, UP, buff=0.1)
+            result_labels.add(legend)
+            result_plots.add(plot)
+
+        panels = VGroup(
+            *[VGroup(plot, legend) for plot, legend in zip(result_plots, result_labels)]
+        ).arrange(RIGHT, buff=0.7)
+        shrink_to_fit_width(panels, config.frame_width - 1.2)
+        panels.next_to(results_label, DOWN, buff=0.4)
+
+        source_note = Text(
+            "Delgada: retroalimentación lineal"
+            + ("   ·   Gruesa: política GPS" if gps_log is not None else ""),
+            font_size=18,
+            color=GRAY_B,
+        )
+        source_note.next_to(panels, DOWN, buff=0.35)
+
+        self.play(
+            FadeIn(results_label),
+            *[FadeIn(plot.axes) for plot in result_plots],
+            FadeIn(result_labels),
+        )
+        self.play(*[Create(curve) for curve in reference_curves], run_time=2.5)
+        self.play(FadeIn(source_note))
+        self.wait(0.5)
+        self.next_slide()
+
+        if gps_log is not None:
+            self.play(*[Create(curve) for curve in gps_curves], run_time=2.5)
+            self.wait(0.5)
+            self.next_slide()
+
+        self.play(
+            FadeOut(results_label),
+            FadeOut(panels),
+            FadeOut(source_note),
+        )
+        self.wait(0.3)
+
+        returns_log = open_log("gps_returns", x="iteration")
+        if returns_log is not None:
+            iterations, mean, std = returns_log.band(RETURN_COLUMN)
+            kept = lttb_indices(iterations, mean, VERTEX_BUDGET)
+            returns_label = Text("Retorno por iteración de GPS", font_size=30, color=BLUE)
+            returns_label.move_to(UP * 2.5)
+            returns_plot = SeriesPlot(
+                x_range=(iterations[0], iterations[-1]),
+                y_range=(np.nanmin(mean - std), np.nanmax(mean + std)),
+                x_length=9.0,
+                y_length=3.8,
+            )
+            returns_band = returns_plot.add_band(
+                iterations[kept], mean[kept] - std[kept], mean[kept] + std[kept], color=GREEN
+            )
+            returns_curve = returns_plot.add_series(iterations[kept], mean[kept], color=GREEN)
+            returns_plot.next_to(returns_label, DOWN, buff=0.4)
+            returns_note = Text(
+                f"media ± desviación estándar, {len(returns_log.seeds)} semillas",
+                font_size=18,
+                color=GRAY_B,
+            )
+            returns_note.next_to(returns_plot, DOWN, buff=0.3)
+
+            self.play(FadeIn(returns_label), FadeIn(returns_plot.axes), FadeIn(returns_note))
+            self.play(Create(returns_curve), run_time=2.5)
+            self.play(FadeIn(returns_band))
+            self.wait(0.5)
+            self.next_slide()
+
+            self.play(FadeOut(returns_label), FadeOut(returns_plot), FadeOut(returns_note))
+            self.wait(0.3)
+
+        densities = []
+        for name, method in DENSITY_LOGS:
+            grid = log_density(name, DENSITY_PAIR, DENSITY_BINS, DENSITY_RANGES)
+            if grid is None:
+                continue
+            values = grid.smoothed(DENSITY_SIGMA)
+            heatmap = Heatmap(
+                values,
+                x_range=DENSITY_RANGES[0],
+                y_range=DENSITY_RANGES[1],
+                x_length=5.0,
+                y_length=3.6,
+                vmin=0.0,
+            )
+            for fraction in DENSITY_LEVELS:
+                heatmap.add_contours(grid.contours(values, fraction * values.max()), color=WHITE)
+            densities.append((method, heatmap))
+
+        if densities:
+            density_label = Text("Densidad de estados finales", font_size=30, color=BLUE)
+            density_label.move_to(UP * 2.5)
+            axis_labels = VGroup(
+                MathTex(RESULT_TEX.get(DENSITY_PAIR[0], DENSITY_PAIR[0]), font_size=24),
+                MathTex(RESULT_TEX.get(DENSITY_PAIR[1], DENSITY_PAIR[1]), font_size=24),
+            )
+            method_labels = []
+            for method, heatmap in densities:
+                heatmap.next_to(density_label, DOWN, buff=0.5)
+                method_labels.append(Text(method, font_size=24, color=YELLOW).next_to(heatmap, RIGHT, buff=0.4))
+            axis_labels[0].next_to(densities[0][1].axes, DOWN, buff=0.15)
+            axis_labels[1].next_to(densities[0][1].axes, LEFT, buff=0.15)
+
+            self.play(FadeIn(density_label), FadeIn(densities[0][1]), FadeIn(axis_labels), FadeIn(method_labels[0]))
+            self.wait(0.5)
+            self.next_slide()
+
+            for (_, previous), (_, current), old_label, new_label in zip(
+                densities, densities[1:], method_labels, method_labels[1:]
+            ):
+                self.play(FadeOut(previous), FadeIn(current), FadeTransform(old_label, new_label), run_time=1.5)
+                self.wait(0.5)
+                self.next_slide()
+
+            self.play(
+                FadeOut(density_label),
+                FadeOut(densities[-1][1]),
+                FadeOut(axis_labels),
+                FadeOut(method_labels[-1]),
+            )
+            self.wait(0.3)
+
         # ================================================================== #
         # === SECTION: IDEA CENTRAL ===
         # ================================================================== #
@@ -0,0 +1,169 @@
+"""
+Stability analysis slide: regions of stability of the closed-loop quadcopter.
+
+Each initial-condition set χ (w–z, p–φ, q–θ, r–ψ) is swept on a 200×200
+grid through the nonlinear model under each controller (LQR, the GPS global
+policy and the DDPG actor), and the final-time criterion is shown as a
+heatmap (blue stable, red unstable). Maps come from the cached
+``engines.stability`` backend; the GPS and DDPG runs are the cached ones of
+the GPS and DDPG slides.
+
+Example:
+    uv run manim-slides render slides/16_stability.py StabilitySlide
+"""
+
+from manim import *
+from manim_slides import Slide
+
+from components.heatmap import Heatmap
+from engines.ddpg import DDPGConfig, train_ddpg
+from engines.gps import GPSConfig, run_gps
+from engines.stability import (
+    CRITERIA,
+    STABILITY_SETS,
+    ddpg_feedback,
+    gps_feedback,
+    linear_feedback,
+    stability_map,
+)
+
+RESOLUTION = 200
+T_FINAL = 30.0
+EPSILON = 0.5
+STABLE_COLOR = BLUE_D
+UNSTABLE_COLOR = RED_E
+# Same runs as slides/14_ddpg.py and slides/15_gps.py, so their caches are shared.
+DDPG_SEED = 0
+GPS_ITERATIONS = 24
+CONTROLLERS = (
+    ("linear", "Retroalimentación lineal (LQR)"),
+    ("gps", "Política global de GPS"),
+    ("ddpg", "Actor de DDPG"),
+)
+
+TEX_LABELS = {"varphi": r"\varphi", "theta": r"\theta", "psi": r"\psi"}
+
+
+def _tex(label: str) -> str:
+    return TEX_LABELS.get(label, label)
+
+
+def _controller(name: str):
+    if name == "gps":
+        return gps_feedback(run_gps(GPSConfig(), iterations=GPS_ITERATIONS))
+    if name == "ddpg":
+        config = DDPGConfig(seed=DDPG_SEED)
+        return ddpg_feedback(train_ddpg(config), config)
+    return linear_feedback()
+
+
+def _stability_panels(name: str) -> Group:
+    """Return one labelled heatmap per χ set for controller ``name``."""
+    controller = _controller(name)
+    panels = Group()
+    for pair in STABILITY_SETS:
+        result = stability_map(
+            controller,
+            pair,
+            resolution=RESOLUTION,
+            t_final=T_FINAL,
+            criterion=CRITERIA[name],
+        )
+        a_label, b_label = result.labels
+        heatmap = Heatmap(
+            result.stable(EPSILON).astype(float),
+            x_range=(result.a_values[0], result.a_values[-1]),
+            y_range=(result.b_values[0], result.b_values[-1]),
+            x_length=2.1,
+            y_length=2.1,
+            colors=(UNSTABLE_COLOR, STABLE_COLOR),
+            vmin=0.0,
+            vmax=1.0,
+        )
+        x_label = MathTex(_tex(a_label), font_size=22).next_to(heatmap.axes, DOWN, buff=0.1)
+        y_label = MathTex(_tex(b_label), font_size=22).next_to(heatmap.axes, LEFT, buff=0.1)
+        set_label = MathTex(
+            rf"\chi_{{{_tex(a_label)}{_tex(b_label)}}}:\ {100 * result.stable_rate(EPSILON):.1f}\%",
+            font_size=22,
+            color=YELLOW,
+        ).next_to(heatmap.axes, UP, buff=0.1)
+        panels.add(Group(heatmap, x_label, y_label, set_label))
+
+    panels.arrange_in_grid(rows=1, cols=4, buff=0.45)
+    panels.scale_to_fit_width(min(panels.width, 13.0))
+    return panels
+
+
+class StabilitySlide(Slide):
+    """Regions of stability of the LQR, GPS and DDPG controllers over the χ sets."""
+
+    def construct(self):
+        title = Text("Análisis de estabilidad", font_size=42, color=YELLOW)
+        title.to_edge(UP, buff=0.5)
+        self.play(FadeIn(title))
+        self.wait(0.5)
+        self.next_slide()
+
+        # === CRITERION ===
+        criterion_label = Text("Criterio de estabilidad", font_size=28, color=BLUE)
+        criterion_eq = MathTex(
+            r"\left\|[" + ", ".join(_tex(label) for label in CRITERIA["linear"]) + r"]^{\top}"
+            rf"(t={T_FINAL:g})\right\|_{{\infty}} < \epsilon = {EPSILON}",
+            font_size=30,
+        )
+        criterion_desc = Text(
+            "LQR, GPS y DDPG sobre el modelo no lineal",
+            font_size=20,
+            color=GRAY_B,
+        )
+        criterion_group = VGroup(criterion_label, criterion_eq, criterion_desc).arrange(DOWN, buff=0.25)
+        criterion_box = RoundedRectangle(
+            corner_radius=0.2,
+            width=criterion_group.width + 0.8,
+            height=criterion_group.height + 0.5,
+            color=GRAY,
+            fill_opacity=0.15,
+            stroke_width=1,
+        )
+        criterion_box.move_to(criterion_group)
+        criterion_complete = VGroup(criterion_box, criterion_group)
+
+        self.play(FadeIn(criterion_complete))
+        self.wait(0.5)
+        self.next_slide()
+
+        self.play(criterion_complete.animate.scale(0.6).next_to(title, DOWN, buff=0.2))
+        self.wait(0.3)
+
+        # === STABILITY MAPS (one row per controller) ===
+        legend = VGroup(
+            VGroup(Square(0.25, fill_color=STABLE_COLOR, fill_opacity=1, stroke_width=0),
+                   Text("estable", font_size=18)).arrange(RIGHT, buff=0.15),
+            VGroup(Square(0.25, fill_color=UNSTABLE_COLOR, fill_opacity=1, stroke_width=0),
+                   Text("inestable", font_size=18)).arrange(RIGHT, buff=0.15),
+        ).arrange(RIGHT, buff=0.6)
+        legend.to_edge(DOWN, buff=0.8)
+        note = Text(
+            f"{RESOLUTION}×{RESOLUTION} condiciones iniciales por conjunto",
+            font_size=18,
+            color=GRAY_B,
+        ).next_to(legend, DOWN, buff=0.2)
+
+        heading, panels = None, None
+        for name, description in CONTROLLERS:
+            new_heading = Text(description, font_size=24, color=BLUE)
+            new_heading.next_to(criterion_complete, DOWN, buff=0.3)
+            new_panels = _stability_panels(name).next_to(new_heading, DOWN, buff=0.3)
+            if panels is None:
+                self.play(FadeIn(new_heading))
+                for panel in new_panels:
+                    self.play(FadeIn(panel), run_time=0.6)
+                self.play(FadeIn(legend), FadeIn(note))
+            else:
+                self.play(FadeOut(panels), FadeOut(heading), FadeIn(new_heading), FadeIn(new_panels))
+            heading, panels = new_heading, new_panels
+            self.wait(0.5)
+            self.next_slide()
+
+        # Final wait
+        self.wait(1)
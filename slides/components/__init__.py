@@ -0,0 +1,9 @@
+"""
+Reusable Manim building blocks shared by several slide scenes.
+
+Like ``engines``, the package is imported as ``components.<module>`` from a
+scene file because Manim puts ``slides/`` on ``sys.path``.
+
+Example:
+    from components.numeric_cell import NumericCell
+"""
@@ -0,0 +1,139 @@
+"""
+Scene checkpoints at section boundaries, to resume a long ``construct()``.
+
+A scene lists its sections (methods that end with ``next_slide()``) in
+``sections`` and inherits ``construct()`` from ``SectionCheckpoints``. With
+``SLIDES_CHECKPOINTS=1`` the scene state is pickled (gzip) after every
+section: the mobjects on screen, the camera (moving frame or 3D angles),
+the manim-slides slide counter and the attributes named in ``shared``.
+Sections exchange state only through those attributes.
+
+Each checkpoint is keyed by the source of the scene file with the later
+sections cut out, so editing section ``k`` keeps the checkpoints of the
+sections before it valid. The next run restores the latest valid checkpoint
+and starts at the first edited section, without re-running (or re-typesetting)
+the earlier ones. The output then holds only the later slides: checkpoints
+are for iterating on a section; a full render runs with them disabled.
+
+Example:
+    class ILQRSlide(SectionCheckpoints, Slide):
+        sections = ("_title", "_backward_pass")
+
+    SLIDES_CHECKPOINTS=1 uv run manim-slides render slides/13_ilqr.py ILQRSlide
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import inspect
+import os
+import pickle
+import warnings
+from pathlib import Path
+
+CHECKPOINT_ENV = "SLIDES_CHECKPOINTS"
+# Same location as the engines' array cache (``SLIDES_CACHE_DIR``).
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "slides"
+CAMERA_VALUES = ("phi", "theta", "gamma", "zoom", "focal_distance")
+
+
+def checkpoint_dir(scene_name: str) -> Path:
+    """Return the folder holding the checkpoints of one scene."""
+    return Path(os.environ.get("SLIDES_CACHE_DIR", DEFAULT_CACHE_DIR)) / "checkpoints" / scene_name
+
+
+def section_keys(scene_class: type) -> list[str]:
+    """Return one key per section: the scene file's source without the sections after it."""
+    source = Path(inspect.getfile(scene_class)).read_text(encoding="utf-8")
+    bodies = [inspect.getsource(getattr(scene_class, name)) for name in scene_class.sections]
+    keys = []
+    for index in range(len(bodies)):
+        text = source
+        for later in bodies[index + 1 :]:
+            text = text.replace(later, "")
+        keys.append(hashlib.sha1(text.encode()).hexdigest()[:16])
+    return keys
+
+
+def camera_state(camera) -> dict:
+    """Return the frame mobject of a moving camera and the angles of a 3D camera."""
+    state = {"frame": getattr(camera, "frame", None)}
+    for name in CAMERA_VALUES:
+        getter = getattr(camera, f"get_{name}", None)
+        if getter is not None:
+            state[name] = getter()
+    state["fixed_in_frame"] = list(getattr(camera, "fixed_in_frame_mobjects", ()))
+    return state
+
+
+def restore_camera(camera, state: dict) -> None:
+    if state["frame"] is not None:
+        camera.frame.become(state["frame"])
+    for name in CAMERA_VALUES:
+        if name in state:
+            getattr(camera, f"set_{name}")(state[name])
+    if state["fixed_in_frame"]:
+        camera.add_fixed_in_frame_mobjects(*state["fixed_in_frame"])
+
+
+class SectionCheckpoints:
+    """Mixin running ``construct()`` as ``sections`` with optional on-disk checkpoints."""
+
+    sections: tuple[str, ...] = ()
+    shared: tuple[str, ...] = ()
+
+    def construct(self):
+        enabled = os.environ.get(CHECKPOINT_ENV) == "1"
+        keys = section_keys(type(self)) if enabled else []
+        start = self.restore_checkpoint(keys) if enabled else 0
+        for index in range(start, len(self.sections)):
+            getattr(self, self.sections[index])()
+            # The last section always runs, so there is no point in saving after it.
+            if enabled and index < len(self.sections) - 1:
+                enabled = self.save_checkpoint(index, keys[index])
+
+    def _checkpoint_path(self, index: int, key: str) -> Path:
+        return checkpoint_dir(type(self).__name__) / f"{index:02d}-{key}.pkl.gz"
+
+    def save_checkpoint(self, index: int, key: str) -> bool:
+        """Pickle the scene state after section ``index``; return ``False`` if it cannot be pickled."""
+        state = {
+            "mobjects": list(self.mobjects),
+            "camera": camera_state(self.camera),
+            "slide": getattr(self, "_current_slide", None),
+            "shared": {name: getattr(self, name) for name in self.shared},
+        }
+        try:
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            # Updaters defined as lambdas or closures cannot be pickled.
+            warnings.warn(f"{type(self).__name__}: no checkpoint after {self.sections[index]} ({error})")
+            return False
+        path = self._checkpoint_path(index, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in path.parent.glob(f"{index:02d}-*.pkl.gz"):
+            stale.unlink()
+        partial = path.with_suffix(".tmp")
+        partial.write_bytes(gzip.compress(data, compresslevel=1))
+        os.replace(partial, path)
+        return True
+
+    def restore_checkpoint(self, keys: list[str]) -> int:
+        """Restore the latest checkpoint matching ``keys``; return the section to start from."""
+        for index in reversed(range(len(keys) - 1)):
+            path = self._checkpoint_path(index, keys[index])
+            if not path.exists():
+                continue
+            try:
+                state = pickle.loads(gzip.decompress(path.read_bytes()))
+            except (OSError, EOFError, pickle.UnpicklingError):
+                continue
+            self.add(*state["mobjects"])
+            restore_camera(self.camera, state["camera"])
+            if state["slide"] is not None:
+                self._current_slide = state["slide"]
+            for name, value in state["shared"].items():
+                setattr(self, name, value)
+            return index + 1
+        return 0
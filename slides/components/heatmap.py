@@ -0,0 +1,100 @@
+"""
+Raster heatmaps aligned to vector axes.
+
+A grid of values is mapped through a piecewise-linear colormap in NumPy and
+shown as one ``ImageMobject`` (nearest-neighbour sampling, so cells stay
+sharp at any resolution) stretched over the data range of an ``Axes``. This
+keeps a 200×200 map at a single mobject instead of 40 000 squares.
+
+Contour lines are vector overlays: all segments of a level go into one
+``VMobject`` as separate subpaths.
+
+Example:
+    heatmap = Heatmap(values, x_range=(-1, 1), y_range=(-2, 2), colors=(RED_E, BLUE_D))
+    heatmap.add_contours(segments, color=WHITE)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from manim import BLUE_E, GRAY_B, GREEN, WHITE, YELLOW, Axes, Group, ImageMobject, VMobject, color_to_rgb
+from manim.utils.images import RESAMPLING_ALGORITHMS
+
+from .plots import axes_points
+
+
+def apply_colormap(
+    values: np.ndarray,
+    colors=(BLUE_E, GREEN, YELLOW),
+    vmin: float | None = None,
+    vmax: float | None = None,
+) -> np.ndarray:
+    """Return an RGBA ``uint8`` image of ``values`` through evenly spaced color stops.
+
+    Non-finite values are transparent.
+    """
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values)
+    vmin = np.min(values[finite]) if vmin is None else vmin
+    vmax = np.max(values[finite]) if vmax is None else vmax
+    scaled = np.clip((values - vmin) / max(vmax - vmin, 1e-12), 0.0, 1.0)
+    scaled = np.where(finite, scaled, 0.0)
+
+    stops = np.array([color_to_rgb(color) for color in colors])
+    position = scaled * (len(stops) - 1)
+    lower = np.minimum(position.astype(int), len(stops) - 2)
+    weight = (position - lower)[..., None]
+    rgb = (1.0 - weight) * stops[lower] + weight * stops[lower + 1]
+
+    image = np.empty(values.shape + (4,), dtype=np.uint8)
+    image[..., :3] = np.round(rgb * 255.0)
+    image[..., 3] = np.where(finite, 255, 0)
+    return image
+
+
+class Heatmap(Group):
+    """``Axes`` plus an image of ``values[i, j]`` at (x_j, y_i), row 0 at the bottom."""
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        x_range: tuple[float, float],
+        y_range: tuple[float, float],
+        x_length: float = 4.0,
+        y_length: float = 4.0,
+        colors=(BLUE_E, GREEN, YELLOW),
+        vmin: float | None = None,
+        vmax: float | None = None,
+        axis_config: dict | None = None,
+        **kwargs,
+    ):
+        x_min, x_max = x_range
+        y_min, y_max = y_range
+        self.axes = Axes(
+            x_range=[x_min, x_max, (x_max - x_min) / 2],
+            y_range=[y_min, y_max, (y_max - y_min) / 2],
+            x_length=x_length,
+            y_length=y_length,
+            tips=False,
+            axis_config=axis_config or {"color": GRAY_B, "stroke_width": 1, "include_numbers": False},
+        )
+
+        # Image rows run top to bottom, data rows bottom to top.
+        self.image = ImageMobject(apply_colormap(values, colors, vmin, vmax)[::-1])
+        self.image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        self.image.stretch_to_fit_width(x_length)
+        self.image.stretch_to_fit_height(y_length)
+        self.image.move_to(self.axes.c2p((x_min + x_max) / 2, (y_min + y_max) / 2))
+
+        super().__init__(self.image, self.axes, **kwargs)
+
+    def add_contours(self, segments: np.ndarray, color=WHITE, stroke_width: float = 1.5, **style) -> VMobject:
+        """Add and return the ``(n, 2, 2)`` data-space segments as one ``VMobject``."""
+        start = axes_points(self.axes, segments[:, 0, 0], segments[:, 0, 1])
+        end = axes_points(self.axes, segments[:, 1, 0], segments[:, 1, 1])
+        # Straight cubic Béziers: anchors at the ends, handles at thirds.
+        points = np.stack([start, (2 * start + end) / 3, (start + 2 * end) / 3, end], axis=1)
+        contour = VMobject(color=color, stroke_width=stroke_width, **style)
+        contour.set_points(points.reshape(-1, 3))
+        self.add(contour)
+        return contour
@@ -0,0 +1,131 @@
+"""
+Numeric table cells whose digits are laid out by Pango only once.
+
+``Text(f"{value:.2f}")`` runs a full Pango layout for every new value. Tables
+that update dozens of cells (the TicTacToe Q-table, value-iteration grids)
+pay that cost on every change. ``GlyphAtlas`` lays out the characters
+``0-9 . - +`` once per font configuration and keeps their outlines;
+``NumericCell`` owns a fixed number of character slots and swaps glyph
+outlines into them, so updating or recoloring a value only copies points.
+
+Example:
+    cell = NumericCell(0.0, font_size=16)
+    self.play(cell.transform_to(0.3, color=GREEN))
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from manim import NORMAL, RIGHT, UP, WHITE, Text, Transform, VectorizedPoint, VGroup, VMobject
+
+
+class GlyphAtlas:
+    """Glyph outlines of one font configuration, laid out in a single Pango call."""
+
+    CHARACTERS = "0123456789.-+"
+
+    _atlases: dict[tuple, "GlyphAtlas"] = {}
+
+    def __init__(self, font_size: float, font: str = "", weight: str = NORMAL):
+        layout = Text(self.CHARACTERS, font_size=font_size, font=font, weight=weight)
+        glyphs = dict(zip(self.CHARACTERS, layout.submobjects))
+
+        self.height = glyphs["0"].height
+        self.advance = max(glyph.width for glyph in glyphs.values()) * 1.15
+        baseline = glyphs["0"].get_bottom()[1]
+
+        # Templates are centered horizontally on x = 0 with the baseline at y = 0.
+        self._templates: dict[str, VMobject] = {}
+        for char, glyph in glyphs.items():
+            template = glyph.copy()
+            template.move_to([0.0, glyph.get_center()[1] - baseline, 0.0])
+            self._templates[char] = template
+
+    @classmethod
+    def get(cls, font_size: float, font: str = "", weight: str = NORMAL) -> "GlyphAtlas":
+        """Return the shared atlas for a font configuration, building it on first use."""
+        key = (font_size, font, weight)
+        if key not in cls._atlases:
+            cls._atlases[key] = cls(font_size, font, weight)
+        return cls._atlases[key]
+
+    def glyph(self, char: str) -> VMobject:
+        """Return a fresh copy of the outline for ``char``."""
+        if char not in self._templates:
+            raise ValueError(f"GlyphAtlas has no glyph for {char!r}")
+        return self._templates[char].copy()
+
+
+class NumericCell(VGroup):
+    """Fixed-width number display built from ``GlyphAtlas`` outlines.
+
+    The first two submobjects are invisible reference points (the cell center
+    and a point one advance to its right) so the layout follows any later
+    ``move_to``/``scale`` of the cell. The remaining ``slots`` submobjects
+    hold one glyph each.
+    """
+
+    def __init__(
+        self,
+        value: float = 0.0,
+        fmt: str = "{:.2f}",
+        slots: int = 5,
+        font_size: float = 16,
+        color=WHITE,
+        placeholder: str = "---",
+        font: str = "",
+        weight: str = NORMAL,
+        **kwargs,
+    ):
+        self.atlas = GlyphAtlas.get(font_size, font, weight)
+        self.fmt = fmt
+        self.placeholder = placeholder
+        self.n_slots = slots
+        self.value = value
+
+        self.center_point = VectorizedPoint(np.zeros(3))
+        self.advance_point = VectorizedPoint(RIGHT * self.atlas.advance)
+        self.slots = [VectorizedPoint(np.zeros(3)) for _ in range(slots)]
+        super().__init__(self.center_point, self.advance_point, *self.slots, **kwargs)
+        self.set_value(value, color)
+
+    def text_for(self, value: float) -> str:
+        """Return the string shown for ``value`` (the placeholder for ``nan``/``inf``)."""
+        if value is None or not np.isfinite(value):
+            return self.placeholder
+        return self.fmt.format(value)
+
+    def set_value(self, value: float, color=None) -> "NumericCell":
+        """Show ``value`` in place by swapping glyph outlines into the slots."""
+        text = self.text_for(value)
+        if len(text) > self.n_slots:
+            raise ValueError(f"{text!r} does not fit in {self.n_slots} slots")
+
+        center = self.center_point.get_center()
+        scale = np.linalg.norm(self.advance_point.get_center() - center) / self.atlas.advance
+        advance = self.atlas.advance * scale
+        left = center - RIGHT * advance * len(text) / 2
+        baseline = center - UP * self.atlas.height * scale / 2
+
+        for index, slot in enumerate(self.slots):
+            if index < len(text):
+                glyph = self.atlas.glyph(text[index]).scale(scale, about_point=np.zeros(3))
+                glyph.shift(RIGHT * (left[0] + advance * (index + 0.5)) + UP * baseline[1])
+            else:
+                glyph = VectorizedPoint(center)
+            slot.become(glyph)
+
+        self.value = value
+        if color is not None:
+            self.set_color(color)
+        return self
+
+    def target(self, value: float, color=None) -> "NumericCell":
+        """Return a copy showing ``value``, ready to be used in ``Transform``."""
+        return self.copy().set_value(value, color)
+
+    def transform_to(self, value: float, color=None, **kwargs) -> Transform:
+        """Return a ``Transform`` to ``value`` and record it as the shown value."""
+        animation = Transform(self, self.target(value, color), **kwargs)
+        self.value = value
+        return animation
@@ -0,0 +1,106 @@
+"""
+Phase portraits: a direction field and streamlines over ``SeriesPlot`` axes.
+
+The direction field is one ``VMobject``: every arrow (shaft and two head
+strokes) is a set of subpaths, normalized to a fixed on-screen length after
+mapping the vectors through the axes, so stiff planes whose rates dwarf the
+coordinate still show readable directions. Streamlines come precomputed
+(``engines.phase``) with NaN past their end and are one ``VMobject`` each,
+so ``Create(..., lag_ratio=0)`` or ``ShowPassingFlash`` animates all of them
+together without integrating anything at render time.
+
+Example:
+    plot = PhasePlot(*field.ranges)
+    plot.add_field(field.x_values, field.y_values, field.vectors)
+    lines = plot.add_streamlines(field.lines)
+    self.play(Create(lines, lag_ratio=0))
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from manim import BLUE_B, GRAY_B, YELLOW, VGroup, VMobject
+
+from .plots import SeriesPlot, axes_points
+
+
+# Arrow length as a fraction of the grid spacing on screen.
+ARROW_FILL = 0.7
+# Head strokes as a fraction of the arrow length, and their angle to the shaft.
+HEAD_FRACTION = 0.35
+HEAD_ANGLE = np.pi / 7
+
+
+def _segments(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Return straight cubic Béziers ``(n * 4, 3)`` from ``start[i]`` to ``end[i]``."""
+    return np.stack([start, (2 * start + end) / 3, (start + 2 * end) / 3, end], axis=1).reshape(-1, 3)
+
+
+class PhasePlot(SeriesPlot):
+    """``SeriesPlot`` with a direction field and streamlines in (coordinate, rate) axes."""
+
+    def add_field(
+        self,
+        x_values: np.ndarray,
+        y_values: np.ndarray,
+        vectors: np.ndarray,
+        color=GRAY_B,
+        stroke_width: float = 1.5,
+        **style,
+    ) -> VMobject:
+        """Add and return arrows for ``vectors`` ``(ny, nx, 2)`` sampled at ``(x_values, y_values)``."""
+        x_grid, y_grid = np.meshgrid(x_values, y_values)
+        tails = axes_points(self.axes, x_grid.ravel(), y_grid.ravel())
+        origin = axes_points(self.axes, [0.0], [0.0])[0]
+        directions = axes_points(self.axes, vectors[..., 0].ravel(), vectors[..., 1].ravel()) - origin
+        norms = np.linalg.norm(directions, axis=1, keepdims=True)
+        moving = norms[:, 0] > 1e-12
+
+        spacing = min(
+            self.axes.x_length / max(len(x_values) - 1, 1),
+            self.axes.y_length / max(len(y_values) - 1, 1),
+        )
+        length = ARROW_FILL * spacing
+        unit = directions[moving] / norms[moving]
+        # Center each arrow on its grid point.
+        start = tails[moving] - 0.5 * length * unit
+        tip = start + length * unit
+
+        cos, sin = np.cos(HEAD_ANGLE), np.sin(HEAD_ANGLE)
+        back = -HEAD_FRACTION * length * unit
+        left = np.stack([cos * back[:, 0] - sin * back[:, 1], sin * back[:, 0] + cos * back[:, 1], back[:, 2]], axis=1)
+        right = np.stack([cos * back[:, 0] + sin * back[:, 1], -sin * back[:, 0] + cos * back[:, 1], back[:, 2]], axis=1)
+
+        field = VMobject(color=color, stroke_width=stroke_width, **style)
+        field.set_points(
+            np.concatenate([_segments(start, tip), _segments(tip, tip + left), _segments(tip, tip + right)])
+        )
+        self.curves.add(field)
+        return field
+
+    def add_streamlines(
+        self,
+        lines: np.ndarray,
+        colors=(BLUE_B, YELLOW),
+        stroke_width: float = 2.0,
+        **style,
+    ) -> VGroup:
+        """Add and return one curve per row of ``lines`` ``(n, T, 2)``, each cut at its first NaN.
+
+        Rows are colored along a gradient of ``colors``; the budget applies per row.
+        """
+        self._check_budget(lines.shape[1])
+        streams = VGroup()
+        for line in lines:
+            finite = np.isfinite(line).all(axis=1)
+            end = len(line) if finite.all() else int(np.argmin(finite))
+            if end < 2:
+                continue
+            curve = VMobject(stroke_width=stroke_width, **style)
+            curve.set_points_as_corners(axes_points(self.axes, line[:end, 0], line[:end, 1]))
+            streams.add(curve)
+        if len(streams):
+            streams.set_color_by_gradient(*colors)
+        self.curves.add(streams)
+        return streams
+
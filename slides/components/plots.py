@@ -0,0 +1,131 @@
+"""
+Vector line plots of result series.
+
+Each curve is a single ``VMobject`` whose corners are set from the whole
+point array at once through the affine map of the (linear) axes. Series are expected to be
+downsampled to a vertex budget first (``engines.series.downsample``), so
+curves stay crisp at any resolution, ``Create`` draws them progressively,
+and the per-frame cost does not grow with the log length.
+
+Example:
+    plot = SeriesPlot(x_range=(0, 10), y_range=(-1, 1))
+    curve = plot.add_series(*downsample(t, phi, VERTEX_BUDGET), color=BLUE)
+    self.play(Create(curve))
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from manim import BLUE, GRAY_B, Axes, Polygon, VGroup, VMobject
+
+
+# Points per curve; a 1080p plot a few inches wide cannot show more.
+VERTEX_BUDGET = 400
+
+
+def axes_points(axes: Axes, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Return the scene points ``(n, 3)`` of data coordinates ``(x, y)`` in linear ``axes``."""
+    origin = np.asarray(axes.c2p(0.0, 0.0))
+    x_unit = np.asarray(axes.c2p(1.0, 0.0)) - origin
+    y_unit = np.asarray(axes.c2p(0.0, 1.0)) - origin
+    return origin + np.outer(np.asarray(x, dtype=float), x_unit) + np.outer(np.asarray(y, dtype=float), y_unit)
+
+
+def line_graph(axes: Axes, x: np.ndarray, y: np.ndarray, **style) -> VMobject:
+    """Return a polyline through ``(x, y)`` in ``axes`` coordinates."""
+    points = axes_points(axes, x, y)
+    curve = VMobject(**style)
+    curve.set_points_as_corners(points)
+    return curve
+
+
+def polyline_fan(axes: Axes, x: np.ndarray, ys: np.ndarray, **style) -> VMobject:
+    """Return every row of ``ys`` ``(n, T)`` against ``x`` ``(T,)`` as subpaths of one ``VMobject``.
+
+    A fan of hundreds of curves is then a single mobject: one family to
+    update and one path to stroke per frame.
+    """
+    ys = np.asarray(ys, dtype=float)
+    points = axes_points(axes, np.tile(x, len(ys)), ys.ravel()).reshape(len(ys), len(x), 3)
+    start, end = points[:, :-1], points[:, 1:]
+    # Straight cubic Béziers; consecutive rows do not touch, so each row is its own subpath.
+    curves = np.stack([start, (2 * start + end) / 3, (start + 2 * end) / 3, end], axis=2)
+    fan = VMobject(**style)
+    fan.set_points(curves.reshape(-1, 3))
+    return fan
+
+
+class SeriesPlot(VGroup):
+    """``Axes`` plus a ``curves`` group filled by ``add_series``."""
+
+    def __init__(
+        self,
+        x_range: tuple[float, float],
+        y_range: tuple[float, float],
+        x_length: float = 5.0,
+        y_length: float = 2.5,
+        axis_config: dict | None = None,
+        **kwargs,
+    ):
+        x_min, x_max = x_range
+        y_min, y_max = y_range
+        self.axes = Axes(
+            x_range=[x_min, x_max, (x_max - x_min) / 4],
+            y_range=[y_min, y_max, (y_max - y_min) / 2],
+            x_length=x_length,
+            y_length=y_length,
+            tips=False,
+            axis_config=axis_config or {"color": GRAY_B, "stroke_width": 1, "include_numbers": True, "font_size": 16},
+        )
+        self.curves = VGroup()
+        super().__init__(self.axes, self.curves, **kwargs)
+
+    def _check_budget(self, n_points: int) -> None:
+        if n_points > VERTEX_BUDGET:
+            raise ValueError(f"{n_points} points exceed the vertex budget of {VERTEX_BUDGET}")
+
+    def add_series(self, x: np.ndarray, y: np.ndarray, color=BLUE, stroke_width: float = 2.0, **style) -> VMobject:
+        """Add and return the curve of ``(x, y)``, clipped to the y range.
+
+        Raises ``ValueError`` past ``VERTEX_BUDGET`` points; downsample first.
+        """
+        self._check_budget(len(x))
+        y = np.clip(y, self.axes.y_range[0], self.axes.y_range[1])
+        curve = line_graph(self.axes, x, y, color=color, stroke_width=stroke_width, **style)
+        self.curves.add(curve)
+        return curve
+
+    def add_fan(self, x: np.ndarray, ys: np.ndarray, color=BLUE, stroke_width: float = 1.0, **style) -> VMobject:
+        """Add and return the rows of ``ys`` as one fan, clipped to the y range.
+
+        The budget applies per row: ``x`` may hold at most ``VERTEX_BUDGET`` points.
+        """
+        self._check_budget(len(x))
+        ys = np.clip(ys, self.axes.y_range[0], self.axes.y_range[1])
+        fan = polyline_fan(self.axes, x, ys, color=color, stroke_width=stroke_width, **style)
+        self.curves.add(fan)
+        return fan
+
+    def add_band(
+        self,
+        x: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        color=BLUE,
+        fill_opacity: float = 0.25,
+    ) -> Polygon:
+        """Add and return the filled region between ``lower`` and ``upper`` (e.g. mean ± std)."""
+        self._check_budget(len(x))
+        y_min, y_max = self.axes.y_range[:2]
+        upper_points = axes_points(self.axes, x, np.clip(upper, y_min, y_max))
+        lower_points = axes_points(self.axes, x, np.clip(lower, y_min, y_max))
+        band = Polygon(
+            *upper_points,
+            *lower_points[::-1],
+            color=color,
+            fill_color=color,
+            fill_opacity=fill_opacity,
+            stroke_width=0,
+        )
+        self.curves.add(band)
+        return band
@@ -0,0 +1,78 @@
+"""
+Retire mobjects that can no longer be seen, so frame cost does not grow.
+
+A mobject faded with ``.animate.set_opacity(0)`` or moved off-screen stays
+in ``scene.mobjects``, and every later frame still walks and rasterizes its
+family. ``hidden_mobjects`` finds the top-level mobjects whose drawable
+family members are all fully transparent, or whose bounding box lies
+entirely outside the camera frame (2D cameras only: a 3D projection does
+not map bounding boxes to the frame). Only mobjects drawn entirely by
+``VMobject`` parts are considered; mobjects with updaters, images, point
+clouds and value trackers (which keep their value in ``points``) are never
+reported.
+
+``RetireHidden`` is an opt-in mixin that removes them at every
+``next_slide()``. A retired mobject that a later ``play`` animates comes
+back, since ``play`` re-adds animated mobjects, but it is then drawn on top.
+A mobject made visible again without an animation stays retired.
+
+Example:
+    class QLearningSlide(RetireHidden, Slide):
+        ...
+"""
+
+from __future__ import annotations
+
+from manim import VMobject
+
+
+def family_size(mobjects) -> int:
+    """Return the number of mobjects in the families of ``mobjects``."""
+    return sum(len(mobject.get_family()) for mobject in mobjects)
+
+
+def _transparent(mobject) -> bool:
+    return all(
+        part.get_fill_opacity() == 0 and part.get_stroke_opacity() == 0
+        for part in mobject.family_members_with_points()
+    )
+
+
+def _outside(mobject, camera) -> bool:
+    center = camera.frame_center
+    half_width, half_height = camera.frame_width / 2, camera.frame_height / 2
+    return (
+        mobject.get_right()[0] < center[0] - half_width
+        or mobject.get_left()[0] > center[0] + half_width
+        or mobject.get_top()[1] < center[1] - half_height
+        or mobject.get_bottom()[1] > center[1] + half_height
+    )
+
+
+def _retirable(mobject) -> bool:
+    drawn = mobject.family_members_with_points()
+    return (
+        bool(drawn)
+        and all(isinstance(part, VMobject) for part in drawn)
+        and not any(part.updaters for part in mobject.get_family())
+    )
+
+
+def hidden_mobjects(scene) -> list:
+    """Return the top-level mobjects of ``scene`` that draw nothing inside the frame."""
+    flat = not hasattr(scene.camera, "get_phi")
+    return [
+        mobject
+        for mobject in scene.mobjects
+        if _retirable(mobject) and (_transparent(mobject) or (flat and _outside(mobject, scene.camera)))
+    ]
+
+
+class RetireHidden:
+    """Mixin removing hidden mobjects from the scene at every ``next_slide()``."""
+
+    def next_slide(self, *args, **kwargs):
+        hidden = hidden_mobjects(self)
+        if hidden:
+            self.remove(*hidden)
+        return super().next_slide(*args, **kwargs)
@@ -0,0 +1,14 @@
+"""
+Numerical backends that feed data to the slide scenes.
+
+Scenes render what these modules compute (controllability ranks, LQR gains,
+closed-loop trajectories, ...) instead of hard-coding numbers. Results are
+stored in an on-disk cache so repeated renders do not recompute them.
+
+Manim adds ``slides/`` to ``sys.path`` when it loads a scene file, so scenes
+import the backends as ``engines.<module>``; tests import them as
+``slides.engines.<module>``.
+
+Example:
+    from engines.control import controllability
+"""
@@ -0,0 +1,108 @@
+"""
+On-disk cache for arrays computed by the slide backends.
+
+Entries are ``.npz`` archives keyed by a digest of the inputs that produced
+them, grouped by namespace under ``.cache/slides`` (override with the
+``SLIDES_CACHE_DIR`` environment variable). A per-process memo avoids
+re-reading the same archive several times within one render.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable, Mapping
+
+import numpy as np
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "slides"
+
+_MEMO: dict[tuple[str, str], dict[str, np.ndarray]] = {}
+
+
+def cache_dir() -> Path:
+    """Return the root directory of the on-disk cache."""
+    return Path(os.environ.get("SLIDES_CACHE_DIR", DEFAULT_CACHE_DIR))
+
+
+def digest(*parts) -> str:
+    """Return a stable hex digest for arrays, scalars, dataclasses and nested tuples."""
+    hasher = hashlib.sha1()
+
+    def feed(part) -> None:
+        if isinstance(part, np.ndarray):
+            array = np.ascontiguousarray(part)
+            hasher.update(f"nd:{array.dtype.str}:{array.shape}".encode())
+            hasher.update(array.tobytes())
+        elif isinstance(part, (tuple, list)):
+            hasher.update(f"seq:{len(part)}".encode())
+            for item in part:
+                feed(item)
+        elif dataclasses.is_dataclass(part) and not isinstance(part, type):
+            hasher.update(f"dc:{type(part).__qualname__}".encode())
+            for field in dataclasses.fields(part):
+                feed(field.name)
+                feed(getattr(part, field.name))
+        elif isinstance(part, Mapping):
+            hasher.update(f"map:{len(part)}".encode())
+            for key in sorted(part):
+                feed(key)
+                feed(part[key])
+        else:
+            hasher.update(f"{type(part).__name__}:{part!r}".encode())
+
+    for part in parts:
+        feed(part)
+    return hasher.hexdigest()
+
+
+def load(namespace: str, key: str) -> dict[str, np.ndarray] | None:
+    """Return a cached entry, or ``None`` when it has not been computed yet."""
+    memo_key = (namespace, key)
+    if memo_key in _MEMO:
+        return _MEMO[memo_key]
+
+    path = cache_dir() / namespace / f"{key}.npz"
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+    except (OSError, ValueError):
+        # A truncated archive (e.g. an interrupted render) is recomputed.
+        return None
+    _MEMO[memo_key] = arrays
+    return arrays
+
+
+def store(namespace: str, key: str, arrays: Mapping[str, np.ndarray]) -> None:
+    """Write an entry atomically so concurrent renders never see partial files."""
+    arrays = {name: np.asarray(value) for name, value in arrays.items()}
+    folder = cache_dir() / namespace
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{key}.npz"
+    tmp_path = folder / f".{key}.{os.getpid()}.tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+    _MEMO[(namespace, key)] = arrays
+
+
+def cached_arrays(
+    namespace: str,
+    key: str,
+    compute: Callable[[], Mapping[str, np.ndarray]],
+) -> dict[str, np.ndarray]:
+    """Return the cached entry for ``key``, computing and storing it on a miss."""
+    arrays = load(namespace, key)
+    if arrays is None:
+        store(namespace, key, compute())
+        arrays = _MEMO[(namespace, key)]
+    return arrays
+
+
+def clear_memo() -> None:
+    """Forget entries loaded in this process (the files on disk are kept)."""
+    _MEMO.clear()
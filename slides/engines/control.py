@@ -0,0 +1,234 @@
+"""
+Control-theory backend for the controllability and stabilization slides.
+
+Builds the Kalman controllability matrix R(A, B) with its rank and singular
+values, solves the continuous and discrete algebraic Riccati equations for
+the LQR gain K (u = -Kx), and simulates the closed loop for a whole batch of
+initial conditions at once. Designs are cached on disk keyed by (A, B, Q, R).
+
+Example:
+    from engines.control import controllability, lqr_design
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import cache
+
+
+_NAMESPACE = "control"
+
+
+@dataclass(frozen=True)
+class ControllabilityReport:
+    """Controllability matrix of a pair (A, B) and its numerical rank."""
+
+    matrix: np.ndarray
+    rank: int
+    singular_values: np.ndarray
+
+    @property
+    def n_states(self) -> int:
+        return self.matrix.shape[0]
+
+    @property
+    def controllable(self) -> bool:
+        return self.rank == self.n_states
+
+
+@dataclass(frozen=True)
+class LQRDesign:
+    """LQR gain, Riccati solution and a batch of closed-loop trajectories."""
+
+    K: np.ndarray
+    X: np.ndarray
+    poles: np.ndarray
+    times: np.ndarray
+    states: np.ndarray
+    inputs: np.ndarray
+
+
+def controllability_matrix(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Return R(A, B) = [B, AB, ..., A^(n-1) B]."""
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    blocks = [B]
+    for _ in range(A.shape[0] - 1):
+        blocks.append(A @ blocks[-1])
+    return np.hstack(blocks)
+
+
+def controllability(
+    A: np.ndarray, B: np.ndarray, tol: float | None = None
+) -> ControllabilityReport:
+    """Return the controllability matrix with its rank and singular values."""
+    matrix = controllability_matrix(A, B)
+    singular_values = np.linalg.svd(matrix, compute_uv=False)
+    if tol is None:
+        tol = singular_values.max(initial=0.0) * max(matrix.shape) * np.finfo(float).eps
+    rank = int(np.count_nonzero(singular_values > tol))
+    return ControllabilityReport(matrix, rank, singular_values)
+
+
+def expm(M: np.ndarray) -> np.ndarray:
+    """Matrix exponential by scaling and squaring of a truncated Taylor series."""
+    M = np.asarray(M, dtype=float)
+    norm = np.linalg.norm(M, ord=1)
+    squarings = max(0, int(np.ceil(np.log2(norm))) + 1) if norm > 0.5 else 0
+    scaled = M / (2.0**squarings)
+
+    result = np.eye(M.shape[0])
+    term = np.eye(M.shape[0])
+    for k in range(1, 20):
+        term = term @ scaled / k
+        result = result + term
+    for _ in range(squarings):
+        result = result @ result
+    return result
+
+
+def discretize(A: np.ndarray, B: np.ndarray, dt: float) -> tuple[np.ndarray, np.ndarray]:
+    """Return the zero-order-hold discretization ``(Ad, Bd)`` with step ``dt``."""
+    n, m = B.shape
+    augmented = np.zeros((n + m, n + m))
+    augmented[:n, :n] = A
+    augmented[:n, n:] = B
+    exponential = expm(augmented * dt)
+    return exponential[:n, :n], exponential[:n, n:]
+
+
+def solve_care(A: np.ndarray, B: np.ndarray, Q: np.ndarray, R: np.ndarray) -> np.ndarray:
+    """Solve A'X + XA - XBR⁻¹B'X + Q = 0 through the stable Hamiltonian subspace."""
+    n = A.shape[0]
+    G = B @ np.linalg.solve(R, B.T)
+    hamiltonian = np.block([[A, -G], [-Q, -A.T]])
+    eigenvalues, eigenvectors = np.linalg.eig(hamiltonian)
+    stable = eigenvalues.real < 0
+    if np.count_nonzero(stable) != n:
+        raise ValueError("The Hamiltonian has eigenvalues on the imaginary axis; (A, B) is not stabilizable.")
+    U = eigenvectors[:, stable]
+    X = np.real(U[n:] @ np.linalg.inv(U[:n]))
+    return (X + X.T) / 2.0
+
+
+def solve_dare(
+    A: np.ndarray,
+    B: np.ndarray,
+    Q: np.ndarray,
+    R: np.ndarray,
+    tol: float = 1e-12,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Solve the discrete Riccati equation with the structured doubling algorithm."""
+    n = A.shape[0]
+    identity = np.eye(n)
+    A_k = np.asarray(A, dtype=float)
+    G_k = B @ np.linalg.solve(R, B.T)
+    H_k = np.asarray(Q, dtype=float)
+    for _ in range(max_iter):
+        W = identity + G_k @ H_k
+        V_a = np.linalg.solve(W, A_k)
+        V_g = np.linalg.solve(W, G_k)
+        H_next = H_k + A_k.T @ H_k @ V_a
+        G_k = G_k + A_k @ V_g @ A_k.T
+        A_k = A_k @ V_a
+        if np.linalg.norm(H_next - H_k, ord=1) <= tol * max(1.0, np.linalg.norm(H_next, ord=1)):
+            H_k = H_next
+            break
+        H_k = H_next
+    else:
+        raise ValueError("The doubling iteration did not converge; (A, B) may not be stabilizable.")
+    return (H_k + H_k.T) / 2.0
+
+
+def lqr_gain(
+    A: np.ndarray,
+    B: np.ndarray,
+    Q: np.ndarray,
+    R: np.ndarray,
+    discrete: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(K, X)`` such that u = -Kx minimizes the quadratic cost."""
+    if discrete:
+        X = solve_dare(A, B, Q, R)
+        K = np.linalg.solve(R + B.T @ X @ B, B.T @ X @ A)
+    else:
+        X = solve_care(A, B, Q, R)
+        K = np.linalg.solve(R, B.T @ X)
+    return K, X
+
+
+def simulate_closed_loop(
+    A: np.ndarray,
+    B: np.ndarray,
+    K: np.ndarray,
+    x0s: np.ndarray,
+    dt: float,
+    steps: int,
+    discrete: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Propagate every initial condition in ``x0s`` under u = -Kx.
+
+    Returns ``(times, states, inputs)`` with shapes ``(steps + 1,)``,
+    ``(batch, steps + 1, n)`` and ``(batch, steps + 1, m)``.
+    """
+    x0s = np.atleast_2d(np.asarray(x0s, dtype=float))
+    closed = A - B @ K
+    transition = closed if discrete else expm(closed * dt)
+
+    states = np.empty((x0s.shape[0], steps + 1, x0s.shape[1]))
+    states[:, 0] = x0s
+    transition_t = transition.T
+    for step in range(steps):
+        states[:, step + 1] = states[:, step] @ transition_t
+    inputs = -states @ K.T
+    times = np.arange(steps + 1) * dt
+    return times, states, inputs
+
+
+def lqr_design(
+    A: np.ndarray,
+    B: np.ndarray,
+    Q: np.ndarray,
+    R: np.ndarray,
+    x0s: np.ndarray,
+    dt: float = 0.04,
+    steps: int = 250,
+    discrete: bool = False,
+) -> LQRDesign:
+    """Return the cached LQR design for (A, B, Q, R) and its closed-loop batch."""
+    A, B, Q, R = (np.asarray(M, dtype=float) for M in (A, B, Q, R))
+    x0s = np.atleast_2d(np.asarray(x0s, dtype=float))
+
+    gain = cache.cached_arrays(
+        _NAMESPACE,
+        "lqr-" + cache.digest(A, B, Q, R, discrete),
+        lambda: dict(zip(("K", "X"), lqr_gain(A, B, Q, R, discrete))),
+    )
+    K = gain["K"]
+
+    def rollout() -> dict[str, np.ndarray]:
+        times, states, inputs = simulate_closed_loop(A, B, K, x0s, dt, steps, discrete)
+        return {
+            "poles": np.linalg.eigvals(A - B @ K),
+            "times": times,
+            "states": states,
+            "inputs": inputs,
+        }
+
+    trajectories = cache.cached_arrays(
+        _NAMESPACE,
+        "rollout-" + cache.digest(A, B, Q, R, discrete, x0s, dt, steps),
+        rollout,
+    )
+    return LQRDesign(
+        K=K,
+        X=gain["X"],
+        poles=trajectories["poles"],
+        times=trajectories["times"],
+        states=trajectories["states"],
+        inputs=trajectories["inputs"],
+    )
@@ -0,0 +1,327 @@
+"""
+A small CPU DDPG trainer over the quadcopter hover subsystem.
+
+Everything runs in NumPy:
+- ``ReplayBuffer`` is a preallocated ring buffer stored as one array per
+  field (structure of arrays). A batch of transitions from the parallel
+  environments is written with one wrapped index assignment per field,
+  and minibatches are gathered with one fancy index per field.
+- Actor and critic are tanh MLPs with hand-written backpropagation and
+  Adam. The critic's input gradient gives ∇_u Q for the deterministic
+  policy gradient.
+- Target networks follow the soft update θ̄ ← τθ + (1 - τ)θ̄.
+
+After every epoch the trainer records the training and validation returns
+and snapshots the critic surface Q(x, μ(x)) and the actor's collective
+thrust over a grid of (φ, p). A run is deterministic in its seed and the
+whole history is cached with the final actor parameters, so the slides
+animate real training curves (and map the actor's stability) without
+retraining on every render.
+
+Example:
+    from engines.ddpg import DDPGConfig, train_ddpg
+    run = train_ddpg(DDPGConfig(seed=0))
+    run.critic_surfaces[-1]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import cache
+from .quadcopter import STATE_INDEX, STATE_LABELS, SUBSYSTEM_LABELS, hover_speed, rk4_step
+
+
+_NAMESPACE = "ddpg"
+
+# Normalization of the observed subsystem coordinates (φ, θ, ψ, z, p, q, r, w).
+OBS_SCALE = np.array([0.5, 0.5, 0.5, 2.0, 1.0, 1.0, 1.0, 1.0])
+# Half-widths of the initial-state box, per subsystem coordinate.
+INITIAL_HALF_WIDTH = np.array([0.3, 0.3, 0.3, 1.0, 0.3, 0.3, 0.3, 0.5])
+# Episodes end early (with this reward per remaining step) once |obs| exceeds the bound.
+OBS_BOUND = 10.0
+
+# Grid of the critic/actor snapshots.
+SURFACE_AXES = (("varphi", 0.6), ("p", 1.0))
+SURFACE_RESOLUTION = 41
+
+
+@dataclass(frozen=True)
+class DDPGConfig:
+    """Hyper-parameters of one training run."""
+
+    seed: int = 0
+    epochs: int = 10
+    episodes_per_epoch: int = 4
+    episode_steps: int = 150
+    n_envs: int = 16
+    dt: float = 0.04
+    gamma: float = 0.98
+    tau: float = 0.005
+    batch_size: int = 128
+    buffer_size: int = 100_000
+    updates_per_step: int = 1
+    actor_lr: float = 3e-4
+    critic_lr: float = 1e-3
+    hidden: tuple[int, ...] = (64, 64)
+    action_scale: float = 60.0
+    noise_sigma: float = 0.2
+    control_cost: float = 0.05
+    validation_episodes: int = 32
+
+
+@dataclass(frozen=True)
+class DDPGRun:
+    """Per-epoch history of a run (row e is the state after epoch e + 1)."""
+
+    train_return_mean: np.ndarray
+    train_return_std: np.ndarray
+    validation_return_mean: np.ndarray
+    validation_return_std: np.ndarray
+    critic_surfaces: np.ndarray
+    actor_surfaces: np.ndarray
+    surface_x: np.ndarray
+    surface_y: np.ndarray
+    actor: tuple[np.ndarray, ...]
+
+    @property
+    def epochs(self) -> np.ndarray:
+        return np.arange(1, len(self.train_return_mean) + 1)
+
+
+class ReplayBuffer:
+    """Fixed-capacity ring buffer of transitions, one array per field."""
+
+    def __init__(self, capacity: int, obs_dim: int, action_dim: int):
+        self.capacity = capacity
+        self.obs = np.zeros((capacity, obs_dim))
+        self.actions = np.zeros((capacity, action_dim))
+        self.rewards = np.zeros(capacity)
+        self.next_obs = np.zeros((capacity, obs_dim))
+        self.done = np.zeros(capacity)
+        self.position = 0
+        self.size = 0
+
+    def add(self, obs, actions, rewards, next_obs, done) -> None:
+        """Append a batch of transitions, overwriting the oldest when full."""
+        rows = (self.position + np.arange(len(obs))) % self.capacity
+        self.obs[rows] = obs
+        self.actions[rows] = actions
+        self.rewards[rows] = rewards
+        self.next_obs[rows] = next_obs
+        self.done[rows] = done
+        self.position = (self.position + len(obs)) % self.capacity
+        self.size = min(self.size + len(obs), self.capacity)
+
+    def sample(self, batch_size: int, rng: np.random.Generator) -> tuple[np.ndarray, ...]:
+        rows = rng.integers(0, self.size, batch_size)
+        return self.obs[rows], self.actions[rows], self.rewards[rows], self.next_obs[rows], self.done[rows]
+
+
+def mlp_init(sizes: tuple[int, ...], rng: np.random.Generator, final_scale: float = 3e-3) -> list[np.ndarray]:
+    """Return ``[W0, b0, W1, b1, ...]``; the output layer starts near zero."""
+    params = []
+    for index, (fan_in, fan_out) in enumerate(zip(sizes[:-1], sizes[1:])):
+        last = index == len(sizes) - 2
+        bound = final_scale if last else 1.0 / np.sqrt(fan_in)
+        params += [rng.uniform(-bound, bound, (fan_out, fan_in)), np.zeros(fan_out)]
+    return params
+
+
+def mlp_forward(params: list[np.ndarray], x: np.ndarray) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Return the linear output of a tanh MLP and the layer inputs needed by ``mlp_backward``."""
+    activations = [x]
+    for W, b in zip(params[0:-2:2], params[1:-2:2]):
+        activations.append(np.tanh(activations[-1] @ W.T + b))
+    return activations[-1] @ params[-2].T + params[-1], activations
+
+
+def mlp_backward(
+    params: list[np.ndarray],
+    activations: list[np.ndarray],
+    grad_out: np.ndarray,
+) -> tuple[list[np.ndarray], np.ndarray]:
+    """Return the parameter gradients and the gradient with respect to the input."""
+    grads = [None] * len(params)
+    grad = grad_out
+    for layer in reversed(range(len(activations))):
+        W = params[2 * layer]
+        grads[2 * layer] = grad.T @ activations[layer]
+        grads[2 * layer + 1] = grad.sum(axis=0)
+        grad = grad @ W
+        if layer > 0:
+            grad = grad * (1.0 - activations[layer] ** 2)
+    return grads, grad
+
+
+class Adam:
+    """Adam optimizer updating a list of arrays in place."""
+
+    def __init__(self, params: list[np.ndarray], lr: float, betas=(0.9, 0.999), eps: float = 1e-8):
+        self.lr, self.betas, self.eps = lr, betas, eps
+        self.m = [np.zeros_like(p) for p in params]
+        self.v = [np.zeros_like(p) for p in params]
+        self.t = 0
+
+    def step(self, params: list[np.ndarray], grads: list[np.ndarray]) -> None:
+        self.t += 1
+        beta1, beta2 = self.betas
+        correction = np.sqrt(1 - beta2**self.t) / (1 - beta1**self.t)
+        for p, g, m, v in zip(params, grads, self.m, self.v):
+            m *= beta1
+            m += (1 - beta1) * g
+            v *= beta2
+            v += (1 - beta2) * g * g
+            p -= self.lr * correction * m / (np.sqrt(v) + self.eps)
+
+
+def soft_update(target: list[np.ndarray], source: list[np.ndarray], tau: float) -> None:
+    for t, s in zip(target, source):
+        t *= 1 - tau
+        t += tau * s
+
+
+def _observe(states: np.ndarray) -> np.ndarray:
+    return states[..., [STATE_INDEX[label] for label in SUBSYSTEM_LABELS]] / OBS_SCALE
+
+
+def _initial_states(n: int, rng: np.random.Generator) -> np.ndarray:
+    states = np.zeros((n, len(STATE_LABELS)))
+    columns = [STATE_INDEX[label] for label in SUBSYSTEM_LABELS]
+    states[:, columns] = rng.uniform(-1.0, 1.0, (n, len(columns))) * INITIAL_HALF_WIDTH
+    return states
+
+
+def _act(actor: list[np.ndarray], obs: np.ndarray) -> np.ndarray:
+    return np.tanh(mlp_forward(actor, obs)[0])
+
+
+def _reward(obs: np.ndarray, actions: np.ndarray, config: DDPGConfig) -> np.ndarray:
+    return -(np.sum(obs**2, axis=-1) + config.control_cost * np.sum(actions**2, axis=-1)) * config.dt
+
+
+def _run_episodes(
+    actor: list[np.ndarray],
+    states: np.ndarray,
+    config: DDPGConfig,
+    rng: np.random.Generator | None = None,
+    on_step=None,
+) -> np.ndarray:
+    """Fly a batch of episodes (with exploration noise when ``rng`` is given); return their returns."""
+    hover = hover_speed()
+    returns = np.zeros(len(states))
+    alive = np.ones(len(states), dtype=bool)
+    failure_reward = -OBS_BOUND**2 * config.dt
+    with np.errstate(all="ignore"):
+        for step in range(config.episode_steps):
+            obs = _observe(states)
+            actions = _act(actor, obs)
+            if rng is not None:
+                actions = np.clip(actions + config.noise_sigma * rng.standard_normal(actions.shape), -1.0, 1.0)
+            states = rk4_step(states, hover + config.action_scale * actions, config.dt)
+            next_obs = _observe(states)
+            failed = ~(np.abs(next_obs).max(axis=1) < OBS_BOUND)
+            rewards = np.where(failed, failure_reward, _reward(obs, actions, config))
+            returns += np.where(alive, rewards, failure_reward)
+            if on_step is not None:
+                keep = alive.copy()
+                on_step(obs[keep], actions[keep], rewards[keep], np.nan_to_num(next_obs[keep]), failed[keep])
+            alive &= ~failed
+            states[~alive] = 0.0
+    return returns
+
+
+def _surface_states() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    (a_label, a_range), (b_label, b_range) = SURFACE_AXES
+    a_values = np.linspace(-a_range, a_range, SURFACE_RESOLUTION)
+    b_values = np.linspace(-b_range, b_range, SURFACE_RESOLUTION)
+    a_grid, b_grid = np.meshgrid(a_values, b_values)
+    states = np.zeros(a_grid.shape + (len(STATE_LABELS),))
+    states[..., STATE_INDEX[a_label]] = a_grid
+    states[..., STATE_INDEX[b_label]] = b_grid
+    return a_values, b_values, states
+
+
+def _train(config: DDPGConfig) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(config.seed)
+    obs_dim, action_dim = len(SUBSYSTEM_LABELS), 4
+    actor = mlp_init((obs_dim, *config.hidden, action_dim), rng)
+    critic = mlp_init((obs_dim + action_dim, *config.hidden, 1), rng)
+    actor_target = [p.copy() for p in actor]
+    critic_target = [p.copy() for p in critic]
+    actor_opt, critic_opt = Adam(actor, config.actor_lr), Adam(critic, config.critic_lr)
+    buffer = ReplayBuffer(config.buffer_size, obs_dim, action_dim)
+
+    validation_states = _initial_states(config.validation_episodes, np.random.default_rng(10_000 + config.seed))
+    surface_x, surface_y, surface_states = _surface_states()
+    surface_obs = _observe(surface_states).reshape(-1, obs_dim)
+
+    def update() -> None:
+        obs, actions, rewards, next_obs, done = buffer.sample(config.batch_size, rng)
+        next_q = mlp_forward(critic_target, np.hstack([next_obs, _act(actor_target, next_obs)]))[0][:, 0]
+        target = rewards + config.gamma * (1.0 - done) * next_q
+
+        q, critic_cache = mlp_forward(critic, np.hstack([obs, actions]))
+        grads, _ = mlp_backward(critic, critic_cache, 2.0 * (q - target[:, None]) / len(q))
+        critic_opt.step(critic, grads)
+
+        out, actor_cache = mlp_forward(actor, obs)
+        policy_actions = np.tanh(out)
+        _, critic_cache = mlp_forward(critic, np.hstack([obs, policy_actions]))
+        _, grad_in = mlp_backward(critic, critic_cache, np.full((len(obs), 1), -1.0 / len(obs)))
+        grad_out = grad_in[:, obs_dim:] * (1.0 - policy_actions**2)
+        grads, _ = mlp_backward(actor, actor_cache, grad_out)
+        actor_opt.step(actor, grads)
+
+        soft_update(critic_target, critic, config.tau)
+        soft_update(actor_target, actor, config.tau)
+
+    def on_step(obs, actions, rewards, next_obs, done) -> None:
+        buffer.add(obs, actions, rewards, next_obs, done)
+        if buffer.size >= config.batch_size:
+            for _ in range(config.updates_per_step):
+                update()
+
+    history = {name: [] for name in ("train_mean", "train_std", "val_mean", "val_std", "critic", "actor")}
+    for _ in range(config.epochs):
+        train_returns = np.concatenate(
+            [
+                _run_episodes(actor, _initial_states(config.n_envs, rng), config, rng, on_step)
+                for _ in range(config.episodes_per_epoch)
+            ]
+        )
+        validation_returns = _run_episodes(actor, validation_states.copy(), config)
+        surface_actions = _act(actor, surface_obs)
+        surface_q = mlp_forward(critic, np.hstack([surface_obs, surface_actions]))[0][:, 0]
+
+        history["train_mean"].append(train_returns.mean())
+        history["train_std"].append(train_returns.std())
+        history["val_mean"].append(validation_returns.mean())
+        history["val_std"].append(validation_returns.std())
+        history["critic"].append(surface_q.reshape(SURFACE_RESOLUTION, SURFACE_RESOLUTION))
+        history["actor"].append(surface_actions.mean(axis=1).reshape(SURFACE_RESOLUTION, SURFACE_RESOLUTION))
+
+    arrays = {name: np.asarray(values) for name, values in history.items()}
+    arrays.update({"surface_x": surface_x, "surface_y": surface_y})
+    arrays.update({f"actor_{index}": param for index, param in enumerate(actor)})
+    return arrays
+
+
+def train_ddpg(config: DDPGConfig = DDPGConfig()) -> DDPGRun:
+    """Return the cached training history of ``config`` (trained on the first call)."""
+    # "v2": runs cached before the actor parameters were stored lack them.
+    arrays = cache.cached_arrays(_NAMESPACE, "run-v2-" + cache.digest(config), lambda: _train(config))
+    n_params = 2 * (len(config.hidden) + 1)
+    return DDPGRun(
+        train_return_mean=arrays["train_mean"],
+        train_return_std=arrays["train_std"],
+        validation_return_mean=arrays["val_mean"],
+        validation_return_std=arrays["val_std"],
+        critic_surfaces=arrays["critic"],
+        actor_surfaces=arrays["actor"],
+        surface_x=arrays["surface_x"],
+        surface_y=arrays["surface_y"],
+        actor=tuple(arrays[f"actor_{index}"] for index in range(n_params)),
+    )
@@ -0,0 +1,334 @@
+"""
+A compact guided policy search (GPS) with BADMM dual updates.
+
+Following the chapter on GPS, every iteration k alternates three steps:
+
+1. Local controllers p_i: for each initial condition i, iLQR on the
+   nonlinear quadcopter minimizes the augmented cost
+   c(x, u) - λ_tiᵀu - ν_t log π_θ(u|x), which is quadratic because the
+   global policy is linear-Gaussian. Jacobians come from batched central
+   differences of the RK4 step. Conditions run in a process pool.
+2. Global policy π_θ(u|x) = N(W x_S + b, I): one weighted least-squares fit
+   over the states sampled from every local controller, with targets
+   μ_ti(x) - λ_ti / ν_t and weights ν_t.
+3. Duals: λ_ti ← λ_ti + α_λ ν_t (E_π[u_t] - E_p[u_t]), and ν_t grows by
+   ``nu_growth`` (up to ``nu_max``) wherever the mean action gap is still
+   above ``gap_tolerance``.
+
+Actions are rotor-speed deviations from hover. The state of each iteration
+(duals, policy, warm starts) and its log (gaps, costs, trajectories) are
+cached under a key of (config, k), so extending a run only computes the
+new iterations.
+
+Example:
+    from engines.gps import GPSConfig, run_gps
+    history = run_gps(GPSConfig(), iterations=24)
+    history.gap.mean(axis=1)
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import cache
+from .quadcopter import STATE_INDEX, STATE_LABELS, SUBSYSTEM_LABELS, hover_speed, rk4_step
+
+
+_NAMESPACE = "gps"
+
+# Initial conditions x_0^{(i)} of the local controllers.
+GPS_CONDITIONS = (
+    {"varphi": 0.4, "z": 1.0},
+    {"theta": -0.4, "w": 0.5},
+    {"psi": 0.5, "p": -0.3},
+    {"varphi": -0.3, "theta": 0.3, "z": -1.0},
+)
+
+_SUBSYSTEM = [STATE_INDEX[label] for label in SUBSYSTEM_LABELS]
+
+
+@dataclass(frozen=True)
+class GPSConfig:
+    """Problem and BADMM parameters of one GPS run."""
+
+    horizon: int = 100
+    dt: float = 0.04
+    control_cost: float = 1e-2
+    terminal_weight: float = 10.0
+    alpha_lambda: float = 0.01
+    nu_initial: float = 0.001
+    nu_growth: float = 2.0
+    # ν keeps doubling until the gaps are negligible: stopping at a mean gap of
+    # 0.5 left global policies that diverge on most conditions.
+    nu_max: float = 1000.0
+    gap_tolerance: float = 0.005
+    samples: int = 8
+    ilqr_iterations: int = 5
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class GPSHistory:
+    """Per-iteration logs of a run; row k - 1 is iteration k."""
+
+    lambda_norm: np.ndarray
+    nu: np.ndarray
+    gap: np.ndarray
+    local_cost: np.ndarray
+    global_cost: np.ndarray
+    local_states: np.ndarray
+    global_states: np.ndarray
+    W: np.ndarray
+    b: np.ndarray
+
+    @property
+    def iterations(self) -> np.ndarray:
+        return np.arange(1, len(self.gap) + 1)
+
+    @property
+    def times(self) -> np.ndarray:
+        return np.arange(self.local_states.shape[2])
+
+
+def initial_states(conditions=GPS_CONDITIONS) -> np.ndarray:
+    """Return the ``(N, 12)`` initial states of the conditions."""
+    states = np.zeros((len(conditions), len(STATE_LABELS)))
+    for row, condition in enumerate(conditions):
+        for label, value in condition.items():
+            states[row, STATE_INDEX[label]] = value
+    return states
+
+
+def _step(states: np.ndarray, actions: np.ndarray, dt: float) -> np.ndarray:
+    return rk4_step(states, hover_speed() + actions, dt)
+
+
+def _state_weights(config: GPSConfig) -> np.ndarray:
+    weights = np.zeros(len(STATE_LABELS))
+    weights[_SUBSYSTEM] = 1.0
+    return weights
+
+
+def _policy_matrix(W: np.ndarray) -> np.ndarray:
+    """Embed W (acting on x_S) as a ``(4, 12)`` matrix acting on the full state."""
+    full = np.zeros((W.shape[0], len(STATE_LABELS)))
+    full[:, _SUBSYSTEM] = W
+    return full
+
+
+def linearize(states: np.ndarray, actions: np.ndarray, dt: float, eps: float = 1e-5):
+    """Return the Jacobians ``(A_t, B_t)`` of the RK4 step along a trajectory (batched)."""
+    n, m = states.shape[-1], actions.shape[-1]
+    eye = np.eye(n + m) * eps
+    x = states[:, None, :] + np.concatenate([eye[:, :n], -eye[:, :n]])[None]
+    u = actions[:, None, :] + np.concatenate([eye[:, n:], -eye[:, n:]])[None]
+    moved = _step(x, u, dt)
+    jacobian = (moved[:, : n + m] - moved[:, n + m:]) / (2 * eps)
+    return np.swapaxes(jacobian[:, :n], 1, 2), np.swapaxes(jacobian[:, n:], 1, 2)
+
+
+def _augmented_cost(x, u, lam, nu, W_full, b, config: GPSConfig) -> float:
+    weights = _state_weights(config)
+    gap = u - x[:-1] @ W_full.T - b
+    stage = (
+        0.5 * np.sum(weights * x[:-1] ** 2)
+        + 0.5 * config.control_cost * np.sum(u**2)
+        - np.sum(lam * u)
+        + 0.5 * np.sum(nu[:, None] * gap**2)
+    )
+    return float(stage + 0.5 * config.terminal_weight * np.sum(weights * x[-1] ** 2))
+
+
+def _rollout(x0, x_ref, u_ref, K, k, alpha, dt):
+    x = np.empty_like(x_ref)
+    u = np.empty_like(u_ref)
+    x[0] = x0
+    for t in range(len(u_ref)):
+        u[t] = u_ref[t] + alpha * k[t] + K[t] @ (x[t] - x_ref[t])
+        x[t + 1] = _step(x[t], u[t], dt)
+    return x, u
+
+
+def local_controller(x0, lam, nu, W, b, u_init, config: GPSConfig) -> dict[str, np.ndarray]:
+    """Run iLQR for one condition; return the nominal trajectory, gains and covariances."""
+    T, n, m = config.horizon, len(STATE_LABELS), 4
+    weights = _state_weights(config)
+    W_full = _policy_matrix(W)
+    C_xx = np.diag(weights) + nu[:, None, None] * (W_full.T @ W_full)[None]
+    C_uu = config.control_cost * np.eye(m) + nu[:, None, None] * np.eye(m)[None]
+    C_ux = -nu[:, None, None] * W_full[None]
+    c_x = nu[:, None] * (W_full.T @ b)[None]
+    c_u = -lam - nu[:, None] * b[None]
+
+    zeros_K = np.zeros((T, m, n))
+    x, u = _rollout(x0, np.zeros((T + 1, n)), u_init, zeros_K, np.zeros((T, m)), 0.0, config.dt)
+    cost = _augmented_cost(x, u, lam, nu, W_full, b, config)
+    with np.errstate(all="ignore"):
+        for _ in range(config.ilqr_iterations):
+            A, B = linearize(x[:-1], u, config.dt)
+            V = config.terminal_weight * np.diag(weights)
+            v = V @ x[-1]
+            K, k, Q_uu_inv = np.empty((T, m, n)), np.empty((T, m)), np.empty((T, m, m))
+            for t in reversed(range(T)):
+                # Quadratic expansion of the augmented cost around (x_t, u_t).
+                l_x = C_xx[t] @ x[t] + C_ux[t].T @ u[t] + c_x[t]
+                l_u = C_uu[t] @ u[t] + C_ux[t] @ x[t] + c_u[t]
+                Q_x = l_x + A[t].T @ v
+                Q_u = l_u + B[t].T @ v
+                Q_xx = C_xx[t] + A[t].T @ V @ A[t]
+                Q_uu = C_uu[t] + B[t].T @ V @ B[t]
+                Q_ux = C_ux[t] + B[t].T @ V @ A[t]
+                Q_uu_inv[t] = np.linalg.inv(Q_uu)
+                K[t] = -Q_uu_inv[t] @ Q_ux
+                k[t] = -Q_uu_inv[t] @ Q_u
+                V = Q_xx + K[t].T @ Q_uu @ K[t] + K[t].T @ Q_ux + Q_ux.T @ K[t]
+                V = 0.5 * (V + V.T)
+                v = Q_x + K[t].T @ Q_uu @ k[t] + K[t].T @ Q_u + Q_ux.T @ k[t]
+            for alpha in (1.0, 0.5, 0.25, 0.1):
+                x_new, u_new = _rollout(x0, x, u, K, k, alpha, config.dt)
+                new_cost = _augmented_cost(x_new, u_new, lam, nu, W_full, b, config)
+                if np.isfinite(new_cost) and new_cost < cost:
+                    x, u, cost = x_new, u_new, new_cost
+                    break
+            else:
+                break
+    return {"x": x, "u": u, "K": K, "covariance": Q_uu_inv}
+
+
+def _task_cost(x: np.ndarray, u: np.ndarray, config: GPSConfig) -> float:
+    weights = _state_weights(config)
+    return float(
+        0.5 * np.sum(weights * x[:-1] ** 2)
+        + 0.5 * config.control_cost * np.sum(u**2)
+        + 0.5 * config.terminal_weight * np.sum(weights * x[-1] ** 2)
+    )
+
+
+def _sample_local(local: dict, x0: np.ndarray, config: GPSConfig, rng: np.random.Generator):
+    """Fly ``config.samples`` noisy rollouts of p_i; return states and local mean actions."""
+    T, M = config.horizon, config.samples
+    chol = np.linalg.cholesky(local["covariance"])
+    x = np.empty((T, M, len(STATE_LABELS)))
+    mean_u = np.empty((T, M, 4))
+    states = np.tile(x0, (M, 1))
+    with np.errstate(all="ignore"):
+        for t in range(T):
+            x[t] = states
+            mean_u[t] = local["u"][t] + (states - local["x"][t]) @ local["K"][t].T
+            actions = mean_u[t] + rng.standard_normal((M, 4)) @ chol[t].T
+            states = _step(states, actions, config.dt)
+    return x, mean_u
+
+
+def _global_rollout(W, b, x0s, config: GPSConfig) -> tuple[np.ndarray, np.ndarray]:
+    x = np.empty((config.horizon + 1,) + x0s.shape)
+    u = np.empty((config.horizon,) + (len(x0s), 4))
+    x[0] = x0s
+    with np.errstate(all="ignore"):
+        for t in range(config.horizon):
+            u[t] = x[t][:, _SUBSYSTEM] @ W.T + b
+            x[t + 1] = _step(x[t], u[t], config.dt)
+    return np.swapaxes(x, 0, 1), np.swapaxes(u, 0, 1)
+
+
+def _initial_state_arrays(config: GPSConfig, n_conditions: int) -> dict[str, np.ndarray]:
+    T = config.horizon
+    return {
+        "lam": np.zeros((n_conditions, T, 4)),
+        "nu": np.full(T, config.nu_initial),
+        "W": np.zeros((4, len(SUBSYSTEM_LABELS))),
+        "b": np.zeros(4),
+        "u_init": np.zeros((n_conditions, T, 4)),
+    }
+
+
+def gps_iteration(
+    previous: dict[str, np.ndarray],
+    x0s: np.ndarray,
+    config: GPSConfig,
+    iteration: int,
+    workers: int | None = None,
+) -> dict[str, np.ndarray]:
+    """Run one GPS iteration from the state ``previous``; return the next state and its log."""
+    lam, nu, W, b = previous["lam"], previous["nu"], previous["W"], previous["b"]
+    n_conditions = len(x0s)
+    arguments = [(x0s[i], lam[i], nu, W, b, previous["u_init"][i], config) for i in range(n_conditions)]
+    n_workers = min(n_conditions, workers or os.cpu_count() or 1)
+    if n_workers <= 1:
+        locals_ = [local_controller(*args) for args in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            locals_ = list(pool.map(local_controller, *zip(*arguments)))
+
+    # Global policy: weighted least squares over every sampled state.
+    rng = np.random.default_rng((config.seed, iteration))
+    samples = [_sample_local(local, x0s[i], config, rng) for i, local in enumerate(locals_)]
+    states = np.stack([x for x, _ in samples])  # (N, T, M, 12)
+    local_means = np.stack([u for _, u in samples])  # (N, T, M, 4)
+    targets = local_means - (lam / nu[None, :, None])[:, :, None, :]
+    features = np.concatenate([states[..., _SUBSYSTEM], np.ones(states.shape[:-1] + (1,))], axis=-1)
+    sqrt_w = np.sqrt(np.broadcast_to(nu[None, :, None, None], states.shape[:-1] + (1,)))
+    solution, *_ = np.linalg.lstsq(
+        (sqrt_w * features).reshape(-1, features.shape[-1]),
+        (sqrt_w * targets).reshape(-1, 4),
+        rcond=None,
+    )
+    W, b = solution[:-1].T, solution[-1]
+
+    # Dual updates.
+    policy_mean = (states[..., _SUBSYSTEM] @ W.T + b).mean(axis=2)
+    local_mean = local_means.mean(axis=2)
+    difference = policy_mean - local_mean
+    lam = lam + config.alpha_lambda * nu[None, :, None] * difference
+    gap = np.linalg.norm(difference, axis=-1).mean(axis=0)
+    nu = np.where(gap > config.gap_tolerance, np.minimum(nu * config.nu_growth, config.nu_max), nu)
+
+    global_x, global_u = _global_rollout(W, b, x0s, config)
+    return {
+        "lam": lam,
+        "nu": nu,
+        "W": W,
+        "b": b,
+        "u_init": np.stack([local["u"] for local in locals_]),
+        "gap": gap,
+        "lambda_norm": np.linalg.norm(lam, axis=-1).mean(axis=0),
+        "local_cost": np.array([_task_cost(local["x"], local["u"], config) for local in locals_]),
+        "global_cost": np.array([_task_cost(x, u, config) for x, u in zip(global_x, global_u)]),
+        "local_states": np.stack([local["x"] for local in locals_]),
+        "global_states": global_x,
+    }
+
+
+def run_gps(
+    config: GPSConfig = GPSConfig(),
+    iterations: int = 10,
+    conditions=GPS_CONDITIONS,
+    workers: int | None = None,
+) -> GPSHistory:
+    """Return the history of ``iterations`` GPS iterations, computing only uncached ones."""
+    x0s = initial_states(conditions)
+    state = _initial_state_arrays(config, len(x0s))
+    logs = []
+    for iteration in range(1, iterations + 1):
+        previous = state
+        state = cache.cached_arrays(
+            _NAMESPACE,
+            f"it{iteration:03d}-" + cache.digest(config, x0s),
+            lambda: gps_iteration(previous, x0s, config, iteration, workers),
+        )
+        logs.append(state)
+    return GPSHistory(
+        lambda_norm=np.stack([log["lambda_norm"] for log in logs]),
+        nu=np.stack([log["nu"] for log in logs]),
+        gap=np.stack([log["gap"] for log in logs]),
+        local_cost=np.stack([log["local_cost"] for log in logs]),
+        global_cost=np.stack([log["global_cost"] for log in logs]),
+        local_states=np.stack([log["local_states"] for log in logs]),
+        global_states=np.stack([log["global_states"] for log in logs]),
+        W=np.stack([log["W"] for log in logs]),
+        b=np.stack([log["b"] for log in logs]),
+    )
@@ -0,0 +1,230 @@
+"""
+Columnar, memory-mapped store for large training logs.
+
+A raw log (``results/<name>.csv`` or ``.npz``) is converted once into one
+``.npy`` file per column plus a small ``schema.json`` under
+``<cache>/logs/<name>-<digest>/``; the digest covers the source path, size
+and modification time, so editing the log triggers a new conversion. Rows
+are sorted by seed and the schema records each seed's row range, and the
+mean/std over seeds of every column is precomputed against the x column.
+
+Opening a stored log only reads the schema: columns are ``np.load(...,
+mmap_mode="r")`` views, so slicing rows or seeds touches just the pages
+that are plotted. CSV sources are parsed in chunks straight into the
+memory-mapped columns, never as a whole table.
+
+Example:
+    from engines.logstore import open_log
+    log = open_log("ddpg_returns", x="episode")
+    episodes, mean, std = log.band("train_return")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from . import cache
+from .series import find_log
+
+
+_FOLDER = "logs"
+SCHEMA_FILE = "schema.json"
+SCHEMA_VERSION = 1
+
+# Rows parsed per chunk while converting CSV logs.
+CSV_CHUNK_ROWS = 200_000
+
+
+@dataclass(frozen=True)
+class StoredLog:
+    """Read-only view of a converted log; every array is a memory map."""
+
+    root: Path
+    schema: dict
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(self.schema["columns"])
+
+    @property
+    def rows(self) -> int:
+        return self.schema["rows"]
+
+    @property
+    def seeds(self) -> tuple[float, ...]:
+        return tuple(float(seed) for seed in self.schema["seeds"])
+
+    def _array(self, filename: str) -> np.ndarray:
+        return np.load(self.root / filename, mmap_mode="r")
+
+    def column(self, name: str, start: int | None = None, stop: int | None = None) -> np.ndarray:
+        """Return rows ``start:stop`` of one column without copying."""
+        if name not in self.schema["columns"]:
+            raise KeyError(f"column {name!r} not in log (have {', '.join(self.columns)})")
+        return self._array(self.schema["columns"][name])[start:stop]
+
+    def slice(self, start: int | None = None, stop: int | None = None, columns=None) -> dict[str, np.ndarray]:
+        """Return rows ``start:stop`` of the given columns (all by default)."""
+        return {name: self.column(name, start, stop) for name in (columns or self.columns)}
+
+    def seed(self, seed: float, columns=None) -> dict[str, np.ndarray]:
+        """Return the rows of one seed."""
+        for value, (start, stop) in zip(self.schema["seeds"], self.schema["seed_rows"]):
+            if value == seed:
+                return self.slice(start, stop, columns)
+        raise KeyError(f"seed {seed!r} not in log")
+
+    def band(self, name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(x, mean, std)`` of ``name`` over seeds."""
+        bands = self.schema["bands"]
+        if bands is None or name not in bands["columns"]:
+            raise KeyError(f"no seed band for column {name!r}")
+        files = bands["columns"][name]
+        return self._array(bands["x_file"]), self._array(files["mean"]), self._array(files["std"])
+
+
+def _source_columns(source: Path) -> list[str]:
+    if source.suffix == ".npz":
+        with np.load(source) as archive:
+            return list(archive.files)
+    with source.open() as handle:
+        return [name.strip() for name in handle.readline().split(",")]
+
+
+def _write_columns(source: Path, folder: Path) -> tuple[dict[str, str], int]:
+    """Copy the source into one float64 ``.npy`` per column; return files and row count."""
+    names = _source_columns(source)
+    files = {name: f"col_{index:03d}.npy" for index, name in enumerate(names)}
+
+    if source.suffix == ".npz":
+        with np.load(source) as archive:
+            for name in names:
+                np.save(folder / files[name], np.asarray(archive[name], dtype=float))
+            rows = len(archive[names[0]])
+        return files, rows
+
+    with source.open() as handle:
+        # Count rows as ``np.loadtxt`` reads them: blank and ``#`` comment lines are skipped.
+        rows = sum(1 for line in handle if line.split("#", 1)[0].strip()) - 1
+    columns = {
+        name: np.lib.format.open_memmap(folder / files[name], mode="w+", dtype=float, shape=(rows,))
+        for name in names
+    }
+    with source.open() as handle, warnings.catch_warnings():
+        # NumPy warns that blank and comment lines do not count towards ``max_rows``, as counted above.
+        warnings.filterwarnings("ignore", "Input line", UserWarning)
+        handle.readline()
+        start = 0
+        while start < rows:
+            chunk = np.loadtxt(handle, delimiter=",", max_rows=CSV_CHUNK_ROWS, ndmin=2)
+            if chunk.size == 0:
+                raise ValueError(f"{source}: expected {rows} rows, read {start}")
+            for index, name in enumerate(names):
+                columns[name][start:start + len(chunk)] = chunk[:, index]
+            start += len(chunk)
+    for column in columns.values():
+        column.flush()
+    return files, rows
+
+
+def _sort_by_seed(folder: Path, files: dict[str, str], seed_column: str) -> tuple[list[float], list[list[int]]]:
+    """Reorder every column so seeds are contiguous; return seeds and row ranges."""
+    seed = np.load(folder / files[seed_column], mmap_mode="r")
+    order = np.argsort(seed, kind="stable")
+    if np.any(order != np.arange(len(order))):
+        for filename in files.values():
+            column = np.load(folder / filename, mmap_mode="r+")
+            column[:] = column[order]
+            column.flush()
+        seed = np.load(folder / files[seed_column], mmap_mode="r")
+    seeds, starts = np.unique(seed, return_index=True)
+    stops = np.append(starts[1:], len(seed))
+    return seeds.tolist(), [[int(a), int(b)] for a, b in zip(starts, stops)]
+
+
+def _write_bands(
+    folder: Path,
+    files: dict[str, str],
+    seed_rows: list[list[int]],
+    x: str,
+    exclude: tuple[str, ...],
+) -> dict | None:
+    """Write mean/std over seeds of each column, aligned on a common x grid."""
+    if len({stop - start for start, stop in seed_rows}) != 1:
+        return None
+    x_values = np.load(folder / files[x], mmap_mode="r")
+    x_grid = np.asarray(x_values[seed_rows[0][0]:seed_rows[0][1]])
+    if any(not np.array_equal(x_values[start:stop], x_grid) for start, stop in seed_rows):
+        return None
+
+    np.save(folder / "band_x.npy", x_grid)
+    bands = {}
+    for name, filename in files.items():
+        if name in exclude:
+            continue
+        column = np.load(folder / filename, mmap_mode="r")
+        per_seed = np.stack([column[start:stop] for start, stop in seed_rows])
+        bands[name] = {"mean": f"band_{filename[4:-4]}_mean.npy", "std": f"band_{filename[4:-4]}_std.npy"}
+        np.save(folder / bands[name]["mean"], np.nanmean(per_seed, axis=0))
+        np.save(folder / bands[name]["std"], np.nanstd(per_seed, axis=0))
+    return {"x": x, "x_file": "band_x.npy", "columns": bands}
+
+
+def convert_log(source: str | Path, folder: Path, x: str | None = None, seed_column: str = "seed") -> StoredLog:
+    """Convert a raw log into a columnar store at ``folder`` (written atomically)."""
+    source = Path(source)
+    tmp_folder = folder.with_name(f".{folder.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_folder, ignore_errors=True)
+    tmp_folder.mkdir(parents=True)
+
+    files, rows = _write_columns(source, tmp_folder)
+    if seed_column in files:
+        seeds, seed_rows = _sort_by_seed(tmp_folder, files, seed_column)
+    else:
+        seeds, seed_rows = [0.0], [[0, rows]]
+    bands = None
+    if x is not None:
+        bands = _write_bands(tmp_folder, files, seed_rows, x, exclude=(x, seed_column))
+
+    schema = {
+        "version": SCHEMA_VERSION,
+        "source": str(source),
+        "rows": rows,
+        "columns": files,
+        "seed_column": seed_column if seed_column in files else None,
+        "seeds": seeds,
+        "seed_rows": seed_rows,
+        "bands": bands,
+    }
+    (tmp_folder / SCHEMA_FILE).write_text(json.dumps(schema, indent=2))
+    try:
+        os.replace(tmp_folder, folder)
+    except OSError:
+        # Another process converted the same log first.
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+    return StoredLog(folder, json.loads((folder / SCHEMA_FILE).read_text()))
+
+
+def open_log(name: str, x: str | None = None, seed_column: str = "seed") -> StoredLog | None:
+    """Return the stored log for ``results/<name>``, converting it on first use.
+
+    ``x`` names the column the seed bands are aligned on; ``None`` skips bands.
+    Returns ``None`` when there is no such log.
+    """
+    source = find_log(name)
+    if source is None:
+        return None
+    stat = source.stat()
+    key = cache.digest(str(source.resolve()), stat.st_size, stat.st_mtime_ns, x, seed_column, SCHEMA_VERSION)
+    folder = cache.cache_dir() / _FOLDER / f"{name}-{key}"
+    schema_path = folder / SCHEMA_FILE
+    if schema_path.exists():
+        return StoredLog(folder, json.loads(schema_path.read_text()))
+    return convert_log(source, folder, x=x, seed_column=seed_column)
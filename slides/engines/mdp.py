@@ -0,0 +1,209 @@
+"""
+Finite MDPs with dense tensors and vectorized Bellman backups.
+
+An MDP holds the transition tensor P[x, u, x'] = p(x' | x, u), the reward
+tensor R[x, u, x'] and a mask of the actions available in each state.
+Value iteration backs up every (x, u) pair at once with ``einsum`` and keeps
+the history of V and of the greedy policy, so slides can animate the
+convergence instead of only showing the fixed point.
+
+The recycling robot of the MDP slide is provided by ``recycling_robot`` and
+its solution by ``recycling_robot_solution``; every slide that calls the
+latter with the default arguments shares the same cached result.
+
+Example:
+    from engines.mdp import recycling_robot, recycling_robot_solution
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import cache
+
+
+_NAMESPACE = "mdp"
+
+ROBOT_ALPHA = 0.8
+ROBOT_BETA = 0.6
+ROBOT_R_SEARCH = 2.0
+ROBOT_R_WAIT = 1.0
+ROBOT_R_RESCUE = -3.0
+ROBOT_GAMMA = 0.9
+
+
+@dataclass(frozen=True)
+class FiniteMDP:
+    """Dense description of a finite MDP."""
+
+    states: tuple[str, ...]
+    actions: tuple[str, ...]
+    P: np.ndarray
+    R: np.ndarray
+    available: np.ndarray
+
+    @property
+    def expected_reward(self) -> np.ndarray:
+        """Return r(x, u) = Σ_x' p(x'|x, u) R(x, u, x')."""
+        return np.einsum("xuy,xuy->xu", self.P, self.R)
+
+
+@dataclass(frozen=True)
+class ValueIterationResult:
+    """Fixed point of value iteration plus the whole iteration history."""
+
+    V_history: np.ndarray
+    policy_history: np.ndarray
+    Q: np.ndarray
+
+    @property
+    def V(self) -> np.ndarray:
+        return self.V_history[-1]
+
+    @property
+    def policy(self) -> np.ndarray:
+        return self.policy_history[-1]
+
+    @property
+    def iterations(self) -> int:
+        return self.policy_history.shape[0]
+
+
+def recycling_robot(
+    alpha: float = ROBOT_ALPHA,
+    beta: float = ROBOT_BETA,
+    r_search: float = ROBOT_R_SEARCH,
+    r_wait: float = ROBOT_R_WAIT,
+    r_rescue: float = ROBOT_R_RESCUE,
+) -> FiniteMDP:
+    """Return the recycling robot with states (high, low) and actions (search, wait, recharge)."""
+    states = ("high", "low")
+    actions = ("search", "wait", "recharge")
+    high, low = range(2)
+    search, wait, recharge = range(3)
+
+    P = np.zeros((2, 3, 2))
+    R = np.zeros((2, 3, 2))
+    P[high, search] = [alpha, 1.0 - alpha]
+    R[high, search] = r_search
+    P[low, search] = [1.0 - beta, beta]
+    R[low, search] = [r_rescue, r_search]
+    P[high, wait, high] = 1.0
+    P[low, wait, low] = 1.0
+    R[:, wait] = r_wait
+    P[low, recharge, high] = 1.0
+
+    available = np.ones((2, 3), dtype=bool)
+    available[high, recharge] = False
+    return FiniteMDP(states, actions, P, R, available)
+
+
+def bellman_backup(mdp: FiniteMDP, V: np.ndarray, gamma: float) -> np.ndarray:
+    """Return Q(x, u) = r(x, u) + γ Σ_x' p(x'|x, u) V(x') for V of shape ``(..., n_states)``.
+
+    Unavailable actions get ``-inf``.
+    """
+    Q = mdp.expected_reward + gamma * np.einsum("xuy,...y->...xu", mdp.P, V)
+    return np.where(mdp.available, Q, -np.inf)
+
+
+def greedy_policy(Q: np.ndarray) -> np.ndarray:
+    """Return the index of the best action in each state."""
+    return np.argmax(Q, axis=-1)
+
+
+def _policy_matrix(mdp: FiniteMDP, policy: np.ndarray) -> np.ndarray:
+    """Return π(u|x) as a matrix, zero on unavailable actions."""
+    policy = np.asarray(policy)
+    if policy.ndim == 1:
+        policy = np.eye(len(mdp.actions))[policy]
+    policy = np.where(mdp.available, policy, 0.0)
+    return policy
+
+
+def policy_evaluation(mdp: FiniteMDP, policy: np.ndarray, gamma: float) -> np.ndarray:
+    """Return V_π by solving (I - γ P_π) V = r_π.
+
+    ``policy`` is either a deterministic action index per state or a
+    ``(n_states, n_actions)`` matrix of probabilities π(u|x).
+    """
+    policy = _policy_matrix(mdp, policy)
+    n_states = len(mdp.states)
+    P_pi = np.einsum("xu,xuy->xy", policy, mdp.P)
+    r_pi = np.einsum("xu,xu->x", policy, mdp.expected_reward)
+    return np.linalg.solve(np.eye(n_states) - gamma * P_pi, r_pi)
+
+
+def sample_episodes(
+    mdp: FiniteMDP,
+    policy: np.ndarray,
+    x0: int,
+    n_episodes: int,
+    steps: int,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sample ``n_episodes`` trajectories of ``steps`` transitions in parallel.
+
+    ``policy`` follows ``policy_evaluation``. Returns ``(states, actions,
+    rewards)`` with shapes ``(n, steps + 1)``, ``(n, steps)`` and ``(n, steps)``.
+    """
+    rng = np.random.default_rng(seed)
+    policy = _policy_matrix(mdp, policy)
+    action_cdf = np.cumsum(policy / policy.sum(axis=1, keepdims=True), axis=1)
+    next_cdf = np.cumsum(mdp.P, axis=2)
+
+    states = np.empty((n_episodes, steps + 1), dtype=np.int64)
+    actions = np.empty((n_episodes, steps), dtype=np.int64)
+    rewards = np.empty((n_episodes, steps))
+    states[:, 0] = x0
+    for t in range(steps):
+        x = states[:, t]
+        u = (rng.random((n_episodes, 1)) > action_cdf[x]).sum(axis=1)
+        y = (rng.random((n_episodes, 1)) > next_cdf[x, u]).sum(axis=1)
+        actions[:, t] = u
+        rewards[:, t] = mdp.R[x, u, y]
+        states[:, t + 1] = y
+    return states, actions, rewards
+
+
+def value_iteration(
+    mdp: FiniteMDP,
+    gamma: float,
+    tol: float = 1e-8,
+    max_iter: int = 1000,
+) -> ValueIterationResult:
+    """Iterate V ← max_u Q(·, u) from V = 0 until the update is below ``tol`` (cached)."""
+
+    def compute() -> dict[str, np.ndarray]:
+        V = np.zeros(len(mdp.states))
+        values, policies = [V], []
+        for _ in range(max_iter):
+            Q = bellman_backup(mdp, V, gamma)
+            V_next = Q.max(axis=-1)
+            values.append(V_next)
+            policies.append(greedy_policy(Q))
+            converged = np.abs(V_next - V).max() < tol
+            V = V_next
+            if converged:
+                break
+        else:
+            raise ValueError(f"Value iteration did not converge in {max_iter} iterations.")
+        return {
+            "V_history": np.array(values),
+            "policy_history": np.array(policies),
+            "Q": bellman_backup(mdp, V, gamma),
+        }
+
+    arrays = cache.cached_arrays(
+        _NAMESPACE,
+        "vi-" + cache.digest(mdp.P, mdp.R, mdp.available, gamma, tol, max_iter),
+        compute,
+    )
+    return ValueIterationResult(**arrays)
+
+
+def recycling_robot_solution(gamma: float = ROBOT_GAMMA) -> ValueIterationResult:
+    """Return the cached value-iteration solution of the default recycling robot."""
+    return value_iteration(recycling_robot(), gamma)
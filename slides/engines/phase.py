@@ -0,0 +1,144 @@
+"""
+Phase portraits of the linearized quadcopter subsystem under feedback.
+
+With u = -K y, the linearized subsystem y = (φ, θ, ψ, z, p, q, r, w) flows
+as ẏ = (Ã - B̃K) y. For the symmetric hover gains the coordinate/rate planes
+(z, w) and (φ, p) are invariant, so each is a 2D linear system whose matrix
+is the corresponding 2×2 block of the closed loop (K = 0 gives the open-loop
+linearization).
+
+The direction field over a grid is one matrix product, and streamlines are
+integrated for all seeds at once with the exact transition matrix
+exp(M Δt) per step. A streamline ends (NaN) once it leaves the plotted
+window. Field and streamlines are cached per (plane, closed-loop block,
+grid), so an animated portrait never re-integrates on render.
+
+Example:
+    from engines.phase import phase_portrait
+    field = phase_portrait("z-w", design.K)
+    field.lines.shape  # (seeds, steps + 1, 2)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import cache
+from .control import expm
+from .quadcopter import SUBSYSTEM_LABELS, subsystem
+
+
+_NAMESPACE = "phase"
+
+# Plane name -> ((coordinate, half range), (rate, half range)).
+PHASE_PLANES = {
+    "z-w": (("z", 2.0), ("w", 3.0)),
+    "varphi-p": (("varphi", 0.4), ("p", 2.0)),
+}
+
+# Arrows per axis of the direction field and seeds per axis of the streamlines.
+FIELD_RESOLUTION = 15
+SEED_RESOLUTION = 8
+
+
+@dataclass(frozen=True)
+class PhaseField:
+    """Direction field ``(ny, nx, 2)`` and streamlines ``(seeds, steps + 1, 2)`` of one plane."""
+
+    plane: str
+    matrix: np.ndarray
+    x_values: np.ndarray
+    y_values: np.ndarray
+    vectors: np.ndarray
+    times: np.ndarray
+    lines: np.ndarray
+
+    @property
+    def ranges(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        return (self.x_values[0], self.x_values[-1]), (self.y_values[0], self.y_values[-1])
+
+    @property
+    def eigenvalues(self) -> np.ndarray:
+        return np.linalg.eigvals(self.matrix)
+
+
+def plane_matrix(plane: str, K: np.ndarray | None = None) -> np.ndarray:
+    """Return the 2×2 block of Ã - B̃K on ``plane`` (``K = None`` is the open loop)."""
+    A, B = subsystem()
+    closed = A if K is None else A - B @ np.asarray(K, dtype=float)
+    (a_label, _), (b_label, _) = PHASE_PLANES[plane]
+    rows = [SUBSYSTEM_LABELS.index(a_label), SUBSYSTEM_LABELS.index(b_label)]
+    return closed[np.ix_(rows, rows)]
+
+
+def direction_field(matrix: np.ndarray, x_values: np.ndarray, y_values: np.ndarray) -> np.ndarray:
+    """Return ẋ = M x at every grid point as ``(ny, nx, 2)``."""
+    points = np.stack(np.meshgrid(x_values, y_values), axis=-1)
+    return points @ np.asarray(matrix).T
+
+
+def streamlines(
+    matrix: np.ndarray,
+    seeds: np.ndarray,
+    dt: float,
+    steps: int,
+    bounds: tuple[tuple[float, float], tuple[float, float]],
+) -> np.ndarray:
+    """Flow every seed ``(n, 2)`` for ``steps`` periods; points outside ``bounds`` become NaN."""
+    transition_t = expm(np.asarray(matrix) * dt).T
+    (x_min, x_max), (y_min, y_max) = bounds
+    lines = np.empty((len(seeds), steps + 1, 2))
+    lines[:, 0] = seeds
+    for step in range(steps):
+        lines[:, step + 1] = lines[:, step] @ transition_t
+    outside = (
+        (lines[..., 0] < x_min) | (lines[..., 0] > x_max) | (lines[..., 1] < y_min) | (lines[..., 1] > y_max)
+    )
+    # Once a line leaves the window it stays cut, even if it would come back.
+    lines[np.maximum.accumulate(outside, axis=1)] = np.nan
+    return lines
+
+
+def phase_portrait(
+    plane: str,
+    K: np.ndarray | None = None,
+    t_final: float = 10.0,
+    steps: int = 300,
+    field_resolution: int = FIELD_RESOLUTION,
+    seed_resolution: int = SEED_RESOLUTION,
+) -> PhaseField:
+    """Return the cached direction field and streamlines of ``plane`` under u = -K y."""
+    (_, a_range), (_, b_range) = PHASE_PLANES[plane]
+    matrix = plane_matrix(plane, K)
+    bounds = ((-a_range, a_range), (-b_range, b_range))
+    x_values = np.linspace(-a_range, a_range, field_resolution)
+    y_values = np.linspace(-b_range, b_range, field_resolution)
+
+    def compute() -> dict[str, np.ndarray]:
+        # Seeds sit at the centers of a coarser grid so none starts on the window edge.
+        a_seeds = a_range * (2 * np.arange(seed_resolution) + 1 - seed_resolution) / seed_resolution
+        b_seeds = b_range * (2 * np.arange(seed_resolution) + 1 - seed_resolution) / seed_resolution
+        seeds = np.stack(np.meshgrid(a_seeds, b_seeds), axis=-1).reshape(-1, 2)
+        dt = t_final / steps
+        return {
+            "vectors": direction_field(matrix, x_values, y_values),
+            "times": dt * np.arange(steps + 1),
+            "lines": streamlines(matrix, seeds, dt, steps, bounds),
+        }
+
+    arrays = cache.cached_arrays(
+        _NAMESPACE,
+        "portrait-" + cache.digest(plane, matrix, t_final, steps, field_resolution, seed_resolution),
+        compute,
+    )
+    return PhaseField(
+        plane=plane,
+        matrix=matrix,
+        x_values=x_values,
+        y_values=y_values,
+        vectors=arrays["vectors"],
+        times=arrays["times"],
+        lines=arrays["lines"],
+    )
@@ -0,0 +1,187 @@
+"""
+Gaussian MLP policies π_θ(u|x) = N(μ(x; θ), Σ) evaluated in batches.
+
+``MLPPolicy`` is the network of the continuous-policy slide: affine layers
+T_ℓ(z) = W z + b with ``tanh`` between them and a linear output, read from
+the subsystem coordinates of the state and added to the hover speed. A
+forward pass over thousands of states is one matrix product per layer, and
+``sample`` draws all the Gaussian actions of a batch at once, so a fan of
+hundreds of stochastic rollouts advances with a single call to the
+vectorized quadcopter model per step.
+
+Weights are read from ``results/<name>.npz`` (arrays ``W0, b0, W1, b1, ...``
+and ``sigma``). Without such a file, ``load_policy`` fits the output layer
+of a random-feature network to the LQR hover controller by least squares,
+so the slide always has a sensible, reproducible μ_θ.
+
+Example:
+    from engines.policy import load_policy, rollout_fan
+    fan = rollout_fan(load_policy(), {"varphi": 0.5}, n_rollouts=500)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from . import cache
+from .quadcopter import STATE_INDEX, STATE_LABELS, SUBSYSTEM_LABELS, hover_speed, rk4_step
+from .series import results_dir
+from .stability import STABILITY_SETS, linear_feedback
+
+
+_NAMESPACE = "policy"
+
+DEFAULT_POLICY = "continuous_policy"
+DEFAULT_HIDDEN = (64, 64)
+# Exploration std of each rotor speed (rad/s).
+DEFAULT_SIGMA = 15.0
+# Scale of the random hidden weights; small enough that tanh stays close to
+# linear over the stability sets, where the LQR target is linear.
+FEATURE_GAIN = 0.1
+
+
+@dataclass(frozen=True)
+class MLPPolicy:
+    """Gaussian policy with mean ω0 + f_θ(x_S) and diagonal std ``sigma``."""
+
+    weights: tuple[np.ndarray, ...]
+    biases: tuple[np.ndarray, ...]
+    sigma: np.ndarray
+    labels: tuple[str, ...] = SUBSYSTEM_LABELS
+    hover: float = hover_speed()
+
+    def features(self, states: np.ndarray) -> np.ndarray:
+        """Return the last hidden layer ``(..., n_L)`` for states ``(..., 12)``."""
+        z = states[..., [STATE_INDEX[label] for label in self.labels]]
+        for W, b in zip(self.weights[:-1], self.biases[:-1]):
+            z = np.tanh(z @ W.T + b)
+        return z
+
+    def mean(self, states: np.ndarray) -> np.ndarray:
+        """Return μ(x; θ) as rotor speeds ``(..., 4)``."""
+        return self.hover + self.features(states) @ self.weights[-1].T + self.biases[-1]
+
+    def sample(self, states: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Draw one action per state from N(μ(x; θ), diag(σ²))."""
+        mean = self.mean(states)
+        return mean + self.sigma * rng.standard_normal(mean.shape)
+
+    def __call__(self, states: np.ndarray) -> np.ndarray:
+        return self.mean(states)
+
+
+def load_mlp(path: str | Path) -> MLPPolicy:
+    """Read a policy from an ``.npz`` with ``W0, b0, ..., W{L-1}, b{L-1}`` and ``sigma``."""
+    with np.load(path, allow_pickle=False) as archive:
+        layers = sum(1 for name in archive.files if name.startswith("W"))
+        return MLPPolicy(
+            weights=tuple(archive[f"W{index}"] for index in range(layers)),
+            biases=tuple(archive[f"b{index}"] for index in range(layers)),
+            sigma=np.asarray(archive["sigma"], dtype=float) if "sigma" in archive.files else np.full(4, DEFAULT_SIGMA),
+        )
+
+
+def save_mlp(policy: MLPPolicy, path: str | Path) -> None:
+    """Write ``policy`` in the format read by ``load_mlp``."""
+    arrays = {f"W{index}": W for index, W in enumerate(policy.weights)}
+    arrays.update({f"b{index}": b for index, b in enumerate(policy.biases)})
+    np.savez(path, sigma=policy.sigma, **arrays)
+
+
+def fit_to_controller(
+    controller,
+    hidden: tuple[int, ...] = DEFAULT_HIDDEN,
+    n_samples: int = 20_000,
+    sigma: float = DEFAULT_SIGMA,
+    seed: int = 0,
+) -> MLPPolicy:
+    """Return a random-feature MLP whose output layer imitates ``controller`` (least squares).
+
+    Training states are drawn uniformly from the stability sets' ranges, so
+    the fit covers the region the slides fly through.
+    """
+    def compute() -> dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        half_width = np.zeros(len(STATE_LABELS))
+        for (a_label, a_range), (b_label, b_range) in STABILITY_SETS.values():
+            half_width[STATE_INDEX[a_label]] = a_range
+            half_width[STATE_INDEX[b_label]] = b_range
+        states = rng.uniform(-1.0, 1.0, (n_samples, len(STATE_LABELS))) * half_width
+        scale = half_width[[STATE_INDEX[label] for label in SUBSYSTEM_LABELS]]
+
+        arrays, fan_in = {}, FEATURE_GAIN / scale
+        z = states[:, [STATE_INDEX[label] for label in SUBSYSTEM_LABELS]]
+        for index, width in enumerate(hidden):
+            W = rng.standard_normal((width, z.shape[1])) * fan_in
+            b = FEATURE_GAIN * rng.uniform(-1.0, 1.0, width)
+            arrays[f"W{index}"], arrays[f"b{index}"] = W, b
+            z = np.tanh(z @ W.T + b)
+            fan_in = np.full(width, FEATURE_GAIN / np.sqrt(width))
+
+        target = controller(states) - hover_speed()
+        design = np.hstack([z, np.ones((len(z), 1))])
+        readout, *_ = np.linalg.lstsq(design, target, rcond=None)
+        arrays[f"W{len(hidden)}"] = readout[:-1].T
+        arrays[f"b{len(hidden)}"] = readout[-1]
+        return arrays
+
+    arrays = cache.cached_arrays(
+        _NAMESPACE,
+        "fit-" + cache.digest(controller, tuple(hidden), n_samples, seed),
+        compute,
+    )
+    layers = len(hidden) + 1
+    return MLPPolicy(
+        weights=tuple(arrays[f"W{index}"] for index in range(layers)),
+        biases=tuple(arrays[f"b{index}"] for index in range(layers)),
+        sigma=np.full(4, sigma),
+    )
+
+
+def load_policy(name: str = DEFAULT_POLICY) -> MLPPolicy:
+    """Return ``results/<name>.npz``, or a network fitted to the LQR hover controller."""
+    path = results_dir() / f"{name}.npz"
+    if path.exists():
+        return load_mlp(path)
+    return fit_to_controller(linear_feedback())
+
+
+def rollout_fan(
+    policy: MLPPolicy,
+    initial_state: dict[str, float],
+    n_rollouts: int = 500,
+    t_final: float = 10.0,
+    dt: float = 0.04,
+    seed: int = 0,
+) -> dict[str, np.ndarray]:
+    """Return ``t``, ``mean`` ``(steps + 1, 12)`` and ``samples`` ``(steps + 1, n_rollouts, 12)``.
+
+    ``mean`` flies the deterministic policy μ_θ; every sample draws its own
+    Gaussian action at each step. The result is cached per (policy, start, seed).
+    """
+    steps = int(round(t_final / dt))
+    x0 = np.zeros(len(STATE_LABELS))
+    for label, value in initial_state.items():
+        x0[STATE_INDEX[label]] = value
+
+    def compute() -> dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        states = np.tile(x0, (n_rollouts + 1, 1))
+        trajectory = np.empty((steps + 1,) + states.shape)
+        trajectory[0] = states
+        with np.errstate(all="ignore"):
+            for step in range(steps):
+                actions = policy.sample(states, rng)
+                actions[0] = policy.mean(states[0])
+                states = rk4_step(states, actions, dt)
+                trajectory[step + 1] = states
+        return {"t": dt * np.arange(steps + 1), "mean": trajectory[:, 0], "samples": trajectory[:, 1:]}
+
+    return cache.cached_arrays(
+        _NAMESPACE,
+        "fan-" + cache.digest(policy, x0, n_rollouts, steps, dt, seed),
+        compute,
+    )
@@ -0,0 +1,116 @@
+"""
+Quadcopter constants and the hover linearization used throughout the deck.
+
+Constants follow the table ``tab:quadcopter_cons`` of the dissertation. The
+state is ordered as x = [u, v, w, p, q, r, φ, θ, ψ, x, y, z] and the input is
+the vector of rotor speeds u = [ω1, ω2, ω3, ω4].
+
+``dynamics`` is the nonlinear vector field of equations (u)–(z), evaluated
+for whole batches of states at once; its Jacobian at the hover point is
+``linearized_model``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+G = 9.81
+MASS = 0.468
+ARM_LENGTH = 0.225
+DRAG_COEFF = 2.980e-6
+LIFT_COEFF = 1.140e-7
+IXX = 4.856e-3
+IYY = 4.856e-3
+IZZ = 8.801e-3
+
+STATE_LABELS = ("u", "v", "w", "p", "q", "r", "varphi", "theta", "psi", "x", "y", "z")
+STATE_INDEX = {name: index for index, name in enumerate(STATE_LABELS)}
+
+# Controllable subsystem y = (φ, θ, ψ, z, p, q, r, w) from the linearization slide.
+SUBSYSTEM_LABELS = ("varphi", "theta", "psi", "z", "p", "q", "r", "w")
+
+
+def hover_speed() -> float:
+    """Return ω0, the rotor speed that keeps the quadcopter hovering."""
+    return float(np.sqrt(G * MASS / (4.0 * LIFT_COEFF)))
+
+
+def linearized_model() -> tuple[np.ndarray, np.ndarray]:
+    """Return the Jacobians ``(A, B)`` evaluated at the hover point (0, u*)."""
+    idx = STATE_INDEX
+    omega0 = hover_speed()
+
+    A = np.zeros((12, 12))
+    A[idx["u"], idx["theta"]] = -G
+    A[idx["v"], idx["varphi"]] = -G
+    for angle, rate in (("varphi", "p"), ("theta", "q"), ("psi", "r")):
+        A[idx[angle], idx[rate]] = 1.0
+    for position, velocity in (("x", "u"), ("y", "v"), ("z", "w")):
+        A[idx[position], idx[velocity]] = 1.0
+
+    B = np.zeros((12, 4))
+    B[idx["w"]] = -2.0 * LIFT_COEFF / MASS * omega0 * np.array([1.0, 1.0, 1.0, 1.0])
+    B[idx["p"]] = 2.0 * ARM_LENGTH * DRAG_COEFF / IXX * omega0 * np.array([0.0, -1.0, 0.0, 1.0])
+    B[idx["q"]] = 2.0 * ARM_LENGTH * DRAG_COEFF / IYY * omega0 * np.array([-1.0, 0.0, 1.0, 0.0])
+    B[idx["r"]] = 2.0 * ARM_LENGTH * DRAG_COEFF / IZZ * omega0 * np.array([-1.0, 1.0, -1.0, 1.0])
+    return A, B
+
+
+def subsystem(labels: tuple[str, ...] = SUBSYSTEM_LABELS) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(Ã, B̃)`` restricted to the given state labels, in that order."""
+    A, B = linearized_model()
+    rows = [STATE_INDEX[label] for label in labels]
+    return A[np.ix_(rows, rows)], B[rows]
+
+
+def dynamics(states: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+    """Return ẋ = f(x, u) for batches of states ``(..., 12)`` and rotor speeds ``(..., 4)``."""
+    u, v, w, p, q, r, phi, theta = np.moveaxis(states[..., :8], -1, 0)
+    squared = np.moveaxis(np.asarray(inputs) ** 2, -1, 0)
+    torque = ARM_LENGTH * DRAG_COEFF
+
+    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    sin_theta, cos_theta = np.sin(theta), np.cos(theta)
+    yaw_rate = q * sin_phi + r * cos_phi
+
+    derivative = np.empty(np.broadcast_shapes(states.shape, squared.shape[1:] + (12,)))
+    derivative[..., 0] = r * v - q * w - G * sin_theta
+    derivative[..., 1] = p * w - r * u - G * cos_theta * sin_phi
+    derivative[..., 2] = q * u - p * v + G * cos_phi * cos_theta - LIFT_COEFF / MASS * squared.sum(axis=0)
+    derivative[..., 3] = torque / IXX * (squared[3] - squared[1]) - q * r * (IZZ - IYY) / IXX
+    derivative[..., 4] = torque / IYY * (squared[2] - squared[0]) - p * r * (IXX - IZZ) / IYY
+    derivative[..., 5] = torque / IZZ * (squared[1] + squared[3] - squared[0] - squared[2])
+    derivative[..., 6] = p + yaw_rate * np.tan(theta)
+    derivative[..., 7] = q * cos_phi - r * sin_phi
+    derivative[..., 8] = yaw_rate / cos_theta
+    derivative[..., 9:] = states[..., :3]
+    return derivative
+
+
+def rk4_step(states: np.ndarray, inputs: np.ndarray, dt: float) -> np.ndarray:
+    """Advance ``states`` by ``dt`` with the rotor speeds held constant (RK4)."""
+    k1 = dynamics(states, inputs)
+    k2 = dynamics(states + 0.5 * dt * k1, inputs)
+    k3 = dynamics(states + 0.5 * dt * k2, inputs)
+    k4 = dynamics(states + dt * k3, inputs)
+    return states + dt / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+
+def simulate(controller, states: np.ndarray, dt: float, steps: int) -> tuple[np.ndarray, np.ndarray]:
+    """Fly ``states`` under ``controller`` and return ``(trajectory, inputs)``.
+
+    ``trajectory`` has shape ``(steps + 1, ..., 12)`` and ``inputs`` has shape
+    ``(steps, ..., 4)``; the control is held constant over each step.
+    """
+    states = np.asarray(states, dtype=float)
+    trajectory = np.empty((steps + 1,) + states.shape)
+    trajectory[0] = states
+    inputs = None
+    for step in range(steps):
+        action = controller(trajectory[step])
+        if inputs is None:
+            inputs = np.empty((steps,) + action.shape)
+        inputs[step] = action
+        trajectory[step + 1] = rk4_step(trajectory[step], action, dt)
+    return trajectory, inputs
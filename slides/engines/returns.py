@@ -0,0 +1,59 @@
+"""
+Discounted returns G_t = Σ_k γ^k r_{t+k+1} for whole batches of episodes.
+
+Returns are computed with one reverse scan over time, G_t = r_{t+1} + γ G_{t+1},
+vectorized over episodes and over any number of discount factors at once.
+Variants:
+
+- episodic: rewards after termination are zero-padded, so G_t stops there;
+- infinite horizon: episodes truncated at T are closed with a bootstrap value
+  γ^(T-t) V(x_T);
+- truncated: only the next ``horizon`` rewards are summed (n-step returns).
+
+Example:
+    from engines.returns import discounted_returns
+    G = discounted_returns(rewards, gamma=np.linspace(0, 0.99, 50))
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def discounted_returns(
+    rewards: np.ndarray,
+    gamma: float | np.ndarray,
+    bootstrap: np.ndarray | None = None,
+    horizon: int | None = None,
+) -> np.ndarray:
+    """Return G_t for every step of every episode.
+
+    ``rewards`` has shape ``(..., T)`` where ``rewards[..., t]`` is r_{t+1}.
+    A scalar ``gamma`` gives an output shaped like ``rewards``; an array of
+    discount factors of shape ``(n_gammas,)`` prepends that axis.
+    ``bootstrap`` is the value V(x_T) of the state reached after the last
+    reward, broadcastable to ``gamma.shape + rewards.shape[:-1]`` so each
+    discount factor can use its own V; ``horizon`` limits the sum to the
+    next ``horizon`` rewards and cannot be combined with ``bootstrap``.
+    """
+    rewards = np.asarray(rewards, dtype=float)
+    gammas = np.asarray(gamma, dtype=float)
+    if horizon is not None and bootstrap is not None:
+        raise ValueError("A truncated return cannot also be bootstrapped.")
+    if horizon is not None and horizon < 1:
+        raise ValueError(f"horizon must be at least 1, got {horizon}")
+
+    g = gammas.reshape(gammas.shape + (1,) * (rewards.ndim - 1))
+    steps = rewards.shape[-1]
+    returns = np.empty(gammas.shape + rewards.shape)
+    running = np.zeros(gammas.shape + rewards.shape[:-1])
+    if bootstrap is not None:
+        running = running + np.asarray(bootstrap, dtype=float)
+    for t in range(steps - 1, -1, -1):
+        running = rewards[..., t] + g * running
+        returns[..., t] = running
+
+    if horizon is not None and horizon < steps:
+        # G_t^(h) = G_t - γ^h G_{t+h}: drop everything past the horizon
+        returns[..., :-horizon] -= g[..., None] ** horizon * returns[..., horizon:]
+    return returns
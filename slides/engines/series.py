@@ -0,0 +1,131 @@
+"""
+Result series for vector plots: training/rollout logs and LTTB downsampling.
+
+Logs are tables of named columns stored as ``.csv`` (header row) or ``.npz``
+under ``results/`` (override with the ``SLIDES_RESULTS_DIR`` environment
+variable). Long columns are reduced with Largest-Triangle-Three-Buckets,
+which keeps the first and last samples plus, per bucket, the sample that
+spans the largest triangle with its neighbours, so peaks and the overall
+shape survive while every curve stays under a fixed vertex budget.
+
+When no log exists, ``rollout_log`` simulates the same table (``t``, the
+twelve states and ``omega1``..``omega4``) from the nonlinear model.
+
+Example:
+    from engines.series import downsample, rollout_log
+    log = rollout_log(linear_feedback(), {"varphi": 0.5}, t_final=10.0)
+    t, phi = downsample(log["t"], log["varphi"], budget=400)
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from . import cache
+from .quadcopter import STATE_INDEX, STATE_LABELS, simulate
+
+
+_NAMESPACE = "series"
+
+DEFAULT_RESULTS_DIR = Path(__file__).resolve().parents[2] / "results"
+
+LOG_SUFFIXES = (".npz", ".csv")
+
+INPUT_LABELS = ("omega1", "omega2", "omega3", "omega4")
+
+
+def results_dir() -> Path:
+    """Return the directory that holds training and rollout logs."""
+    return Path(os.environ.get("SLIDES_RESULTS_DIR", DEFAULT_RESULTS_DIR))
+
+
+def load_log(path: str | Path) -> dict[str, np.ndarray]:
+    """Return the columns of a ``.csv`` (with header) or ``.npz`` log as float arrays."""
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path) as archive:
+            return {name: np.asarray(archive[name], dtype=float) for name in archive.files}
+    if path.suffix == ".csv":
+        table = np.genfromtxt(path, delimiter=",", names=True, dtype=float, ndmin=1)
+        return {name: np.asarray(table[name]) for name in table.dtype.names}
+    raise ValueError(f"unsupported log format: {path.suffix!r}")
+
+
+def find_log(name: str) -> Path | None:
+    """Return ``results/<name>.npz`` or ``results/<name>.csv``, or ``None`` if neither exists."""
+    for suffix in LOG_SUFFIXES:
+        path = results_dir() / f"{name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return the indices of the ``n_out`` samples of ``(x, y)`` kept by LTTB."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out < 3:
+        raise ValueError(f"LTTB needs at least 3 output points, got {n_out}")
+    if n <= n_out:
+        return np.arange(n)
+
+    # n_out - 2 buckets over the interior samples; the end points are always kept.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    anchor = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_x = x[stop:edges[bucket + 2]].mean()
+            next_y = y[stop:edges[bucket + 2]].mean()
+        area = np.abs(
+            (x[anchor] - next_x) * (y[start:stop] - y[anchor])
+            - (x[anchor] - x[start:stop]) * (next_y - y[anchor])
+        )
+        anchor = start + int(np.argmax(area))
+        indices[bucket + 1] = anchor
+    return indices
+
+
+def downsample(x: np.ndarray, y: np.ndarray, budget: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(x, y)`` reduced to at most ``budget`` samples with LTTB."""
+    indices = lttb_indices(x, y, budget)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+
+def rollout_log(
+    controller,
+    initial_state: dict[str, float],
+    t_final: float = 10.0,
+    dt: float = 0.04,
+) -> dict[str, np.ndarray]:
+    """Return the cached log of one closed-loop flight from ``initial_state``.
+
+    Columns are ``t``, the state labels and the rotor speeds ``omega1``..``omega4``
+    (the last control is repeated so every column has the same length).
+    """
+    steps = int(round(t_final / dt))
+    x0 = np.zeros(len(STATE_LABELS))
+    for label, value in initial_state.items():
+        x0[STATE_INDEX[label]] = value
+
+    def compute() -> dict[str, np.ndarray]:
+        trajectory, inputs = simulate(controller, x0, dt, steps)
+        inputs = np.concatenate([inputs, inputs[-1:]])
+        log = {"t": dt * np.arange(steps + 1)}
+        log.update({label: trajectory[:, index] for index, label in enumerate(STATE_LABELS)})
+        log.update({label: inputs[:, index] for index, label in enumerate(INPUT_LABELS)})
+        return log
+
+    return cache.cached_arrays(
+        _NAMESPACE,
+        "rollout-" + cache.digest(controller, x0, steps, dt),
+        compute,
+    )
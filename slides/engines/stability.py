@@ -0,0 +1,220 @@
+"""
+Stability maps of the closed-loop quadcopter over grids of initial states.
+
+Following section "Análisis de estabilidad" of the dissertation, each map
+varies one pair of coordinates (w–z, p–φ, q–θ or r–ψ) over a regular grid,
+keeps the other coordinates at zero, flies every initial condition for
+``t_final`` seconds under a controller and records the ∞-norm of the
+coordinates named by the stability criterion at the final time. A point is
+stable when that norm is below ε.
+
+The whole grid is integrated at once with the vectorized nonlinear model
+(RK4, zero-order hold on the control). Large grids are split into tiles that
+run in a process pool, and the final norms are cached per (controller, pair,
+grid, horizon), so changing ε never re-simulates.
+
+Three controllers are mapped: the LQR hover controller, the global
+linear policy of the last GPS iteration and the DDPG actor. All three act
+on the hover subsystem x_S only, so they share the same criterion.
+
+Example:
+    from engines.stability import linear_feedback, stability_map
+    result = stability_map(linear_feedback(), "p-varphi", resolution=200)
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import cache
+from .control import lqr_gain
+from .ddpg import OBS_SCALE, DDPGConfig, DDPGRun, mlp_forward
+from .gps import GPSHistory
+from .quadcopter import STATE_INDEX, STATE_LABELS, SUBSYSTEM_LABELS, hover_speed, rk4_step, subsystem
+
+
+_NAMESPACE = "stability"
+
+# Initial-condition sets χ of the dissertation: (rate, range), (coordinate, range).
+STABILITY_SETS = {
+    "w-z": (("w", 10.0), ("z", 20.0)),
+    "p-varphi": (("p", 1.0), ("varphi", np.pi / 2)),
+    "q-theta": (("q", 1.0), ("theta", np.pi / 2)),
+    "r-psi": (("r", 1.0), ("psi", np.pi / 2)),
+}
+
+# Coordinates checked by each controller's criterion ‖x_S(t_final)‖∞ < ε.
+# The GPS and DDPG policies of engines.gps / engines.ddpg observe x_S only
+# and cannot regulate u, v, x, y, so they are judged on x_S like LQR.
+CRITERIA = {
+    "linear": ("w", "z", "p", "q", "r", "varphi", "theta", "psi"),
+    "gps": ("w", "z", "p", "q", "r", "varphi", "theta", "psi"),
+    "ddpg": ("w", "z", "p", "q", "r", "varphi", "theta", "psi"),
+}
+
+# States beyond this bound (or non-finite) count as diverged.
+DIVERGENCE_BOUND = 1e3
+
+# Stiffer gains (R = 1e-4, poles up to ~120 rad/s) are not stable at dt = 0.04.
+STABILITY_LQR_R = 1e-2
+
+
+@dataclass(frozen=True)
+class LinearFeedback:
+    """Hover controller ω = ω0 - K x_S acting on a subset S of the state."""
+
+    K: np.ndarray
+    labels: tuple[str, ...]
+    hover: float | np.ndarray
+
+    def __call__(self, states: np.ndarray) -> np.ndarray:
+        rows = [STATE_INDEX[label] for label in self.labels]
+        return self.hover - states[..., rows] @ self.K.T
+
+
+@dataclass(frozen=True)
+class MLPFeedback:
+    """Actor ω = ω0 + s·tanh(μ(x_S / scale)) of a tanh MLP with parameters ``[W0, b0, ...]``."""
+
+    params: tuple[np.ndarray, ...]
+    obs_scale: np.ndarray
+    action_scale: float
+    hover: float
+
+    def __call__(self, states: np.ndarray) -> np.ndarray:
+        rows = [STATE_INDEX[label] for label in SUBSYSTEM_LABELS]
+        out, _ = mlp_forward(list(self.params), states[..., rows] / self.obs_scale)
+        return self.hover + self.action_scale * np.tanh(out)
+
+
+@dataclass(frozen=True)
+class StabilityMap:
+    """Final-time criterion norms over a grid of initial conditions."""
+
+    pair: str
+    a_values: np.ndarray
+    b_values: np.ndarray
+    final_norm: np.ndarray
+
+    @property
+    def labels(self) -> tuple[str, str]:
+        (a_label, _), (b_label, _) = STABILITY_SETS[self.pair]
+        return a_label, b_label
+
+    def stable(self, epsilon: float = 0.5) -> np.ndarray:
+        """Return the ``(len(b_values), len(a_values))`` mask of stable initial conditions."""
+        return self.final_norm < epsilon
+
+    def stable_rate(self, epsilon: float = 0.5) -> float:
+        return float(self.stable(epsilon).mean())
+
+
+def linear_feedback(R: float = STABILITY_LQR_R) -> LinearFeedback:
+    """Return the LQR hover controller of the subsystem with Q = I and R = r·I."""
+    A, B = subsystem()
+    K, _ = lqr_gain(A, B, np.eye(len(SUBSYSTEM_LABELS)), R * np.eye(4))
+    return LinearFeedback(K=K, labels=SUBSYSTEM_LABELS, hover=hover_speed())
+
+
+def gps_feedback(history: GPSHistory) -> LinearFeedback:
+    """Return the global policy mean u = W x_S + b of the last iteration of ``history``."""
+    return LinearFeedback(K=-history.W[-1], labels=SUBSYSTEM_LABELS, hover=hover_speed() + history.b[-1])
+
+
+def ddpg_feedback(run: DDPGRun, config: DDPGConfig) -> MLPFeedback:
+    """Return the deterministic actor of ``run`` (trained with ``config``) after its last epoch."""
+    return MLPFeedback(
+        params=run.actor,
+        obs_scale=OBS_SCALE,
+        action_scale=config.action_scale,
+        hover=hover_speed(),
+    )
+
+
+def initial_grid(pair: str, resolution: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(a_values, b_values, states)`` with states of shape ``(resolution², 12)``."""
+    (a_label, a_range), (b_label, b_range) = STABILITY_SETS[pair]
+    a_values = np.linspace(-a_range, a_range, resolution)
+    b_values = np.linspace(-b_range, b_range, resolution)
+    a_grid, b_grid = np.meshgrid(a_values, b_values)
+    states = np.zeros((resolution * resolution, len(STATE_LABELS)))
+    states[:, STATE_INDEX[a_label]] = a_grid.ravel()
+    states[:, STATE_INDEX[b_label]] = b_grid.ravel()
+    return a_values, b_values, states
+
+
+def final_norms(
+    controller,
+    states: np.ndarray,
+    dt: float,
+    steps: int,
+    criterion: tuple[str, ...],
+    check_every: int = 25,
+) -> np.ndarray:
+    """Fly every state for ``steps`` control periods; return ‖x_S(T)‖∞ (``inf`` if diverged).
+
+    Every ``check_every`` steps, trajectories that left ``DIVERGENCE_BOUND``
+    are retired so the remaining batch keeps shrinking.
+    """
+    columns = [STATE_INDEX[label] for label in criterion]
+    norms = np.full(len(states), np.inf, dtype=np.float32)
+    active = np.arange(len(states))
+    states = np.array(states, dtype=float)
+    with np.errstate(all="ignore"):
+        for step in range(1, steps + 1):
+            states = rk4_step(states, controller(states), dt)
+            if step % check_every == 0 or step == steps:
+                bounded = np.abs(states).max(axis=1) < DIVERGENCE_BOUND
+                if not bounded.all():
+                    states, active = states[bounded], active[bounded]
+        norms[active] = np.abs(states[:, columns]).max(axis=1)
+    return norms
+
+
+def stability_map(
+    controller,
+    pair: str,
+    resolution: int = 200,
+    t_final: float = 30.0,
+    dt: float = 0.04,
+    criterion: tuple[str, ...] = CRITERIA["linear"],
+    tile_size: int = 4_000,
+    workers: int | None = None,
+) -> StabilityMap:
+    """Return the cached stability map of ``controller`` over the ``pair`` grid.
+
+    ``controller`` maps states ``(n, 12)`` to rotor speeds ``(n, 4)`` and must
+    be a picklable dataclass so tiles can run in worker processes.
+    """
+    steps = int(round(t_final / dt))
+    a_values, b_values, states = initial_grid(pair, resolution)
+
+    def compute() -> dict[str, np.ndarray]:
+        tiles = [states[start:start + tile_size] for start in range(0, len(states), tile_size)]
+        n_workers = min(len(tiles), workers or os.cpu_count() or 1)
+        if n_workers <= 1:
+            norms = [final_norms(controller, tile, dt, steps, criterion) for tile in tiles]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                norms = list(
+                    pool.map(
+                        final_norms,
+                        [controller] * len(tiles),
+                        tiles,
+                        [dt] * len(tiles),
+                        [steps] * len(tiles),
+                        [criterion] * len(tiles),
+                    )
+                )
+        return {"final_norm": np.concatenate(norms).reshape(resolution, resolution)}
+
+    arrays = cache.cached_arrays(
+        _NAMESPACE,
+        "map-" + cache.digest(controller, pair, resolution, steps, dt, tuple(criterion)),
+        compute,
+    )
+    return StabilityMap(pair, a_values, b_values, arrays["final_norm"])
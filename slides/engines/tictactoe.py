@@ -0,0 +1,323 @@
+"""
+Tabular Q-learning for the TicTacToe example of the Q-learning slide.
+
+The agent plays X (moving first) against an opponent that plays uniformly at
+random. Boards are encoded in base 3 (0 empty, 1 X, 2 O) and reduced under
+the 8 symmetries of the square, so every position maps to a dense integer
+index into a ``(n_states, 9)`` NumPy Q-array.
+
+Training runs many games in parallel: ε-greedy selection, opponent moves and
+TD updates are vectorized over the batch, with simultaneous updates of the
+same (x, u) pair averaged. Single episodes can then be replayed move by move
+as an update log for the slide to animate.
+
+Example:
+    from engines.tictactoe import train, find_episode
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import cache
+
+
+_NAMESPACE = "tictactoe"
+
+EMPTY, AGENT, OPPONENT = 0, 1, 2
+REWARD_WIN, REWARD_LOSS, REWARD_DRAW = 1.0, -1.0, 0.0
+
+LINES = np.array(
+    [
+        [0, 1, 2], [3, 4, 5], [6, 7, 8],
+        [0, 3, 6], [1, 4, 7], [2, 5, 8],
+        [0, 4, 8], [2, 4, 6],
+    ]
+)
+POWERS = 3 ** np.arange(9)
+
+
+def _symmetries() -> np.ndarray:
+    """Return the 8 cell permutations of the dihedral group of the square."""
+    cells = np.arange(9).reshape(3, 3)
+    return np.array(
+        [np.rot90(cells, k).ravel() for k in range(4)]
+        + [np.rot90(cells.T, k).ravel() for k in range(4)]
+    )
+
+
+# canonical[i] = board[PERMS[t, i]]; INV_PERMS maps board cells to canonical cells.
+PERMS = _symmetries()
+INV_PERMS = np.argsort(PERMS, axis=1)
+
+
+def _build_tables() -> tuple[np.ndarray, np.ndarray, int]:
+    codes = np.arange(3**9)
+    boards = (codes[:, None] // POWERS) % 3
+    symmetric_codes = (boards[:, PERMS] * POWERS).sum(axis=2)
+    transform = symmetric_codes.argmin(axis=1)
+    canonical_codes = symmetric_codes[codes, transform]
+    _, state_ids = np.unique(canonical_codes, return_inverse=True)
+    return state_ids.astype(np.int32), transform.astype(np.int8), int(state_ids.max()) + 1
+
+
+STATE_ID, TRANSFORM, N_STATES = _build_tables()
+
+
+@dataclass(frozen=True)
+class QUpdate:
+    """One agent move of a replayed episode and the Q-learning update it caused."""
+
+    board: tuple[int, ...]
+    action: int
+    q_before: np.ndarray
+    q_after: float
+    reward: float
+    td_error: float
+    opponent_action: int | None
+    outcome: str | None
+
+
+@dataclass(frozen=True)
+class TrainingResult:
+    """Q-array after bulk training plus the per-batch outcome rates."""
+
+    Q: np.ndarray
+    episodes: int
+    win_rate: np.ndarray
+    draw_rate: np.ndarray
+    loss_rate: np.ndarray
+
+
+def encode(boards: np.ndarray) -> np.ndarray:
+    """Return the base-3 code of each board (shape ``(..., 9)``)."""
+    return np.asarray(boards, dtype=np.int64) @ POWERS
+
+
+def state_index(boards: np.ndarray) -> np.ndarray:
+    """Return the symmetry-reduced state index of each board."""
+    return STATE_ID[encode(boards)]
+
+
+def winners(boards: np.ndarray, player: int) -> np.ndarray:
+    """Return a mask of the boards on which ``player`` has three in a row."""
+    return (np.asarray(boards)[..., LINES] == player).all(axis=-1).any(axis=-1)
+
+
+def q_values(Q: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    """Return Q(x, ·) in board orientation, ``nan`` on occupied cells."""
+    boards = np.atleast_2d(boards)
+    codes = encode(boards)
+    rows = Q[STATE_ID[codes]]
+    values = np.take_along_axis(rows, INV_PERMS[TRANSFORM[codes]], axis=1)
+    return np.where(boards == EMPTY, values, np.nan)
+
+
+def _random_legal(legal: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    return np.argmax(rng.random(legal.shape) * legal, axis=1)
+
+
+def epsilon_greedy(
+    values: np.ndarray,
+    legal: np.ndarray,
+    epsilon: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Pick one legal cell per row: greedy with prob. 1 - ε, uniform otherwise."""
+    noise = rng.random(values.shape) * 1e-9  # random tie-breaking
+    greedy = np.argmax(np.where(legal, values + noise, -np.inf), axis=1)
+    explore = rng.random(values.shape[0]) < epsilon
+    return np.where(explore, _random_legal(legal, rng), greedy)
+
+
+def _play_batch(
+    Q: np.ndarray,
+    n_games: int,
+    rng: np.random.Generator,
+    epsilon: float,
+    alpha: float,
+    gamma: float,
+    learn: bool,
+) -> np.ndarray:
+    """Play ``n_games`` in parallel, updating ``Q`` in place; return final rewards."""
+    boards = np.zeros((n_games, 9), dtype=np.int8)
+    rewards = np.zeros(n_games)
+    active = np.ones(n_games, dtype=bool)
+    games = np.arange(n_games)
+
+    while active.any():
+        live = games[active]
+        board = boards[live]
+        codes = encode(board)
+        states = STATE_ID[codes]
+        action = epsilon_greedy(q_values(Q, board), board == EMPTY, epsilon, rng)
+        canonical_action = INV_PERMS[TRANSFORM[codes], action]
+
+        board[np.arange(live.size), action] = AGENT
+        reward = np.zeros(live.size)
+        done = winners(board, AGENT)
+        reward[done] = REWARD_WIN
+        done |= (board != EMPTY).all(axis=1)
+
+        reply = np.flatnonzero(~done)
+        if reply.size:
+            opponent = _random_legal(board[reply] == EMPTY, rng)
+            board[reply, opponent] = OPPONENT
+            lost = reply[winners(board[reply], OPPONENT)]
+            reward[lost] = REWARD_LOSS
+            done[lost] = True
+            done |= (board != EMPTY).all(axis=1)
+
+        if learn:
+            bootstrap = np.zeros(live.size)
+            running = np.flatnonzero(~done)
+            if running.size:
+                bootstrap[running] = np.nanmax(q_values(Q, board[running]), axis=1)
+            td_error = reward + gamma * bootstrap - Q[states, canonical_action]
+            flat = states * 9 + canonical_action
+            total = np.bincount(flat, weights=td_error, minlength=Q.size)
+            count = np.bincount(flat, minlength=Q.size)
+            touched = count > 0
+            Q.reshape(-1)[touched] += alpha * total[touched] / count[touched]
+
+        boards[live] = board
+        rewards[live[done]] = reward[done]
+        active[live[done]] = False
+
+    return rewards
+
+
+def train(
+    episodes: int = 100_000,
+    alpha: float = 0.3,
+    gamma: float = 0.9,
+    epsilon: tuple[float, float] = (0.3, 0.05),
+    batch_size: int = 500,
+    seed: int = 0,
+) -> TrainingResult:
+    """Train from Q = 0 for ``episodes`` games (cached); ε decays linearly."""
+
+    def compute() -> dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        Q = np.zeros((N_STATES, 9))
+        n_batches = max(1, -(-episodes // batch_size))
+        epsilons = np.linspace(epsilon[0], epsilon[1], n_batches)
+        rates = np.zeros((n_batches, 3))
+        for index, eps in enumerate(epsilons):
+            size = min(batch_size, episodes - index * batch_size)
+            rewards = _play_batch(Q, size, rng, eps, alpha, gamma, learn=True)
+            rates[index] = [
+                np.mean(rewards == REWARD_WIN),
+                np.mean(rewards == REWARD_DRAW),
+                np.mean(rewards == REWARD_LOSS),
+            ]
+        return {"Q": Q, "rates": rates}
+
+    arrays = cache.cached_arrays(
+        _NAMESPACE,
+        "train-" + cache.digest(episodes, alpha, gamma, epsilon, batch_size, seed),
+        compute,
+    )
+    rates = arrays["rates"]
+    return TrainingResult(
+        Q=arrays["Q"],
+        episodes=episodes,
+        win_rate=rates[:, 0],
+        draw_rate=rates[:, 1],
+        loss_rate=rates[:, 2],
+    )
+
+
+def evaluate(Q: np.ndarray, games: int = 10_000, seed: int = 1) -> dict[str, float]:
+    """Return win/draw/loss rates of the greedy policy against the random opponent."""
+    rewards = _play_batch(
+        Q.copy(), games, np.random.default_rng(seed), 0.0, 0.0, 0.0, learn=False
+    )
+    return {
+        "win": float(np.mean(rewards == REWARD_WIN)),
+        "draw": float(np.mean(rewards == REWARD_DRAW)),
+        "loss": float(np.mean(rewards == REWARD_LOSS)),
+    }
+
+
+def replay_episode(
+    Q: np.ndarray,
+    seed: int,
+    epsilon: float = 0.1,
+    alpha: float = 0.3,
+    gamma: float = 0.9,
+    learn: bool = True,
+) -> tuple[np.ndarray, list[QUpdate]]:
+    """Play one game move by move and return the updated Q with its update log."""
+    Q = Q.copy()
+    rng = np.random.default_rng(seed)
+    board = np.zeros(9, dtype=np.int8)
+    log: list[QUpdate] = []
+
+    while True:
+        code = int(encode(board))
+        state = STATE_ID[code]
+        before = q_values(Q, board)[0]
+        action = int(epsilon_greedy(before[None], (board == EMPTY)[None], epsilon, rng)[0])
+        canonical_action = INV_PERMS[TRANSFORM[code], action]
+        observed = tuple(int(cell) for cell in board)
+
+        board[action] = AGENT
+        reward, outcome, opponent_action = 0.0, None, None
+        if winners(board, AGENT):
+            reward, outcome = REWARD_WIN, "win"
+        elif (board != EMPTY).all():
+            reward, outcome = REWARD_DRAW, "draw"
+        else:
+            opponent_action = int(_random_legal((board == EMPTY)[None], rng)[0])
+            board[opponent_action] = OPPONENT
+            if winners(board, OPPONENT):
+                reward, outcome = REWARD_LOSS, "loss"
+            elif (board != EMPTY).all():
+                reward, outcome = REWARD_DRAW, "draw"
+
+        bootstrap = 0.0 if outcome else float(np.nanmax(q_values(Q, board)))
+        td_error = reward + gamma * bootstrap - Q[state, canonical_action]
+        if learn:
+            Q[state, canonical_action] += alpha * td_error
+        log.append(
+            QUpdate(
+                board=observed,
+                action=action,
+                q_before=before,
+                q_after=float(Q[state, canonical_action]),
+                reward=reward,
+                td_error=float(td_error),
+                opponent_action=opponent_action,
+                outcome=outcome,
+            )
+        )
+        if outcome:
+            return Q, log
+
+
+def find_episode(
+    Q: np.ndarray,
+    outcome: str = "win",
+    start_seed: int = 0,
+    max_moves: int | None = None,
+    max_seeds: int = 10_000,
+    **replay_kwargs,
+) -> tuple[int, np.ndarray, list[QUpdate]]:
+    """Return the first seed (from ``start_seed``) whose replay ends in ``outcome``.
+
+    Raises ``ValueError`` when none of ``max_seeds`` seeds does (for example an
+    unknown ``outcome``, or a win within fewer than 3 agent moves).
+    """
+    if outcome not in ("win", "draw", "loss"):
+        raise ValueError(f"unknown outcome {outcome!r} (expected 'win', 'draw' or 'loss')")
+    for seed in range(start_seed, start_seed + max_seeds):
+        Q_new, log = replay_episode(Q, seed, **replay_kwargs)
+        if log[-1].outcome == outcome and (max_moves is None or len(log) <= max_moves):
+            return seed, Q_new, log
+    raise ValueError(
+        f"no seed in [{start_seed}, {start_seed + max_seeds}) ends in {outcome!r}"
+        + (f" within {max_moves} moves" if max_moves is not None else "")
+    )
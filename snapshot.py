@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Rasterize the final state of every slide without rendering animations.
+
+Each scene runs with animations skipped (as ``manim -s`` does), so ``play``
+and ``wait`` only move mobjects to their end state. At every
+``next_slide()`` boundary, and once more at the end of ``construct`` if
+anything was played after the last boundary, the current frame is
+rasterized to ``snapshots/<Scene>/<idx>.png``. A ``contact_sheet.png`` of
+all of them is written next to the frames, so a whole-deck visual review
+takes seconds instead of a full render plus HTML conversion.
+
+Example:
+    uv run python main.py snapshot --resolution 960x540 --scene GPSSlide
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from generate_html import DEFAULT_SLIDES_TOML, load_scene_entries
+
+
+DEFAULT_SNAPSHOT_DIR = Path("snapshots")
+# Compiled Tex/Text SVGs are kept where ``manim render`` keeps them, so runs
+# with a throwaway media folder still hit the cache.
+TEX_DIR = Path(__file__).resolve().parent / "media" / "Tex"
+TEXT_DIR = Path(__file__).resolve().parent / "media" / "texts"
+DEFAULT_RESOLUTION = (960, 540)
+CONTACT_SHEET_COLUMNS = 4
+THUMBNAIL_WIDTH = 480
+CONTACT_SHEET_GAP = 8
+CONTACT_SHEET_NAME = "contact_sheet.png"
+
+
+def parse_resolution(text: str) -> tuple[int, int]:
+    """Parse ``"<width>x<height>"`` into pixel dimensions."""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"Resolution must look like 1280x720, got {text!r}") from None
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Resolution must be positive, got {text!r}")
+    return width, height
+
+
+def scene_target(entry: str) -> tuple[Path, str]:
+    """Map a ``slides.toml`` entry ``slides.<module>.<Scene>`` to ``(file, class name)``."""
+    module, class_name = entry.rsplit(".", 1)
+    return Path(*module.split(".")).with_suffix(".py"), class_name
+
+
+def load_scene_class(module_path: Path, class_name: str) -> type:
+    """Import ``class_name`` from a scene file the way Manim does (``slides/`` on ``sys.path``)."""
+    scene_dir = str(module_path.resolve().parent)
+    if scene_dir not in sys.path:
+        sys.path.insert(0, scene_dir)
+    spec = importlib.util.spec_from_file_location(f"snapshot_{module_path.stem}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+def run_slides(
+    scene_class: type,
+    on_slide: Callable[[object], None],
+    resolution: tuple[int, int] = DEFAULT_RESOLUTION,
+    rasterize: bool = True,
+) -> None:
+    """Run ``scene_class`` with animations skipped, calling ``on_slide(scene)`` as each slide ends.
+
+    The hook fires at every ``next_slide()`` boundary and at the end of
+    ``construct`` if anything was played after the last boundary. With
+    ``rasterize=False`` the renderer's frame updates are no-ops, for runs
+    that only inspect mobjects.
+    """
+    from manim import tempconfig
+
+    class HookedScene(scene_class):
+        plays_at_boundary = 0
+
+        def setup(self):
+            if not rasterize:
+                self.renderer.update_frame = lambda *args, **kwargs: None
+            super().setup()
+
+        def next_slide(self, *args, **kwargs):
+            on_slide(self)
+            result = super().next_slide(*args, **kwargs)
+            self.plays_at_boundary = self.renderer.num_plays
+            return result
+
+    width, height = resolution
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig(
+        {
+            "pixel_width": width,
+            "pixel_height": height,
+            "save_last_frame": True,
+            "write_to_movie": False,
+            "disable_caching": True,
+            "media_dir": media_dir,
+            "tex_dir": str(TEX_DIR),
+            "text_dir": str(TEXT_DIR),
+            "verbosity": "WARNING",
+            "progress_bar": "none",
+        }
+    ):
+        scene = HookedScene()
+        scene.setup()
+        scene.construct()
+        scene.tear_down()
+        if scene.renderer.num_plays > scene.plays_at_boundary:
+            on_slide(scene)
+
+
+def capture_slides(scene_class: type, resolution: tuple[int, int] = DEFAULT_RESOLUTION) -> list[np.ndarray]:
+    """Run ``scene_class`` with animations skipped; return the RGBA frame ending each slide."""
+    frames: list[np.ndarray] = []
+
+    def capture(scene) -> None:
+        scene.renderer.update_frame(scene, ignore_skipping=True)
+        frames.append(np.array(scene.renderer.get_frame()))
+
+    run_slides(scene_class, capture, resolution)
+    return frames
+
+
+def thumbnail(frame: np.ndarray, width: int = THUMBNAIL_WIDTH) -> np.ndarray:
+    """Shrink ``frame`` ``(h, w, c)`` to ``width`` columns by box averaging (never enlarges)."""
+    height, frame_width = frame.shape[:2]
+    if frame_width <= width:
+        return frame
+    rows = np.linspace(0, height, max(1, round(height * width / frame_width)) + 1).astype(int)[:-1]
+    cols = np.linspace(0, frame_width, width + 1).astype(int)[:-1]
+    summed = np.add.reduceat(np.add.reduceat(frame.astype(float), rows, axis=0), cols, axis=1)
+    counts = np.diff(np.append(rows, height))[:, None, None] * np.diff(np.append(cols, frame_width))[None, :, None]
+    return np.round(summed / counts).astype(frame.dtype)
+
+
+def contact_sheet(
+    frames: list[np.ndarray],
+    columns: int = CONTACT_SHEET_COLUMNS,
+    width: int = THUMBNAIL_WIDTH,
+    gap: int = CONTACT_SHEET_GAP,
+) -> np.ndarray:
+    """Tile thumbnails of ``frames`` row-major on a dark RGBA sheet."""
+    thumbs = [thumbnail(frame, width) for frame in frames]
+    tile_h = max(thumb.shape[0] for thumb in thumbs)
+    tile_w = max(thumb.shape[1] for thumb in thumbs)
+    columns = min(columns, len(thumbs))
+    rows = -(-len(thumbs) // columns)
+    sheet = np.full((gap + rows * (tile_h + gap), gap + columns * (tile_w + gap), 4), 40, dtype=np.uint8)
+    sheet[..., 3] = 255
+    for index, thumb in enumerate(thumbs):
+        top = gap + (index // columns) * (tile_h + gap)
+        left = gap + (index % columns) * (tile_w + gap)
+        sheet[top:top + thumb.shape[0], left:left + thumb.shape[1], : thumb.shape[2]] = thumb
+    return sheet
+
+
+def write_png(array: np.ndarray, path: Path) -> None:
+    """Write an RGB(A) ``uint8`` array as a PNG."""
+    from PIL import Image
+
+    Image.fromarray(array).save(path)
+
+
+def snapshot_scene(
+    scene_class: type,
+    output_dir: Path,
+    resolution: tuple[int, int] = DEFAULT_RESOLUTION,
+) -> list[Path]:
+    """Write ``<output_dir>/<idx>.png`` per slide and the contact sheet; return the frame paths."""
+    frames = capture_slides(scene_class, resolution)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for stale in output_dir.glob("*.png"):
+        stale.unlink()
+    paths = []
+    for index, frame in enumerate(frames):
+        path = output_dir / f"{index:03d}.png"
+        write_png(frame, path)
+        paths.append(path)
+    if frames:
+        write_png(contact_sheet(frames), output_dir / CONTACT_SHEET_NAME)
+    return paths
+
+
+def deck_targets(
+    scenes: list[str] | None = None,
+    slides_toml: Path = DEFAULT_SLIDES_TOML,
+) -> list[tuple[Path, str]]:
+    """Return ``(file, class name)`` of the deck scenes (or only ``scenes``), in deck order.
+
+    Raises ``ValueError`` when a requested scene is not in ``slides.toml``.
+    """
+    entries = list(dict.fromkeys(load_scene_entries(slides_toml)))
+    targets = [scene_target(entry) for entry in entries]
+    if not scenes:
+        return targets
+    missing = set(scenes) - {class_name for _, class_name in targets}
+    if missing:
+        raise ValueError(f"Scenes not in {slides_toml}: {', '.join(sorted(missing))}")
+    return [target for target in targets if target[1] in scenes]
+
+
+def snapshot_deck(
+    output_dir: Path = DEFAULT_SNAPSHOT_DIR,
+    resolution: tuple[int, int] = DEFAULT_RESOLUTION,
+    scenes: list[str] | None = None,
+    slides_toml: Path = DEFAULT_SLIDES_TOML,
+) -> int:
+    """Snapshot the scenes of ``slides.toml`` (or only ``scenes``), in deck order."""
+    try:
+        targets = deck_targets(scenes, slides_toml)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    failed = []
+    for module_path, class_name in targets:
+        try:
+            paths = snapshot_scene(load_scene_class(module_path, class_name), output_dir / class_name, resolution)
+        except Exception as error:  # keep going so one broken scene does not hide the rest
+            print(f"{class_name}: failed ({type(error).__name__}: {error})", file=sys.stderr)
+            failed.append(class_name)
+            continue
+        print(f"{class_name}: {len(paths)} snapshots -> {output_dir / class_name}")
+    return 1 if failed else 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for snapshots."""
+    parser = argparse.ArgumentParser(description="Rasterize the last frame of every slide.")
+    parser.add_argument("--output", "-o", default=str(DEFAULT_SNAPSHOT_DIR), help="Destination folder.")
+    parser.add_argument(
+        "--resolution",
+        "-r",
+        default="x".join(map(str, DEFAULT_RESOLUTION)),
+        help="Frame size as <width>x<height>. Defaults to 960x540.",
+    )
+    parser.add_argument("--scene", "-s", action="append", help="Scene class to snapshot (repeatable).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = parse_args()
+    return snapshot_deck(Path(args.output), parse_resolution(args.resolution), args.scene)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
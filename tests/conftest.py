@@ -0,0 +1,13 @@
+import pytest
+
+from slides.engines import cache
+
+
+@pytest.fixture
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the engines' array cache and results folder into ``tmp_path`` with an empty memo."""
+    monkeypatch.setenv("SLIDES_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("SLIDES_RESULTS_DIR", str(tmp_path / "results"))
+    cache.clear_memo()
+    yield
+    cache.clear_memo()
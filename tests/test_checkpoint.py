@@ -0,0 +1,96 @@
+import importlib.util
+import sys
+
+import pytest
+
+from slides.components.checkpoint import CHECKPOINT_ENV, section_keys
+
+SCENE_SOURCE = '''
+from slides.components.checkpoint import SectionCheckpoints
+
+
+class Camera:
+    def __init__(self):
+        self.phi = 0.0
+
+    def get_phi(self):
+        return self.phi
+
+    def set_phi(self, value):
+        self.phi = value
+
+
+class DemoScene(SectionCheckpoints):
+    sections = ("_first", "_second", "_third")
+    shared = ("total",)
+    calls = []
+
+    def __init__(self):
+        self.mobjects = []
+        self.camera = Camera()
+
+    def add(self, *mobjects):
+        self.mobjects.extend(mobjects)
+
+    def _first(self):
+        self.calls.append("first")
+        self.add("title")
+        self.total = 1
+
+    def _second(self):
+        self.calls.append("second")
+        self.add("plot")
+        self.camera.set_phi(0.5)
+        self.total += 1
+
+    def _third(self):
+        self.calls.append("third")
+        self.total += 1
+'''
+
+
+def _load(path, source):
+    path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(f"demo_scene_{abs(hash(source))}", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module.DemoScene
+
+
+@pytest.fixture(autouse=True)
+def isolated_checkpoints(tmp_path, monkeypatch):
+    monkeypatch.setenv("SLIDES_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv(CHECKPOINT_ENV, "1")
+
+
+def test_rerun_resumes_after_the_last_unchanged_section(tmp_path) -> None:
+    scene_class = _load(tmp_path / "demo.py", SCENE_SOURCE)
+    scene_class().construct()
+    scene_class.calls.clear()
+
+    scene = scene_class()
+    scene.construct()
+
+    assert scene_class.calls == ["third"]
+    assert scene.mobjects == ["title", "plot"]
+    assert scene.camera.phi == 0.5 and scene.total == 3
+
+
+def test_editing_a_section_invalidates_only_its_own_and_later_keys(tmp_path) -> None:
+    before = section_keys(_load(tmp_path / "demo.py", SCENE_SOURCE))
+    edited = SCENE_SOURCE.replace('self.calls.append("second")', 'self.calls.append("2nd")')
+    after = section_keys(_load(tmp_path / "demo.py", edited))
+
+    assert before[0] == after[0]
+    assert before[1:] != after[1:]
+    assert all(old != new for old, new in zip(before[1:], after[1:]))
+
+
+def test_checkpoints_are_off_by_default(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv(CHECKPOINT_ENV)
+    scene_class = _load(tmp_path / "demo.py", SCENE_SOURCE)
+
+    scene_class().construct()
+
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from slides.engines import cache, control, quadcopter
+
+
+pytestmark = pytest.mark.usefixtures("isolated_cache")
+
+
+def test_quadcopter_subsystem_is_controllable() -> None:
+    A, B = quadcopter.subsystem()
+
+    report = control.controllability(A, B)
+
+    assert report.matrix.shape == (8, 32)
+    assert report.rank == 8
+    assert report.controllable
+
+
+def test_riccati_solutions_satisfy_their_equations() -> None:
+    A, B = quadcopter.subsystem()
+    Q = np.eye(8)
+    R = np.eye(4)
+
+    X = control.solve_care(A, B, Q, R)
+    care_residual = A.T @ X + X @ A - X @ B @ np.linalg.solve(R, B.T) @ X + Q
+    assert np.abs(care_residual).max() < 1e-8
+
+    Ad, Bd = control.discretize(A, B, 0.04)
+    Xd = control.solve_dare(Ad, Bd, Q, R)
+    gain = np.linalg.solve(R + Bd.T @ Xd @ Bd, Bd.T @ Xd @ Ad)
+    dare_residual = Ad.T @ Xd @ Ad - Xd - Ad.T @ Xd @ Bd @ gain + Q
+    assert np.abs(dare_residual).max() < 1e-8
+
+
+def test_lqr_design_stabilizes_batch_and_is_cached(tmp_path) -> None:
+    A, B = quadcopter.subsystem()
+    x0s = np.random.default_rng(0).uniform(-0.5, 0.5, size=(16, 8))
+
+    design = control.lqr_design(A, B, np.eye(8), 1e-4 * np.eye(4), x0s, dt=0.04, steps=500)
+
+    assert design.states.shape == (16, 501, 8)
+    assert design.inputs.shape == (16, 501, 4)
+    assert np.all(design.poles.real < 0)
+    assert np.abs(design.states[:, -1]).max() < np.abs(x0s).max()
+    assert len(list(tmp_path.rglob("*.npz"))) == 2
+
+    cache.clear_memo()
+    again = control.lqr_design(A, B, np.eye(8), 1e-4 * np.eye(4), x0s, dt=0.04, steps=500)
+    np.testing.assert_array_equal(again.K, design.K)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from slides.engines import cache, ddpg
+
+
+pytestmark = pytest.mark.usefixtures("isolated_cache")
+
+
+def test_replay_buffer_wraps_around_and_samples_whole_rows() -> None:
+    buffer = ddpg.ReplayBuffer(capacity=5, obs_dim=2, action_dim=1)
+    for start in (0, 3):
+        rows = np.arange(start, start + 3, dtype=float)
+        buffer.add(np.c_[rows, rows], rows[:, None], rows, np.c_[rows, rows] + 1, np.zeros(3))
+
+    assert buffer.size == 5 and buffer.position == 1
+    np.testing.assert_array_equal(buffer.rewards, [5.0, 1.0, 2.0, 3.0, 4.0])
+    obs, actions, rewards, next_obs, _ = buffer.sample(16, np.random.default_rng(0))
+    np.testing.assert_array_equal(obs[:, 0], rewards)
+    np.testing.assert_array_equal(actions[:, 0], rewards)
+    np.testing.assert_array_equal(next_obs[:, 1], rewards + 1)
+
+
+def test_mlp_backward_matches_finite_differences() -> None:
+    rng = np.random.default_rng(0)
+    params = ddpg.mlp_init((3, 5, 4, 2), rng, final_scale=0.5)
+    x = rng.normal(size=(6, 3))
+    weights = rng.normal(size=(6, 2))
+
+    def loss(params, x):
+        return np.sum(ddpg.mlp_forward(params, x)[0] * weights)
+
+    _, activations = ddpg.mlp_forward(params, x)
+    grads, grad_in = ddpg.mlp_backward(params, activations, weights)
+
+    eps = 1e-6
+    bumped = [p.copy() for p in params]
+    bumped[2][1, 3] += eps
+    assert grads[2][1, 3] == pytest.approx((loss(bumped, x) - loss(params, x)) / eps, rel=1e-4)
+    dx = np.zeros_like(x)
+    dx[4, 2] = eps
+    assert grad_in[4, 2] == pytest.approx((loss(params, x + dx) - loss(params, x)) / eps, rel=1e-4)
+
+
+def test_training_is_deterministic_and_cached() -> None:
+    config = ddpg.DDPGConfig(epochs=2, episodes_per_epoch=1, episode_steps=20, n_envs=4, batch_size=16,
+                             hidden=(8,), validation_episodes=4)
+
+    run = ddpg.train_ddpg(config)
+    cache.clear_memo()
+    cached = ddpg.train_ddpg(config)
+    retrained = ddpg._train(config)
+
+    assert run.critic_surfaces.shape == (2, ddpg.SURFACE_RESOLUTION, ddpg.SURFACE_RESOLUTION)
+    np.testing.assert_array_equal(run.epochs, [1, 2])
+    np.testing.assert_array_equal(cached.critic_surfaces, run.critic_surfaces)
+    np.testing.assert_array_equal(retrained["train_mean"], run.train_return_mean)
+    assert np.all(run.validation_return_mean <= 0)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from slides.engines import cache, density
+
+
+@pytest.fixture(autouse=True)
+def isolated_dirs(tmp_path, monkeypatch):
+    monkeypatch.setenv("SLIDES_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SLIDES_RESULTS_DIR", str(tmp_path / "results"))
+    (tmp_path / "results").mkdir()
+    cache.clear_memo()
+    yield
+    cache.clear_memo()
+
+
+def test_chunked_bincount_matches_histogram2d() -> None:
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=(2, 50_000))
+    x[:3] = [np.nan, 4.0, -2.0]
+    ranges = ((-2.0, 2.0), (-1.5, 1.5))
+
+    grid = density.bin_counts(x, y, (40, 30), ranges, chunk_rows=7_000)
+    expected, _, _ = np.histogram2d(y, x, bins=(30, 40), range=ranges[::-1])
+
+    np.testing.assert_array_equal(grid.counts, expected)
+    assert grid.density.sum() * np.diff(grid.x_edges)[0] * np.diff(grid.y_edges)[0] == pytest.approx(1.0)
+
+
+def test_smoothing_keeps_a_uniform_density_flat_up_to_the_borders() -> None:
+    grid = density.DensityGrid(np.ones((12, 20)), np.linspace(0, 1, 21), np.linspace(0, 1, 13))
+
+    np.testing.assert_allclose(grid.smoothed(3.0), grid.density)
+
+
+def test_contour_segments_trace_a_circle() -> None:
+    x = y = np.linspace(-2.0, 2.0, 81)
+    radius = np.hypot(x[None, :], y[:, None])
+
+    segments = density.contour_segments(radius, 1.0, x, y)
+
+    np.testing.assert_allclose(np.hypot(segments[..., 0], segments[..., 1]), 1.0, atol=2e-3)
+    length = np.linalg.norm(segments[:, 1] - segments[:, 0], axis=1).sum()
+    assert length == pytest.approx(2 * np.pi, rel=1e-2)
+
+
+def test_log_density_is_cached_per_grid(tmp_path) -> None:
+    rng = np.random.default_rng(1)
+    np.savez(tmp_path / "results" / "final.npz", z=rng.normal(size=1000), psi=rng.normal(size=1000))
+
+    grid = density.log_density("final", ("z", "psi"), 20, ((-3.0, 3.0), (-3.0, 3.0)))
+
+    assert grid.counts.shape == (20, 20) and grid.counts.sum() > 990
+    assert list((tmp_path / "cache" / "density").glob("log-*.npz"))
+    assert density.log_density("missing", ("z", "psi"), 20, ((-3.0, 3.0), (-3.0, 3.0))) is None
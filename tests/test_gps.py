@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from slides.engines import cache, gps
+
+pytestmark = pytest.mark.usefixtures("isolated_cache")
+
+SMALL = gps.GPSConfig(horizon=20, samples=4, ilqr_iterations=2)
+
+
+def test_linearization_predicts_small_perturbations() -> None:
+    rng = np.random.default_rng(0)
+    states = 0.1 * rng.standard_normal((3, 12))
+    actions = rng.standard_normal((3, 4))
+    A, B = gps.linearize(states, actions, SMALL.dt)
+
+    dx, du = 1e-4 * rng.standard_normal((3, 12)), 1e-3 * rng.standard_normal((3, 4))
+    moved = gps._step(states + dx, actions + du, SMALL.dt) - gps._step(states, actions, SMALL.dt)
+    predicted = np.einsum("tij,tj->ti", A, dx) + np.einsum("tij,tj->ti", B, du)
+
+    np.testing.assert_allclose(moved, predicted, atol=1e-7)
+
+
+def test_cached_iterations_are_never_recomputed(monkeypatch) -> None:
+    first = gps.run_gps(SMALL, iterations=2, workers=1)
+    calls = []
+    original = gps.gps_iteration
+    monkeypatch.setattr(gps, "gps_iteration", lambda *args, **kwargs: calls.append(args[3]) or original(*args, **kwargs))
+
+    cache.clear_memo()
+    extended = gps.run_gps(SMALL, iterations=3, workers=1)
+
+    assert calls == [3]
+    np.testing.assert_array_equal(extended.gap[:2], first.gap)
+    assert extended.lambda_norm.shape == (3, SMALL.horizon)
+    assert np.all(np.isfinite(extended.local_cost))
+
+
+def test_worker_pool_matches_in_process_run(tmp_path, monkeypatch) -> None:
+    serial = gps.run_gps(SMALL, iterations=1, workers=1)
+    monkeypatch.setenv("SLIDES_CACHE_DIR", str(tmp_path / "pool"))
+    cache.clear_memo()
+    pooled = gps.run_gps(SMALL, iterations=1, workers=2)
+
+    np.testing.assert_allclose(pooled.local_states, serial.local_states)
+    np.testing.assert_allclose(pooled.W, serial.W)
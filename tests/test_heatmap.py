@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import BLUE, RED, color_to_rgb  # noqa: E402
+
+from slides.components.heatmap import Heatmap, apply_colormap  # noqa: E402
+
+
+def test_colormap_hits_the_end_stops_and_hides_nan() -> None:
+    image = apply_colormap(np.array([[0.0, 1.0, np.nan]]), colors=(RED, BLUE))
+
+    np.testing.assert_allclose(image[0, 0, :3] / 255, color_to_rgb(RED), atol=1 / 255)
+    np.testing.assert_allclose(image[0, 1, :3] / 255, color_to_rgb(BLUE), atol=1 / 255)
+    assert image[0, 2, 3] == 0
+
+
+def test_heatmap_image_covers_the_axes() -> None:
+    heatmap = Heatmap(np.random.default_rng(0).random((20, 30)), (-1, 1), (-2, 2), x_length=3, y_length=2)
+
+    assert heatmap.image.width == pytest.approx(3)
+    assert heatmap.image.height == pytest.approx(2)
+    np.testing.assert_allclose(heatmap.image.get_center(), heatmap.axes.c2p(0, 0))
+
+
+def test_contours_share_one_vmobject_on_the_axes() -> None:
+    heatmap = Heatmap(np.zeros((4, 4)), x_range=(0, 1), y_range=(0, 1))
+    segments = np.array([[[0.0, 0.0], [1.0, 1.0]], [[0.0, 1.0], [1.0, 0.0]]])
+
+    contour = heatmap.add_contours(segments)
+
+    assert len(contour.points) == 8
+    np.testing.assert_allclose(contour.points[-1], heatmap.axes.c2p(1.0, 0.0), atol=1e-6)
@@ -0,0 +1,31 @@
+from layout_validator import Box, overlapping_pairs, slide_issues
+
+
+def test_sweep_line_finds_exactly_the_intersecting_pairs() -> None:
+    boxes = [
+        Box("title", -2.0, 3.0, 2.0, 3.5),
+        Box("eq", -1.0, 0.0, 1.0, 1.0),
+        Box("note", 0.5, 0.5, 3.0, 1.5),
+        Box("far", 4.0, 0.0, 5.0, 1.0),
+        Box("touching", 1.0, -1.0, 2.0, 0.02),
+    ]
+
+    pairs = {tuple(sorted((a.label, b.label))) for a, b in overlapping_pairs(boxes, tolerance=0.05)}
+
+    assert pairs == {("eq", "note")}
+
+
+def test_slide_issues_grade_overlaps_and_clipping() -> None:
+    boxes = [
+        Box("a", 0.0, 0.0, 1.0, 1.0),
+        Box("b", 0.1, 0.1, 0.9, 0.9),
+        Box("edge", 6.5, 0.0, 7.5, 1.0),
+        Box("gone", 9.0, 0.0, 10.0, 1.0),
+    ]
+
+    issues = slide_issues(boxes, frame_width=14.0, frame_height=8.0)
+
+    assert {"type": "overlap", "elements": ["a", "b"], "severity": "high"} in issues
+    assert {"type": "out-of-viewport", "elements": ["edge"], "severity": "medium"} in issues
+    assert {"type": "out-of-viewport", "elements": ["gone"], "severity": "high"} in issues
+    assert len(issues) == 3
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from slides.engines import logstore
+
+
+@pytest.fixture(autouse=True)
+def results_folder(isolated_cache, tmp_path):
+    (tmp_path / "results").mkdir()
+
+
+def _write_csv(path, columns) -> None:
+    rows = zip(*columns.values())
+    path.write_text(",".join(columns) + "\n" + "\n".join(",".join(f"{v:g}" for v in row) for row in rows) + "\n")
+
+
+def test_csv_is_stored_as_memory_mapped_columns_sorted_by_seed(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(logstore, "CSV_CHUNK_ROWS", 7)
+    episodes = np.tile(np.arange(10.0), 3)
+    seeds = np.repeat([2.0, 0.0, 1.0], 10)
+    returns = seeds * 100 + episodes
+    _write_csv(tmp_path / "results" / "run.csv", {"episode": episodes, "seed": seeds, "train_return": returns})
+
+    log = logstore.open_log("run", x="episode")
+
+    assert log.rows == 30 and log.seeds == (0.0, 1.0, 2.0)
+    column = log.column("train_return", 5, 15)
+    assert isinstance(column, np.memmap)
+    np.testing.assert_array_equal(log.seed(1.0)["train_return"], 100 + np.arange(10.0))
+
+    x, mean, std = log.band("train_return")
+    np.testing.assert_array_equal(x, np.arange(10.0))
+    np.testing.assert_allclose(mean, 100 + np.arange(10.0))
+    np.testing.assert_allclose(std, np.std([0.0, 100.0, 200.0]))
+
+
+def test_store_is_reused_until_the_source_changes(tmp_path) -> None:
+    source = tmp_path / "results" / "run.npz"
+    np.savez(source, iteration=np.arange(4.0), cost=np.ones(4))
+    first = logstore.open_log("run")
+
+    assert logstore.open_log("run").root == first.root
+    np.savez(source, iteration=np.arange(6.0), cost=np.zeros(6))
+    second = logstore.open_log("run")
+
+    assert second.root != first.root and second.rows == 6
+    assert logstore.open_log("missing") is None
+
+
+def test_seeds_on_different_grids_have_no_band(tmp_path) -> None:
+    np.savez(
+        tmp_path / "results" / "ragged.npz",
+        episode=np.array([0.0, 1.0, 0.0]),
+        seed=np.array([0.0, 0.0, 1.0]),
+        train_return=np.zeros(3),
+    )
+
+    log = logstore.open_log("ragged", x="episode")
+
+    with pytest.raises(KeyError):
+        log.band("train_return")
+
+
+def test_comment_lines_are_not_counted_as_rows(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(logstore, "CSV_CHUNK_ROWS", 2)
+    source = tmp_path / "commented.csv"
+    source.write_text("episode,train_return\n# run 1\n0,1.5\n1,2.5\n\n2,3.5  # last\n")
+
+    log = logstore.convert_log(source, tmp_path / "store")
+
+    assert log.rows == 3
+    np.testing.assert_array_equal(log.column("train_return"), [1.5, 2.5, 3.5])
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from slides.engines import cache, mdp
+
+
+pytestmark = pytest.mark.usefixtures("isolated_cache")
+
+
+def test_recycling_robot_is_a_valid_mdp() -> None:
+    robot = mdp.recycling_robot()
+
+    np.testing.assert_allclose(robot.P.sum(axis=2)[robot.available], 1.0)
+    assert not robot.available[0, robot.actions.index("recharge")]
+    assert robot.expected_reward[0, 0] == pytest.approx(mdp.ROBOT_R_SEARCH)
+
+
+def test_value_iteration_reaches_the_bellman_fixed_point() -> None:
+    robot = mdp.recycling_robot()
+    result = mdp.value_iteration(robot, gamma=0.9)
+
+    backup = mdp.bellman_backup(robot, result.V, 0.9)
+    np.testing.assert_allclose(backup.max(axis=1), result.V, atol=1e-6)
+    np.testing.assert_allclose(mdp.policy_evaluation(robot, result.policy, 0.9), result.V, atol=1e-6)
+    assert result.V_history.shape == (result.iterations + 1, 2)
+    assert np.all(np.diff(result.V_history, axis=0) >= -1e-12)
+
+
+def test_backup_is_batched_over_value_functions() -> None:
+    robot = mdp.recycling_robot()
+    Vs = np.random.default_rng(0).normal(size=(5, 2))
+
+    batched = mdp.bellman_backup(robot, Vs, 0.9)
+
+    for V, Q in zip(Vs, batched):
+        np.testing.assert_array_equal(mdp.bellman_backup(robot, V, 0.9), Q)
+
+
+def test_slides_share_one_cached_solution(tmp_path) -> None:
+    first = mdp.recycling_robot_solution()
+    cache.clear_memo()
+    second = mdp.recycling_robot_solution()
+
+    assert len(list(tmp_path.rglob("*.npz"))) == 1
+    np.testing.assert_array_equal(first.V_history, second.V_history)
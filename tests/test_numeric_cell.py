@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from slides.components.numeric_cell import GlyphAtlas, NumericCell  # noqa: E402
+
+
+def test_atlas_is_shared_per_font_configuration() -> None:
+    assert GlyphAtlas.get(16) is GlyphAtlas.get(16)
+    assert GlyphAtlas.get(16) is not GlyphAtlas.get(18)
+
+
+def test_cell_updates_keep_slots_and_position() -> None:
+    cell = NumericCell(0.0, font_size=16).move_to([2.0, -1.0, 0.0])
+    slots = list(cell.slots)
+
+    cell.set_value(-0.25)
+
+    assert cell.slots == slots
+    assert cell.text_for(cell.value) == "-0.25"
+    np.testing.assert_allclose(cell.center_point.get_center(), [2.0, -1.0, 0.0])
+    assert cell.text_for(np.nan) == "---"
+
+
+def test_transform_to_records_value_without_touching_points() -> None:
+    cell = NumericCell(0.0)
+    before = [slot.points.copy() for slot in cell.slots]
+
+    cell.transform_to(0.5)
+
+    assert cell.value == 0.5
+    for slot, points in zip(cell.slots, before):
+        np.testing.assert_array_equal(slot.points, points)
+
+
+def test_values_wider_than_the_cell_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        NumericCell(123.456, slots=5)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from slides.engines import cache, phase
+from slides.engines.control import expm
+
+
+pytestmark = pytest.mark.usefixtures("isolated_cache")
+
+
+def test_open_loop_planes_are_double_integrators() -> None:
+    for plane in phase.PHASE_PLANES:
+        np.testing.assert_allclose(phase.plane_matrix(plane), [[0.0, 1.0], [0.0, 0.0]], atol=1e-12)
+
+
+def test_streamlines_follow_the_flow_and_stop_at_the_window() -> None:
+    matrix = np.array([[0.0, 1.0], [-1.0, -0.5]])
+    seeds = np.array([[0.5, 0.0], [0.9, 2.0]])
+
+    lines = phase.streamlines(matrix, seeds, dt=0.1, steps=50, bounds=((-1, 1), (-1, 1)))
+
+    np.testing.assert_allclose(lines[0, 30], expm(3.0 * matrix) @ seeds[0])
+    assert np.isnan(lines[1, 1:]).all()
+    field = phase.direction_field(matrix, np.array([0.0, 1.0]), np.array([2.0]))
+    np.testing.assert_allclose(field[0, 1], matrix @ [1.0, 2.0])
+
+
+def test_portraits_are_cached_per_gain(monkeypatch) -> None:
+    K = np.ones((4, 8))
+    first = phase.phase_portrait("z-w", K, steps=20)
+    calls = []
+    monkeypatch.setattr(phase, "streamlines", lambda *args: calls.append(args) or None)
+    cache.clear_memo()
+
+    again = phase.phase_portrait("z-w", K, steps=20)
+
+    assert calls == []
+    np.testing.assert_array_equal(again.lines, first.lines)
+    assert first.lines.shape == (phase.SEED_RESOLUTION**2, 21, 2)
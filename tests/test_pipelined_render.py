@@ -0,0 +1,97 @@
+import json
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import pipelined_render
+from pipelined_render import FramePool
+
+
+def _frames(count: int) -> list[np.ndarray]:
+    return [np.full((4, 6, 4), index, dtype=np.uint8) for index in range(count)]
+
+
+def _writer(pool: FramePool, encode) -> tuple[queue.Queue, threading.Thread]:
+    """A writer thread fed like Manim's ``listen_and_write``."""
+    frames: queue.Queue = queue.Queue()
+
+    def listen_and_write():
+        while True:
+            num_frames, frame = frames.get()
+            if frame is None:
+                break
+            try:
+                pool.encoded(encode, frame, num_frames)
+            except ValueError:
+                break
+
+    thread = threading.Thread(target=listen_and_write)
+    thread.start()
+    return frames, thread
+
+
+@pytest.mark.parametrize("buffers", [0, 1, 3])
+def test_frames_are_encoded_in_order_from_a_bounded_pool(buffers) -> None:
+    encoded = []
+
+    def encode(frame, num_frames):
+        time.sleep(0.001)
+        encoded.append((int(frame[0, 0, 0]), num_frames))
+
+    pool = FramePool(buffers)
+    frames, thread = _writer(pool, encode)
+    for frame in _frames(10):
+        frames.put((1, pool.acquire(frame)))
+    frames.put((5, pool.acquire(np.full((4, 6, 4), 99, dtype=np.uint8))))
+    frames.put((-1, None))
+    thread.join()
+
+    assert encoded == [(index, 1) for index in range(10)] + [(99, 5)]
+    assert pool.frames == 15
+    assert len(pool._pool) <= buffers
+
+
+def test_encoder_errors_reach_the_rendering_thread() -> None:
+    def encode(frame, num_frames):
+        raise ValueError("codec")
+
+    pool = FramePool(1)
+    frames, thread = _writer(pool, encode)
+    frames.put((1, pool.acquire(_frames(1)[0])))
+    thread.join()
+
+    with pytest.raises(RuntimeError) as error:
+        pool.acquire(_frames(1)[0])
+    assert isinstance(error.value.__cause__, ValueError)
+
+
+def test_install_renders_a_scene_through_the_pool(tmp_path, monkeypatch) -> None:
+    manim = pytest.importorskip("manim")
+    av = pytest.importorskip("av")
+    import manim.scene.scene
+
+    monkeypatch.setattr(manim.scene.scene, "CairoRenderer", manim.scene.scene.CairoRenderer)
+    stats = tmp_path / "stats.json"
+    pipelined_render.install(buffers=2, stats_path=stats)
+
+    class Tiny(manim.Scene):
+        def construct(self):
+            dot = manim.Dot()
+            self.play(dot.animate.shift(manim.RIGHT), run_time=1)
+
+    with manim.tempconfig(
+        {"media_dir": str(tmp_path), "pixel_width": 64, "pixel_height": 36, "frame_rate": 10, "disable_caching": True}
+    ):
+        scene = Tiny()
+        scene.render()
+        movie = scene.renderer.file_writer.movie_file_path
+
+    report = json.loads(stats.read_text(encoding="utf-8"))
+    assert report["frames"] == 10
+    assert report["buffers"] == 2
+    assert len(scene.renderer.file_writer.pool._pool) <= 2
+    with av.open(str(movie)) as container:
+        assert sum(1 for _ in container.decode(video=0)) == 10
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from slides.components.plots import VERTEX_BUDGET, SeriesPlot  # noqa: E402
+
+
+def test_series_corners_land_on_axes_coordinates() -> None:
+    plot = SeriesPlot(x_range=(0, 10), y_range=(-1, 1))
+    x = np.linspace(0, 10, 50)
+
+    curve = plot.add_series(x, np.sin(x))
+
+    np.testing.assert_allclose(curve.get_start(), plot.axes.c2p(0.0, 0.0), atol=1e-6)
+    np.testing.assert_allclose(curve.get_end(), plot.axes.c2p(10.0, np.sin(10.0)), atol=1e-6)
+    with pytest.raises(ValueError):
+        plot.add_series(np.arange(VERTEX_BUDGET + 1.0), np.zeros(VERTEX_BUDGET + 1))
+
+
+def test_fan_rows_become_separate_subpaths_of_one_mobject() -> None:
+    plot = SeriesPlot(x_range=(0, 1), y_range=(-1, 1))
+    x = np.linspace(0, 1, 10)
+
+    fan = plot.add_fan(x, np.stack([np.zeros(10), np.ones(10), -np.ones(10)]))
+
+    assert len(fan.get_subpaths()) == 3
+    assert len(plot.curves) == 1
+
+
+def test_phase_plot_draws_one_field_and_cuts_streamlines_at_nan() -> None:
+    from slides.components.phase import PhasePlot
+
+    plot = PhasePlot(x_range=(-1, 1), y_range=(-1, 1))
+    x = np.linspace(-1, 1, 3)
+    vectors = np.stack(np.meshgrid(x, x), axis=-1) @ np.array([[0.0, 1.0], [-1.0, 0.0]]).T
+    line = np.array([[0.0, 0.0], [0.5, 0.5], [np.nan, np.nan]])
+
+    field = plot.add_field(x, x, vectors)
+    streams = plot.add_streamlines(np.stack([line, line]))
+
+    assert len(field.get_subpaths()) == 3 * 8
+    assert len(streams) == 2
+    np.testing.assert_allclose(streams[0].get_end(), plot.axes.c2p(0.5, 0.5), atol=1e-6)
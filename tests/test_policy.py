@@ -0,0 +1,49 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from slides.engines import cache, policy, stability
+
+
+@pytest.fixture(autouse=True)
+def isolated_dirs(tmp_path, monkeypatch):
+    monkeypatch.setenv("SLIDES_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SLIDES_RESULTS_DIR", str(tmp_path / "results"))
+    cache.clear_memo()
+    yield
+    cache.clear_memo()
+
+
+def test_fitted_network_imitates_the_lqr_controller() -> None:
+    controller = stability.linear_feedback()
+    mlp = policy.load_policy()
+    states = np.zeros((200, 12))
+    states[:, [3, 6, 11]] = np.random.default_rng(0).uniform(-0.5, 0.5, (200, 3))
+
+    np.testing.assert_allclose(mlp(states), controller(states), atol=2.0)
+    assert mlp.mean(states[:3, None]).shape == (3, 1, 4)
+
+
+def test_weights_round_trip_through_npz(tmp_path) -> None:
+    mlp = policy.load_policy()
+    (tmp_path / "results").mkdir()
+    policy.save_mlp(mlp, tmp_path / "results" / f"{policy.DEFAULT_POLICY}.npz")
+
+    loaded = policy.load_policy()
+
+    states = np.random.default_rng(1).normal(scale=0.1, size=(5, 12))
+    np.testing.assert_allclose(loaded(states), mlp(states))
+    np.testing.assert_array_equal(loaded.sigma, mlp.sigma)
+
+
+def test_fan_samples_spread_around_the_mean_rollout() -> None:
+    mlp = policy.load_policy()
+
+    fan = policy.rollout_fan(mlp, {"varphi": 0.4}, n_rollouts=64, t_final=4.0)
+    quiet = policy.rollout_fan(dataclasses.replace(mlp, sigma=np.zeros(4)), {"varphi": 0.4}, n_rollouts=4, t_final=4.0)
+
+    assert fan["samples"].shape == (101, 64, 12) and fan["mean"].shape == (101, 12)
+    assert fan["samples"][-1, :, 6].std() > 0.01
+    np.testing.assert_allclose(quiet["samples"], quiet["mean"][:, None].repeat(4, axis=1))
+    np.testing.assert_allclose(quiet["mean"], fan["mean"])
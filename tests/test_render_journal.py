@@ -0,0 +1,61 @@
+import json
+import struct
+from pathlib import Path
+
+from render_journal import discard_partial_movies, mp4_complete, record_scene, scene_completed, source_digest
+
+
+def _box(kind: bytes, payload: bytes = b"") -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+MOVIE = _box(b"ftyp", b"isom") + _box(b"mdat", b"\0" * 64) + _box(b"moov", b"\0" * 16)
+
+
+def test_mp4_complete_rejects_truncated_files(tmp_path) -> None:
+    complete, truncated, no_moov = tmp_path / "a.mp4", tmp_path / "b.mp4", tmp_path / "c.mp4"
+    complete.write_bytes(MOVIE)
+    truncated.write_bytes(MOVIE[:-5])
+    no_moov.write_bytes(_box(b"ftyp", b"isom") + _box(b"mdat", b"\0" * 64))
+
+    assert mp4_complete(complete)
+    assert not mp4_complete(truncated)
+    assert not mp4_complete(no_moov)
+
+
+def _render(root: Path, scene: str) -> Path:
+    segment = root / "slides" / "files" / scene / "0.mp4"
+    segment.parent.mkdir(parents=True)
+    segment.write_bytes(MOVIE)
+    config = {"slides": [{"file": str(segment.relative_to(root)), "rev_file": None}]}
+    (root / "slides" / f"{scene}.json").write_text(json.dumps(config), encoding="utf-8")
+    return segment
+
+
+def test_journal_trusts_only_unchanged_sources_and_files(tmp_path) -> None:
+    (tmp_path / "slides").mkdir()
+    (tmp_path / "slides" / "00_demo.py").write_text("class Demo: ...\n", encoding="utf-8")
+    segment = _render(tmp_path, "Demo")
+    sources = source_digest(Path("slides/00_demo.py"), "1080p60", root=tmp_path)
+    journal: dict = {}
+
+    record_scene(journal, "Demo", sources, root=tmp_path)
+
+    assert scene_completed(journal, "Demo", sources, root=tmp_path)
+    other_quality = source_digest(Path("slides/00_demo.py"), "720p30", root=tmp_path)
+    assert not scene_completed(journal, "Demo", other_quality, root=tmp_path)
+    assert not scene_completed(journal, "Other", sources, root=tmp_path)
+    segment.write_bytes(MOVIE[:-5])
+    assert not scene_completed(journal, "Demo", sources, root=tmp_path)
+
+
+def test_truncated_partial_movies_are_discarded(tmp_path) -> None:
+    partial = tmp_path / "videos" / "00_demo" / "1080p60" / "partial_movie_files" / "Demo"
+    partial.mkdir(parents=True)
+    (partial / "good.mp4").write_bytes(MOVIE)
+    (partial / "cut.mp4").write_bytes(MOVIE[:20])
+
+    removed = discard_partial_movies("Demo", media_dir=tmp_path)
+
+    assert [path.name for path in removed] == ["cut.mp4"]
+    assert (partial / "good.mp4").exists()
@@ -0,0 +1,49 @@
+import pytest
+
+from render_scheduler import (
+    expected_values,
+    lpt_order,
+    makespan,
+    next_admissible,
+    parse_memory,
+    read_stats,
+    write_stats,
+)
+
+
+def test_longest_first_beats_deck_order() -> None:
+    durations = {"A": 2.0, "B": 2.0, "C": 3.0, "D": 3.0, "ILQR": 10.0}
+
+    order = lpt_order(durations)
+
+    assert order[0] == "ILQR"
+    assert makespan(order, durations, workers=2) == 10.0
+    assert makespan(list(durations), durations, workers=2) == 15.0
+
+
+def test_unknown_scenes_get_the_mean_and_stats_roundtrip(tmp_path) -> None:
+    path = tmp_path / "render_stats.json"
+    write_stats({"A": {"seconds": 10.0, "peak_rss": 100}, "B": {"seconds": 30.0, "peak_rss": 300}}, path)
+
+    stats = read_stats(path)
+
+    assert expected_values(["A", "B", "New"], stats, "seconds", 60.0) == {"A": 10.0, "B": 30.0, "New": 20.0}
+    assert expected_values(["New"], read_stats(tmp_path / "missing.json"), "peak_rss", 5.0) == {"New": 5.0}
+
+
+def test_admission_keeps_predicted_memory_under_the_budget() -> None:
+    memory = {"big": 6.0, "mid": 3.0, "small": 1.0}
+    pending = ["big", "mid", "small"]
+
+    assert next_admissible(pending, memory, in_use=0.0, budget=4.0) == "big"
+    assert next_admissible(pending, memory, in_use=2.0, budget=4.0) == "small"
+    assert next_admissible(pending, memory, in_use=3.5, budget=4.0) is None
+    assert next_admissible(pending, memory, in_use=3.5, budget=None) == "big"
+
+
+def test_parse_memory() -> None:
+    assert parse_memory("6G") == 6 * 1024**3
+    assert parse_memory("512MiB") == 512 * 1024**2
+    assert parse_memory("1.5g") == int(1.5 * 1024**3)
+    with pytest.raises(ValueError):
+        parse_memory("lots")
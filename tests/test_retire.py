@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Circle, Square, ValueTracker, VGroup  # noqa: E402
+
+from slides.components.retire import family_size, hidden_mobjects  # noqa: E402
+
+
+def _scene(*mobjects):
+    camera = SimpleNamespace(frame_center=np.zeros(3), frame_width=14.0, frame_height=8.0)
+    return SimpleNamespace(mobjects=list(mobjects), camera=camera)
+
+
+def test_transparent_and_off_frame_mobjects_are_hidden() -> None:
+    visible = Circle()
+    faded = VGroup(Square(), Circle()).set_opacity(0)
+    gone = Square().shift(20 * np.array([1.0, 0.0, 0.0]))
+    animated = Square().set_opacity(0)
+    animated.add_updater(lambda mobject: None)
+
+    hidden = hidden_mobjects(_scene(visible, faded, gone, animated, ValueTracker(0)))
+
+    assert hidden == [faded, gone]
+    assert family_size([faded]) == 3
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from slides.engines import mdp
+from slides.engines.returns import discounted_returns
+
+
+def _reference(rewards, gamma, horizon=None):
+    steps = len(rewards)
+    horizon = horizon or steps
+    return np.array(
+        [
+            sum(gamma**k * rewards[t + k] for k in range(min(horizon, steps - t)))
+            for t in range(steps)
+        ]
+    )
+
+
+def test_reverse_scan_matches_the_definition() -> None:
+    rewards = np.random.default_rng(0).normal(size=(3, 12))
+
+    returns = discounted_returns(rewards, 0.9)
+    truncated = discounted_returns(rewards, 0.9, horizon=4)
+
+    for episode, G, G_h in zip(rewards, returns, truncated):
+        np.testing.assert_allclose(G, _reference(episode, 0.9))
+        np.testing.assert_allclose(G_h, _reference(episode, 0.9, horizon=4))
+
+
+def test_gamma_sweep_prepends_an_axis() -> None:
+    rewards = np.ones((5, 20))
+    gammas = np.array([0.0, 0.5, 0.9])
+
+    returns = discounted_returns(rewards, gammas)
+
+    assert returns.shape == (3, 5, 20)
+    np.testing.assert_allclose(returns[0], 1.0)
+    np.testing.assert_allclose(returns[1, :, -1], 1.0)
+    np.testing.assert_allclose(returns[2, :, 0], (1 - 0.9**20) / (1 - 0.9))
+
+
+def test_bootstrapped_returns_estimate_the_policy_value() -> None:
+    robot = mdp.recycling_robot()
+    uniform = robot.available / robot.available.sum(axis=1, keepdims=True)
+    states, _, rewards = mdp.sample_episodes(robot, uniform, 0, n_episodes=2000, steps=50)
+    v_pi = mdp.policy_evaluation(robot, uniform, 0.9)
+
+    returns = discounted_returns(rewards, 0.9, bootstrap=v_pi[states[:, -1]])
+
+    assert returns[:, 0].mean() == pytest.approx(v_pi[0], rel=0.05)
+
+
+def test_truncated_returns_cannot_be_bootstrapped() -> None:
+    with pytest.raises(ValueError):
+        discounted_returns(np.ones(4), 0.9, bootstrap=np.zeros(()), horizon=2)
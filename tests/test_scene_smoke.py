@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("manim_slides")
+
+from generate_html import load_scene_order  # noqa: E402
+from scene_smoke import ROOT, smoke_deck  # noqa: E402
+
+
+SCENES = list(dict.fromkeys(load_scene_order(ROOT / "slides.toml")))
+
+
+@pytest.fixture(scope="session")
+def reports():
+    """Construct every deck scene once, spread over a process pool."""
+    return {report.scene: report for report in smoke_deck()}
+
+
+@pytest.mark.parametrize("scene", SCENES)
+def test_scene_constructs_without_rendering(scene, reports) -> None:
+    report = reports[scene]
+
+    assert report.ok, report.error
+    assert report.slides > 0 and report.mobjects > 0
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from slides.engines import series, stability
+
+
+pytestmark = pytest.mark.usefixtures("isolated_cache")
+
+
+def test_lttb_keeps_end_points_and_peaks_within_budget() -> None:
+    x = np.arange(100_000, dtype=float)
+    y = np.sin(x / 5_000.0)
+    y[31_337] = 10.0
+    y[77_777] = -10.0
+
+    indices = series.lttb_indices(x, y, 200)
+
+    assert len(indices) == 200
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+    assert {31_337, 77_777} <= set(indices.tolist())
+
+
+def test_short_series_pass_through_unchanged() -> None:
+    x, y = np.arange(5.0), np.arange(5.0) ** 2
+
+    kept_x, kept_y = series.downsample(x, y, budget=10)
+
+    np.testing.assert_array_equal(kept_x, x)
+    np.testing.assert_array_equal(kept_y, y)
+    with pytest.raises(ValueError):
+        series.lttb_indices(x, y, 2)
+
+
+def test_csv_and_npz_logs_load_the_same_columns(tmp_path) -> None:
+    results = series.results_dir()
+    results.mkdir()
+    columns = {"episode": np.arange(4.0), "train_return": np.array([-3.0, -2.5, -1.0, 0.5])}
+    np.savez(results / "run_a.npz", **columns)
+    (results / "run_b.csv").write_text(
+        "episode,train_return\n" + "\n".join(f"{e},{r}" for e, r in zip(*columns.values()))
+    )
+
+    for name in ("run_a", "run_b"):
+        log = series.load_log(series.find_log(name))
+        assert set(log) == set(columns)
+        np.testing.assert_allclose(log["train_return"], columns["train_return"])
+    assert series.find_log("missing") is None
+
+
+def test_rollout_log_matches_the_simulated_flight() -> None:
+    controller = stability.linear_feedback()
+
+    log = series.rollout_log(controller, {"varphi": 0.3}, t_final=4.0, dt=0.04)
+
+    assert len(log["t"]) == 101 and len(log["omega4"]) == 101
+    assert log["varphi"][0] == pytest.approx(0.3)
+    assert abs(log["varphi"][-1]) < 0.05
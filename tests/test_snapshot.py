@@ -0,0 +1,52 @@
+import ast
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from snapshot import contact_sheet, parse_resolution, scene_target, thumbnail
+
+
+def test_parse_resolution_reads_width_by_height() -> None:
+    assert parse_resolution("1280x720") == (1280, 720)
+    with pytest.raises(ValueError):
+        parse_resolution("720p")
+
+
+def test_scene_target_maps_toml_entries_to_scene_files() -> None:
+    assert scene_target("slides.15_gps.GPSSlide") == (Path("slides/15_gps.py"), "GPSSlide")
+
+
+def test_thumbnail_box_averages_down_to_the_requested_width() -> None:
+    frame = np.zeros((4, 8, 4), dtype=np.uint8)
+    frame[:, ::2] = 200
+
+    small = thumbnail(frame, width=4)
+
+    assert small.shape == (2, 4, 4)
+    assert np.all(small == 100)
+    assert thumbnail(frame, width=16) is frame
+
+
+def test_contact_sheet_tiles_frames_row_major() -> None:
+    frames = [np.full((10, 20, 4), value, dtype=np.uint8) for value in (50, 100, 150)]
+
+    sheet = contact_sheet(frames, columns=2, width=20, gap=2)
+
+    assert sheet.shape == (2 + 2 * 12, 2 + 2 * 22, 4)
+    assert sheet[2, 2, 0] == 50 and sheet[2, 24, 0] == 100 and sheet[14, 2, 0] == 150
+    assert sheet[14, 24, 0] == 40
+
+
+def test_every_deck_entry_points_at_a_scene_defined_in_its_file() -> None:
+    from snapshot import deck_targets
+
+    root = Path(__file__).resolve().parent.parent
+    targets = deck_targets(slides_toml=root / "slides.toml")
+
+    assert targets
+    for path, scene in targets:
+        tree = ast.parse((root / path).read_text(encoding="utf-8"))
+        classes = {node.name for node in tree.body if isinstance(node, ast.ClassDef)}
+        assert scene in classes, f"{scene} is not defined in {path}"
+    assert (Path("slides/13_ilqr.py"), "ILQRSlide") in targets
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from slides.engines import cache, quadcopter, stability
+
+
+pytestmark = pytest.mark.usefixtures("isolated_cache")
+
+
+def test_nonlinear_dynamics_linearize_to_the_hover_model() -> None:
+    A, B = quadcopter.linearized_model()
+    x0 = np.zeros(12)
+    u0 = np.full(4, quadcopter.hover_speed())
+
+    eye_x, eye_u = 1e-6 * np.eye(12), 1e-3 * np.eye(4)
+    jac_x = (quadcopter.dynamics(x0 + eye_x, u0) - quadcopter.dynamics(x0 - eye_x, u0)).T / 2e-6
+    jac_u = (quadcopter.dynamics(x0, u0 + eye_u) - quadcopter.dynamics(x0, u0 - eye_u)).T / 2e-3
+
+    np.testing.assert_allclose(quadcopter.dynamics(x0, u0), 0.0, atol=1e-12)
+    np.testing.assert_allclose(jac_x, A, atol=1e-8)
+    np.testing.assert_allclose(jac_u, B, atol=1e-8)
+
+
+def test_small_perturbations_are_stable_and_far_ones_are_not() -> None:
+    controller = stability.linear_feedback()
+    states = np.zeros((2, 12))
+    states[0, quadcopter.STATE_INDEX["varphi"]] = 0.05
+    states[1, quadcopter.STATE_INDEX["varphi"]] = 1.5
+
+    norms = stability.final_norms(controller, states, 0.04, 750, stability.CRITERIA["linear"])
+
+    assert norms[0] < 0.05
+    assert norms[1] > 0.5
+
+
+def test_sharded_map_matches_serial_map_and_is_cached(tmp_path) -> None:
+    controller = stability.linear_feedback()
+    kwargs = dict(resolution=8, t_final=2.0, tile_size=16)
+
+    serial = stability.stability_map(controller, "r-psi", workers=1, **kwargs)
+    cache.clear_memo()
+    for path in tmp_path.rglob("*.npz"):
+        path.unlink()
+    sharded = stability.stability_map(controller, "r-psi", workers=2, **kwargs)
+
+    assert serial.final_norm.shape == (8, 8)
+    np.testing.assert_array_equal(serial.final_norm, sharded.final_norm)
+    assert len(list(tmp_path.rglob("*.npz"))) == 1
+    assert 0.0 <= sharded.stable_rate() <= 1.0
+
+
+def test_gps_and_ddpg_adapters_reproduce_their_policies() -> None:
+    from slides.engines import ddpg, gps
+
+    rng = np.random.default_rng(0)
+    states = rng.normal(scale=0.2, size=(5, 12))
+    W, b = rng.normal(size=(1, 4, 8)), rng.normal(size=(1, 4))
+    history = gps.GPSHistory(*[None] * 7, W=W, b=b)
+    x_S = states[:, [quadcopter.STATE_INDEX[label] for label in quadcopter.SUBSYSTEM_LABELS]]
+    np.testing.assert_allclose(
+        stability.gps_feedback(history)(states), quadcopter.hover_speed() + x_S @ W[0].T + b[0]
+    )
+
+    config = ddpg.DDPGConfig(epochs=1, episodes_per_epoch=1, episode_steps=10, n_envs=4, batch_size=8,
+                             hidden=(8,), validation_episodes=2)
+    run = ddpg.train_ddpg(config)
+    actions = quadcopter.hover_speed() + config.action_scale * ddpg._act(list(run.actor), ddpg._observe(states))
+    controller = stability.ddpg_feedback(run, config)
+    np.testing.assert_allclose(controller(states), actions)
+    assert stability.final_norms(controller, states, 0.04, 5, stability.CRITERIA["ddpg"]).shape == (5,)
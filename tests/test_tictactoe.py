@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from slides.engines import tictactoe
+
+
+pytestmark = pytest.mark.usefixtures("isolated_cache")
+
+
+def test_symmetric_boards_share_a_state_index() -> None:
+    board = np.array([[1, 0, 0], [0, 2, 0], [0, 0, 0]])
+    variants = [np.rot90(board, k).ravel() for k in range(4)]
+    variants += [np.rot90(board.T, k).ravel() for k in range(4)]
+
+    indices = tictactoe.state_index(np.array(variants))
+
+    assert len(set(indices.tolist())) == 1
+    assert tictactoe.N_STATES < 3**9 // 6
+
+
+def test_q_values_follow_board_orientation() -> None:
+    Q = np.zeros((tictactoe.N_STATES, 9))
+    board = np.array([1, 2, 0, 0, 0, 0, 0, 0, 0])
+    Q[tictactoe.state_index(board[None])[0]] = np.arange(9)
+
+    rotated = np.rot90(board.reshape(3, 3)).ravel()
+    values = tictactoe.q_values(Q, np.array([board, rotated]))
+
+    assert np.isnan(values[0, :2]).all()
+    assert np.isnan(values[1][rotated != 0]).all()
+    assert sorted(values[0, 2:]) == sorted(values[1][rotated == 0])
+
+
+def test_training_learns_to_beat_random_opponent() -> None:
+    untrained = tictactoe.evaluate(np.zeros((tictactoe.N_STATES, 9)), games=2000)
+    result = tictactoe.train(episodes=20_000, batch_size=500)
+    trained = tictactoe.evaluate(result.Q, games=2000)
+
+    assert result.win_rate.shape == (40,)
+    assert trained["win"] > untrained["win"] + 0.2
+    assert trained["loss"] < 0.05
+
+
+def test_replayed_updates_follow_the_q_learning_rule() -> None:
+    Q0 = tictactoe.train(episodes=500).Q
+    seed, Q1, log = tictactoe.find_episode(Q0, "win", alpha=0.3, gamma=0.9)
+
+    for update in log:
+        q_old = update.q_before[update.action]
+        assert update.q_after == pytest.approx(q_old + 0.3 * update.td_error)
+    assert log[-1].reward == tictactoe.REWARD_WIN
+    assert not np.array_equal(Q0, Q1)
+
+
+def test_find_episode_raises_when_no_seed_matches() -> None:
+    Q0 = tictactoe.train(episodes=50).Q
+
+    with pytest.raises(ValueError, match="unknown outcome"):
+        tictactoe.find_episode(Q0, "victory")
+    with pytest.raises(ValueError, match="within 2 moves"):
+        tictactoe.find_episode(Q0, "win", max_moves=2, max_seeds=50)
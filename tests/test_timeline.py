@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from timeline import format_seconds, load_quality, parse_quality, read_history, seconds_per_pixel_frame
+
+
+def test_quality_comes_from_slides_toml(tmp_path) -> None:
+    slides_toml = tmp_path / "slides.toml"
+    slides_toml.write_text('[manim]\nresolution = "720p30"\n', encoding="utf-8")
+
+    assert parse_quality(load_quality(slides_toml)) == (1280, 720, 30)
+    assert parse_quality("1080p60") == (1920, 1080, 60)
+    with pytest.raises(ValueError):
+        parse_quality("1920x1080")
+
+
+def test_render_rate_is_calibrated_from_history(tmp_path) -> None:
+    history = tmp_path / "render_history.jsonl"
+    entries = [
+        {"frames": 100, "pixels": 1000, "seconds": 1.0},
+        {"frames": 300, "pixels": 1000, "seconds": 5.0},
+    ]
+    history.write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+
+    assert seconds_per_pixel_frame(read_history(history)) == pytest.approx(6.0 / 400_000)
+    assert seconds_per_pixel_frame(read_history(tmp_path / "missing.jsonl")) is None
+
+
+def test_format_seconds() -> None:
+    assert format_seconds(65.4) == "1:05"
+    assert format_seconds(3725) == "1:02:05"
+
+
+def test_profiled_render_records_every_scene_render_deck_renders(tmp_path, monkeypatch) -> None:
+    import render_scheduler
+    import timeline
+
+    deck = {
+        "quality": "720p30",
+        "resolution": [1280, 720],
+        "scenes": [{"scene": "A", "frames": 30}, {"scene": "B", "frames": 60}, {"scene": "C", "error": "boom"}],
+    }
+    monkeypatch.setattr(timeline, "deck_timeline", lambda **kwargs: deck)
+
+    def render_deck(on_rendered, workers, **kwargs):
+        assert workers == 2
+        on_rendered("B", 4.0)
+        on_rendered("C", 1.0)
+        return 0
+
+    monkeypatch.setattr(render_scheduler, "render_deck", render_deck)
+    history = tmp_path / "render_history.jsonl"
+
+    assert timeline.profiled_render(history_path=history, workers=2) == 0
+    [entry] = read_history(history)
+    assert entry["scenes"] == ["B"] and entry["frames"] == 60 and entry["seconds"] == 4.0
+    assert seconds_per_pixel_frame([entry]) == pytest.approx(4.0 / (60 * 1280 * 720))
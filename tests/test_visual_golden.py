@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("PIL")
+
+from visual_regression import GOLDEN_DIR, capture_scenes, compare_scene, golden_frames  # noqa: E402
+
+
+GOLDEN_SCENES = sorted(path.name for path in GOLDEN_DIR.iterdir() if path.is_dir()) if GOLDEN_DIR.exists() else []
+
+
+@pytest.fixture(scope="session")
+def captured():
+    """Snapshot every scene that has golden images, one process per scene."""
+    return capture_scenes(GOLDEN_SCENES)
+
+
+@pytest.mark.skipif(not GOLDEN_SCENES, reason="no golden images; run `python visual_regression.py --update`")
+@pytest.mark.parametrize("scene", GOLDEN_SCENES)
+def test_scene_matches_golden_snapshots(scene, captured) -> None:
+    frames = captured[scene]
+    if isinstance(frames, Exception):
+        pytest.fail(f"{scene} failed to run: {type(frames).__name__}: {frames}")
+
+    failures = compare_scene(scene, frames, golden_frames(scene))
+
+    assert not failures, "\n".join(failures)
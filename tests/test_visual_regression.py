@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from visual_regression import SSIM_THRESHOLD, compare_scene, diff_image, luminance, ssim
+
+
+def _slide(seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    image = np.zeros((40, 60, 4), dtype=np.uint8)
+    image[..., 3] = 255
+    image[10:20, 5:50, :3] = 230
+    image[25:35, 20:40, :3] = rng.integers(0, 255, (10, 20, 3))
+    return image
+
+
+def test_ssim_is_one_for_identical_images_and_drops_when_content_moves() -> None:
+    image = _slide()
+    moved = np.roll(image, 6, axis=1)
+
+    score, similarity = ssim(image, image)
+    moved_score, moved_map = ssim(image, moved)
+
+    assert score == pytest.approx(1.0)
+    assert similarity.shape == image.shape[:2] and moved_map.shape == image.shape[:2]
+    assert moved_score < SSIM_THRESHOLD
+    with pytest.raises(ValueError):
+        ssim(image, image[:-1])
+
+
+def test_ssim_map_matches_the_windowed_formula() -> None:
+    a, b = _slide(0), _slide(1)
+    _, similarity = ssim(a, b, window=7)
+
+    x, y = luminance(a)[22:29, 27:34], luminance(b)[22:29, 27:34]
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    cov = (x * y).mean() - x.mean() * y.mean()
+    expected = ((2 * x.mean() * y.mean() + c1) * (2 * cov + c2)) / (
+        (x.mean() ** 2 + y.mean() ** 2 + c1) * (x.var() + y.var() + c2)
+    )
+
+    assert similarity[25, 30] == pytest.approx(expected)
+
+
+def test_failures_are_reported_with_a_side_by_side_diff(tmp_path) -> None:
+    pytest.importorskip("PIL")
+    golden = [_slide(), _slide()]
+    current = [_slide(), np.roll(_slide(), 6, axis=1)]
+
+    failures = compare_scene("Demo", current, golden, diff_dir=tmp_path)
+
+    assert len(failures) == 1 and "Demo/001" in failures[0]
+    assert (tmp_path / "Demo" / "001.png").exists()
+    assert compare_scene("Demo", current[:1], golden, diff_dir=tmp_path)[0].startswith("Demo: 1 slides")
+    assert diff_image(golden[0], current[1], ssim(golden[0], current[1])[1]).shape == (40, 180, 3)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Dry-run timeline of the deck: talk duration per slide and predicted render cost.
+
+Every scene runs with animations skipped and nothing rasterized (see
+``snapshot.run_slides``); each ``play`` run time and ``wait`` duration is
+added to the current ``next_slide()`` segment. Frames follow the quality in
+``slides.toml`` (``[manim] resolution = "1080p60"``): every play renders
+``ceil(run_time * fps)`` frames.
+
+Render time is predicted as frames × pixels × k. The constant k (seconds per
+pixel-frame) is calibrated from the profiling history that
+``main.py render --profile`` appends to ``.cache/render_history.jsonl``, one
+entry per scene rendered by ``render_scheduler.render_deck`` (ratio of total
+seconds to total pixel-frames); without history a default is used and the
+report says so.
+
+Example:
+    uv run python main.py timeline --output presentation/timeline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from generate_html import DEFAULT_SLIDES_TOML
+from snapshot import deck_targets, load_scene_class, run_slides
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover - Python 3.11+ is required by the project
+    tomllib = None
+
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_TIMELINE = Path("presentation/timeline.json")
+RENDER_HISTORY = ROOT / ".cache" / "render_history.jsonl"
+DEFAULT_QUALITY = "1080p60"
+# Uncalibrated cost: about 40 ms per 1080p frame on one core.
+DEFAULT_SECONDS_PER_PIXEL_FRAME = 2e-8
+DRY_RUN_RESOLUTION = (16, 9)
+
+
+def load_quality(slides_toml: Path = DEFAULT_SLIDES_TOML) -> str:
+    """Return the ``[manim] resolution`` of ``slides.toml`` (e.g. ``"1080p60"``)."""
+    if tomllib is None or not Path(slides_toml).exists():
+        return DEFAULT_QUALITY
+    with Path(slides_toml).open("rb") as file:
+        return tomllib.load(file).get("manim", {}).get("resolution", DEFAULT_QUALITY)
+
+
+def parse_quality(quality: str) -> tuple[int, int, int]:
+    """Parse ``"<height>p<fps>"`` into ``(width, height, fps)`` at 16:9."""
+    match = re.fullmatch(r"(\d+)p(\d+)", quality.strip())
+    if not match:
+        raise ValueError(f"Quality must look like 1080p60, got {quality!r}")
+    height, fps = int(match.group(1)), int(match.group(2))
+    return height * 16 // 9, height, fps
+
+
+def _new_segment(start: float) -> dict:
+    return {"start": start, "play": 0.0, "wait": 0.0, "animations": 0, "frames": 0}
+
+
+def scene_timeline(module_path: str | Path, class_name: str, fps: int) -> dict:
+    """Dry-run one scene and return its segments with play/wait seconds and frame counts."""
+    segments: list[dict] = []
+    current = _new_segment(0.0)
+
+    class TimedScene(load_scene_class(Path(module_path), class_name)):
+        waiting = False
+
+        def wait(self, *args, **kwargs):
+            self.waiting = True
+            try:
+                return super().wait(*args, **kwargs)
+            finally:
+                self.waiting = False
+
+        def play(self, *args, **kwargs):
+            result = super().play(*args, **kwargs)
+            run_time = float(self.duration)
+            current["wait" if self.waiting else "play"] += run_time
+            current["animations"] += 0 if self.waiting else 1
+            current["frames"] += math.ceil(run_time * fps)
+            return result
+
+    def close_segment(scene) -> None:
+        nonlocal current
+        current["duration"] = current["play"] + current["wait"]
+        current["index"] = len(segments)
+        segments.append(current)
+        current = _new_segment(current["start"] + current["duration"])
+
+    run_slides(TimedScene, close_segment, DRY_RUN_RESOLUTION, rasterize=False)
+    return {
+        "scene": class_name,
+        "segments": segments,
+        "duration": sum(segment["duration"] for segment in segments),
+        "frames": sum(segment["frames"] for segment in segments),
+    }
+
+
+def _scene_timeline(target: tuple[str, str, int]) -> dict:
+    module_path, class_name, fps = target
+    try:
+        return scene_timeline(module_path, class_name, fps)
+    except Exception as error:  # reported per scene
+        return {"scene": class_name, "error": f"{type(error).__name__}: {error}"}
+
+
+def read_history(path: Path = RENDER_HISTORY) -> list[dict]:
+    """Return the recorded renders (one JSON object per line)."""
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def seconds_per_pixel_frame(history: list[dict]) -> float | None:
+    """Return total render seconds over total pixel-frames of ``history``, or ``None``."""
+    work = sum(entry["frames"] * entry["pixels"] for entry in history)
+    return sum(entry["seconds"] for entry in history) / work if work > 0 else None
+
+
+def deck_timeline(
+    scenes: list[str] | None = None,
+    slides_toml: Path = ROOT / "slides.toml",
+    history_path: Path = RENDER_HISTORY,
+    workers: int | None = None,
+) -> dict:
+    """Dry-run the deck (or only ``scenes``) over a process pool and predict its render time."""
+    quality = load_quality(slides_toml)
+    width, height, fps = parse_quality(quality)
+    targets = [(str(ROOT / path), name, fps) for path, name in deck_targets(scenes, slides_toml)]
+    n_workers = max(1, min(len(targets), workers or os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        timelines = list(pool.map(_scene_timeline, targets))
+
+    rate = seconds_per_pixel_frame(read_history(history_path))
+    calibrated = rate is not None
+    rate = rate if calibrated else DEFAULT_SECONDS_PER_PIXEL_FRAME
+    start = 0.0
+    for timeline in timelines:
+        if "error" in timeline:
+            continue
+        timeline["start"] = start
+        timeline["render_seconds"] = timeline["frames"] * width * height * rate
+        start += timeline["duration"]
+
+    completed = [timeline for timeline in timelines if "error" not in timeline]
+    return {
+        "quality": quality,
+        "resolution": [width, height],
+        "fps": fps,
+        "calibrated": calibrated,
+        "seconds_per_pixel_frame": rate,
+        "duration": sum(timeline["duration"] for timeline in completed),
+        "frames": sum(timeline["frames"] for timeline in completed),
+        "render_seconds": sum(timeline["render_seconds"] for timeline in completed),
+        "scenes": timelines,
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    """Format seconds as ``m:ss`` (or ``h:mm:ss``)."""
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+def format_table(timeline: dict) -> str:
+    """Return the per-scene table of a deck timeline."""
+    lines = [f"{'Scene':<32} {'Slides':>6} {'Talk':>8} {'Frames':>8} {'Render':>9}"]
+    for scene in timeline["scenes"]:
+        if "error" in scene:
+            lines.append(f"{scene['scene']:<32} FAILED {scene['error']}")
+            continue
+        lines.append(
+            f"{scene['scene']:<32} {len(scene['segments']):>6} {format_seconds(scene['duration']):>8} "
+            f"{scene['frames']:>8} {format_seconds(scene['render_seconds']):>9}"
+        )
+    note = "" if timeline["calibrated"] else "  (uncalibrated: run `main.py render --profile` once)"
+    lines.append(
+        f"{'Total':<32} {'':>6} {format_seconds(timeline['duration']):>8} {timeline['frames']:>8} "
+        f"{format_seconds(timeline['render_seconds']):>9}  at {timeline['quality']}{note}"
+    )
+    return "\n".join(lines)
+
+
+def profiled_render(
+    slides_toml: Path = ROOT / "slides.toml",
+    history_path: Path = RENDER_HISTORY,
+    **render_options,
+) -> int:
+    """Render the deck with ``render_deck`` and append every scene's time and frame count to the history.
+
+    ``render_options`` are passed on to ``render_scheduler.render_deck``.
+    """
+    from render_scheduler import render_deck
+
+    timeline = deck_timeline(slides_toml=slides_toml, history_path=history_path)
+    width, height = timeline["resolution"]
+    frames = {scene["scene"]: scene["frames"] for scene in timeline["scenes"] if "error" not in scene}
+
+    def record(scene: str, seconds: float) -> None:
+        if scene not in frames:
+            return
+        entry = {
+            "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "quality": timeline["quality"],
+            "scenes": [scene],
+            "frames": frames[scene],
+            "pixels": width * height,
+            "seconds": seconds,
+        }
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with history_path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(entry) + "\n")
+
+    return render_deck(slides_toml=slides_toml, on_rendered=record, **render_options)
+
+
+def run(output: Path | None = DEFAULT_TIMELINE, scenes: list[str] | None = None) -> int:
+    """Print the table, write the JSON timeline; return 1 if any scene failed."""
+    try:
+        timeline = deck_timeline(scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    print(format_table(timeline))
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(timeline, indent=2) + "\n", encoding="utf-8")
+        print(f"Timeline -> {output}")
+    return 1 if any("error" in scene for scene in timeline["scenes"]) else 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the timeline."""
+    parser = argparse.ArgumentParser(description="Estimate talk duration and render cost without rendering.")
+    parser.add_argument("--output", "-o", default=str(DEFAULT_TIMELINE), help="Destination JSON file.")
+    parser.add_argument("--scene", "-s", action="append", help="Scene class to include (repeatable).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = parse_args()
+    return run(Path(args.output), args.scene)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
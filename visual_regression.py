@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Visual regression of slide snapshots against stored golden images.
+
+Snapshots (the frame ending every ``next_slide()``, see ``snapshot.py``) are
+captured with one worker process per scene and compared with the PNGs in
+``tests/golden/<Scene>/<idx>.png`` by SSIM on luminance. SSIM is computed
+over the whole frame at once: local means, variances and covariances come
+from box sums of an integral image, so no Python loop runs per pixel. Every
+slide whose mean SSIM falls below ``SSIM_THRESHOLD`` gets a
+``golden | current | difference`` image in ``visual_diffs/<Scene>/``.
+
+``tests/test_visual_golden.py`` runs the comparison under pytest; this
+script (re)writes the golden images after an intended visual change.
+
+Example:
+    uv run python visual_regression.py --update --scene GPSSlide
+    uv run pytest tests/test_visual_golden.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from snapshot import capture_slides, deck_targets, load_scene_class, write_png
+
+
+ROOT = Path(__file__).resolve().parent
+GOLDEN_DIR = ROOT / "tests" / "golden"
+DIFF_DIR = ROOT / "visual_diffs"
+# Goldens are small: enough to see a moved equation, cheap to store and compare.
+GOLDEN_RESOLUTION = (480, 270)
+SSIM_THRESHOLD = 0.98
+SSIM_WINDOW = 7
+# Stabilizing constants of SSIM for 8-bit images.
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+
+def luminance(image: np.ndarray) -> np.ndarray:
+    """Return the Rec. 601 luma of an RGB(A) image as floats in ``[0, 255]``."""
+    rgb = np.asarray(image, dtype=float)[..., :3]
+    return rgb @ np.array([0.299, 0.587, 0.114])
+
+
+def _box_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of every ``window × window`` block (valid positions only) via an integral image."""
+    integral = np.pad(values, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+    sums = (
+        integral[window:, window:]
+        - integral[:-window, window:]
+        - integral[window:, :-window]
+        + integral[:-window, :-window]
+    )
+    return sums / window**2
+
+
+def ssim(a: np.ndarray, b: np.ndarray, window: int = SSIM_WINDOW) -> tuple[float, np.ndarray]:
+    """Return the mean SSIM of two same-size images and the per-pixel SSIM map.
+
+    The map is computed on the valid ``window`` positions and edge-padded back
+    to the image size.
+    """
+    if a.shape != b.shape:
+        raise ValueError(f"Image shapes differ: {a.shape} vs {b.shape}")
+    x, y = luminance(a), luminance(b)
+    mu_x, mu_y = _box_mean(x, window), _box_mean(y, window)
+    var_x = _box_mean(x * x, window) - mu_x**2
+    var_y = _box_mean(y * y, window) - mu_y**2
+    cov = _box_mean(x * y, window) - mu_x * mu_y
+    similarity = ((2 * mu_x * mu_y + SSIM_C1) * (2 * cov + SSIM_C2)) / (
+        (mu_x**2 + mu_y**2 + SSIM_C1) * (var_x + var_y + SSIM_C2)
+    )
+    before, after = (window - 1) // 2, window // 2
+    return float(similarity.mean()), np.pad(similarity, ((before, after), (before, after)), mode="edge")
+
+
+def diff_image(golden: np.ndarray, current: np.ndarray, similarity: np.ndarray) -> np.ndarray:
+    """Return ``golden | current | difference`` side by side as RGB ``uint8``.
+
+    The difference panel is the dimmed golden luma with dissimilar regions in red.
+    """
+    dim = 0.4 * luminance(golden)
+    error = np.clip(1.0 - similarity, 0.0, 1.0) * 255.0
+    difference = np.stack([np.maximum(dim, error), dim, dim], axis=-1)
+    panels = [np.asarray(golden)[..., :3].astype(float), np.asarray(current)[..., :3].astype(float), difference]
+    return np.concatenate(panels, axis=1).round().astype(np.uint8)
+
+
+def read_png(path: Path) -> np.ndarray:
+    """Read a PNG as an RGBA ``uint8`` array."""
+    from PIL import Image
+
+    with Image.open(path) as image:
+        return np.array(image.convert("RGBA"))
+
+
+def golden_frames(scene: str, golden_dir: Path = GOLDEN_DIR) -> list[np.ndarray] | None:
+    """Return the golden frames of ``scene`` in slide order, or ``None`` if it has none."""
+    paths = sorted((golden_dir / scene).glob("[0-9][0-9][0-9].png"))
+    return [read_png(path) for path in paths] if paths else None
+
+
+def _capture(target: tuple[str, str, tuple[int, int]]) -> list[np.ndarray]:
+    module_path, class_name, resolution = target
+    return capture_slides(load_scene_class(Path(module_path), class_name), resolution)
+
+
+def capture_scenes(
+    scenes: list[str] | None = None,
+    resolution: tuple[int, int] = GOLDEN_RESOLUTION,
+    workers: int | None = None,
+) -> dict[str, list[np.ndarray] | Exception]:
+    """Snapshot the deck scenes (or only ``scenes``) with one process per scene.
+
+    A scene that fails to run maps to its exception instead of its frames.
+    """
+    targets = [(str(ROOT / path), name, resolution) for path, name in deck_targets(scenes, ROOT / "slides.toml")]
+    n_workers = max(1, min(len(targets), workers or os.cpu_count() or 1))
+    results: dict[str, list[np.ndarray] | Exception] = {}
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = {target[1]: pool.submit(_capture, target) for target in targets}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as error:  # reported per scene by the caller
+                results[name] = error
+    return results
+
+
+def compare_scene(
+    scene: str,
+    frames: list[np.ndarray],
+    golden: list[np.ndarray],
+    diff_dir: Path = DIFF_DIR,
+    threshold: float = SSIM_THRESHOLD,
+) -> list[str]:
+    """Compare ``frames`` with ``golden``; write diff images and return the failure messages."""
+    failures = []
+    if len(frames) != len(golden):
+        failures.append(f"{scene}: {len(frames)} slides, golden has {len(golden)}")
+    for index, (current, expected) in enumerate(zip(frames, golden)):
+        if current.shape != expected.shape:
+            failures.append(f"{scene}/{index:03d}: size {current.shape[:2]} != golden {expected.shape[:2]}")
+            continue
+        score, similarity = ssim(expected, current)
+        if score < threshold:
+            path = diff_dir / scene / f"{index:03d}.png"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_png(diff_image(expected, current, similarity), path)
+            failures.append(f"{scene}/{index:03d}: SSIM {score:.4f} < {threshold} (diff: {path})")
+    return failures
+
+
+def update_goldens(scenes: list[str] | None = None, golden_dir: Path = GOLDEN_DIR) -> int:
+    """Re-capture the scenes and overwrite their golden images."""
+    failed = []
+    for name, frames in capture_scenes(scenes).items():
+        if isinstance(frames, Exception):
+            print(f"{name}: failed ({type(frames).__name__}: {frames})", file=sys.stderr)
+            failed.append(name)
+            continue
+        directory = golden_dir / name
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in directory.glob("*.png"):
+            stale.unlink()
+        for index, frame in enumerate(frames):
+            write_png(frame, directory / f"{index:03d}.png")
+        print(f"{name}: {len(frames)} golden images -> {directory}")
+    return 1 if failed else 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for golden-image maintenance."""
+    parser = argparse.ArgumentParser(description="Maintain the golden slide snapshots.")
+    parser.add_argument("--update", action="store_true", help="Re-capture and overwrite golden images.")
+    parser.add_argument("--scene", "-s", action="append", help="Scene class to update (repeatable).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = parse_args()
+    if not args.update:
+        print("Nothing to do; pass --update to rewrite golden images, or run pytest to compare.")
+        return 0
+    return update_goldens(args.scene)
+
+
+if __name__ == "__main__":
+    sys.exit(main())